@@ -9,12 +9,27 @@ __version__ = "1.0.0"
 __author__ = "Network Analysis Team"
 __email__ = "team@networkanalyzer.com"
 
-from .core.topology_builder import TopologyBuilder
-from .core.config_parser import ConfigParser
-from .core.network_analyzer import NetworkAnalyzer
+import importlib
+
+# Public classes are imported on first access so that importing a submodule
+# does not pull in every heavy dependency of the package
+_LAZY_IMPORTS = {
+    "TopologyBuilder": ".core.topology_builder",
+    "ConfigParser": ".core.config_parser",
+    "NetworkAnalyzer": ".core.network_analyzer",
+}
 
 __all__ = [
     "TopologyBuilder",
     "ConfigParser", 
     "NetworkAnalyzer",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
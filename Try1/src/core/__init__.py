@@ -2,12 +2,27 @@
 Core network analysis modules.
 """
 
-from .topology_builder import TopologyBuilder
-from .config_parser import ConfigParser
-from .network_analyzer import NetworkAnalyzer
+import importlib
+
+# Public classes are imported on first access so that importing one module
+# (e.g. the config parser) does not load the others' dependencies
+_LAZY_IMPORTS = {
+    "TopologyBuilder": ".topology_builder",
+    "ConfigParser": ".config_parser",
+    "NetworkAnalyzer": ".network_analyzer",
+}
 
 __all__ = [
     "TopologyBuilder",
     "ConfigParser",
     "NetworkAnalyzer",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+Link scoring kernels for network analysis.
+
+Numba is used to compile the per-link loop when it is installed; otherwise
+the same computation runs as vectorized NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Device type codes
+TYPE_UNKNOWN = -1
+TYPE_ROUTER = 0
+TYPE_SWITCH = 1
+TYPE_OTHER = 2
+
+GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def splitmix64(z: np.ndarray) -> np.ndarray:
+    """Apply the SplitMix64 finalizer to an array of uint64 keys."""
+    z = z ^ (z >> np.uint64(30))
+    z = z * MIX1
+    z = z ^ (z >> np.uint64(27))
+    z = z * MIX2
+    return z ^ (z >> np.uint64(31))
+
+
+def _score_links_numpy(src_type_id: np.ndarray, tgt_type_id: np.ndarray,
+                       src_id: np.ndarray, tgt_id: np.ndarray) -> np.ndarray:
+    """Score links with vectorized NumPy operations."""
+    # Base utilization on device types: inter-router links typically higher,
+    # switch links typically lower, 30% otherwise
+    known = (src_type_id != TYPE_UNKNOWN) & (tgt_type_id != TYPE_UNKNOWN)
+    router_pair = known & (src_type_id == TYPE_ROUTER) & (tgt_type_id == TYPE_ROUTER)
+    switch_any = known & ((src_type_id == TYPE_SWITCH) | (tgt_type_id == TYPE_SWITCH))
+    base = np.where(router_pair, 0.4, np.where(switch_any, 0.2, 0.3))
+
+    # Deterministic per-link variation in [-0.1, 0.3) from a hash of the endpoints
+    with np.errstate(over='ignore'):
+        key = splitmix64(src_id * GOLDEN_GAMMA ^ tgt_id)
+    unit = (key >> np.uint64(11)).astype(np.float64) * (1.0 / 2**53)
+    variation = -0.1 + 0.4 * unit
+
+    return np.clip(base + variation, 0.0, 1.0)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _score_links_jit(src_type_id, tgt_type_id, src_id, tgt_id, out_util):
+        """Compiled per-link equivalent of _score_links_numpy."""
+        for i in prange(src_id.shape[0]):
+            s = src_type_id[i]
+            t = tgt_type_id[i]
+            known = s != TYPE_UNKNOWN and t != TYPE_UNKNOWN
+            if known and s == TYPE_ROUTER and t == TYPE_ROUTER:
+                base = 0.4
+            elif known and (s == TYPE_SWITCH or t == TYPE_SWITCH):
+                base = 0.2
+            else:
+                base = 0.3
+
+            z = src_id[i] * GOLDEN_GAMMA ^ tgt_id[i]
+            z = z ^ (z >> np.uint64(30))
+            z = z * MIX1
+            z = z ^ (z >> np.uint64(27))
+            z = z * MIX2
+            z = z ^ (z >> np.uint64(31))
+            unit = np.float64(z >> np.uint64(11)) * (1.0 / 2**53)
+
+            value = base + (-0.1 + 0.4 * unit)
+            out_util[i] = min(1.0, max(0.0, value))
+
+
+def score_links(src_type_id: np.ndarray, tgt_type_id: np.ndarray,
+                src_id: np.ndarray, tgt_id: np.ndarray) -> np.ndarray:
+    """
+    Estimate utilization for each link.
+
+    Args:
+        src_type_id: int8 device type codes of link sources
+        tgt_type_id: int8 device type codes of link targets
+        src_id: uint64 ids of link sources
+        tgt_id: uint64 ids of link targets
+
+    Returns:
+        float64 utilization per link, clipped to [0, 1]
+    """
+    if not NUMBA_AVAILABLE:
+        return _score_links_numpy(src_type_id, tgt_type_id, src_id, tgt_id)
+
+    out_util = np.empty(src_id.shape[0], dtype=np.float64)
+    _score_links_jit(src_type_id, tgt_type_id, src_id, tgt_id, out_util)
+    return out_util
+
+
+def warm_up():
+    """Compile the kernel ahead of the first real analysis."""
+    if NUMBA_AVAILABLE:
+        score_links(np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.int8),
+                    np.zeros(1, dtype=np.uint64), np.zeros(1, dtype=np.uint64))
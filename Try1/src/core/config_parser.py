@@ -2,17 +2,59 @@
 Cisco configuration file parser.
 """
 
+import io
 import os
+import sys
+import mmap
 import yaml
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Sequence, Tuple
 from dataclasses import dataclass, field
 from loguru import logger
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 from ..utils.helpers import parse_bandwidth, validate_ip_address, normalize_interface_name
 
+# Parallel parsing only pays off for large configurations in bulk. Each pooled job costs
+# the parent process about 0.1 ms (submit, unpickle, re-intern), which is the parse time of
+# roughly 1.5 KB of config, and starting the pool costs tens of milliseconds.
+PARALLEL_PARSE_MIN_BYTES = 2 * 1024 * 1024  # total config.dump bytes in the directory
+PARALLEL_PARSE_MIN_AVG_BYTES = 4 * 1024  # average config.dump size per device
+
+
+class InterfaceKind(IntEnum):
+    """Interface media type, classified once from the interface name."""
+    OTHER = 0
+    GIGABIT = 1
+    FAST = 2
+    ETHERNET = 3
+
+
+# (kind, name prefix, full-name substring), checked in order
+_INTERFACE_KIND_PATTERNS = (
+    (InterfaceKind.GIGABIT, 'gi', 'gigabit'),
+    (InterfaceKind.FAST, 'fa', 'fastethernet'),
+    (InterfaceKind.ETHERNET, 'et', 'ethernet'),
+)
+
+
+@lru_cache(maxsize=4096)
+def _classify_interface(name_lower: str) -> InterfaceKind:
+    """Classify a lowercased interface name by media type."""
+    for kind, prefix, full_name in _INTERFACE_KIND_PATTERNS:
+        if name_lower.startswith(prefix) or full_name in name_lower:
+            return kind
+    return InterfaceKind.OTHER
+
 
-@dataclass
+@dataclass(slots=True)
 class Interface:
     """Network interface configuration."""
     name: str
@@ -23,43 +65,170 @@ class Interface:
     description: Optional[str] = None
     vlan: Optional[int] = None
     enabled: bool = True
+    # Lowercased copies for case-insensitive matching, kept in sync by set_description
+    name_lower: str = field(default="", init=False, repr=False, compare=False)
+    description_lower: str = field(default="", init=False, repr=False, compare=False)
+    kind: InterfaceKind = field(default=InterfaceKind.OTHER, init=False, repr=False, compare=False)
+    # Parsed bandwidth in bps (0 when unset), kept in sync by set_bandwidth
+    bandwidth_bps: int = field(default=0, init=False, repr=False, compare=False)
     
+    def __post_init__(self):
+        self.name_lower = self.name.lower()
+        self.kind = _classify_interface(self.name_lower)
+        self.description_lower = self.description.lower() if self.description else ""
+        self.bandwidth_bps = parse_bandwidth(self.bandwidth)
     
-@dataclass 
+    def set_bandwidth(self, bandwidth: Optional[str]):
+        """Set the bandwidth along with its parsed bps value."""
+        self.bandwidth = bandwidth
+        self.bandwidth_bps = parse_bandwidth(bandwidth)
+    
+    def set_description(self, description: Optional[str]):
+        """Set the description along with its cached lowercase form."""
+        self.description = description
+        self.description_lower = description.lower() if description else ""
+    
+    
+@dataclass(slots=True)
 class RoutingProtocol:
     """Routing protocol configuration."""
     protocol: str  # ospf, bgp, eigrp, static
     process_id: Optional[str] = None
-    networks: List[str] = field(default_factory=list)
-    neighbors: List[str] = field(default_factory=list)
+    # Lists while parsing, frozen to tuples by NetworkDevice.freeze
+    networks: Sequence[str] = field(default_factory=list)
+    neighbors: Sequence[str] = field(default_factory=list)
     area: Optional[str] = None
     
 
-@dataclass
+@dataclass(slots=True)
 class NetworkDevice:
     """Network device configuration."""
     name: str
     device_type: str  # router, switch, firewall
     hostname: Optional[str] = None
-    interfaces: List[Interface] = field(default_factory=list)
-    routing_protocols: List[RoutingProtocol] = field(default_factory=list)
+    # Lists while parsing, frozen to tuples by freeze
+    interfaces: Sequence[Interface] = field(default_factory=list)
+    routing_protocols: Sequence[RoutingProtocol] = field(default_factory=list)
     vlans: Dict[int, str] = field(default_factory=dict)
     config_file: Optional[str] = None
+    name_lower: str = field(default="", init=False, repr=False, compare=False)
+    _last_vlan_id: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    # Interface name -> interface, built on first get_interface and dropped by freeze
+    _interfaces_by_name: Optional[Dict[str, Interface]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.name_lower = self.name.lower()
+    
+    def freeze(self):
+        """Convert the parsed lists to tuples once the configuration is fully read."""
+        self.interfaces = tuple(self.interfaces)
+        self._interfaces_by_name = None
+        for routing_protocol in self.routing_protocols:
+            routing_protocol.networks = tuple(routing_protocol.networks)
+            routing_protocol.neighbors = tuple(routing_protocol.neighbors)
+        self.routing_protocols = tuple(self.routing_protocols)
+    
+    def get_interface(self, name: str) -> Optional[Interface]:
+        """
+        Look up an interface by name.
+        
+        Args:
+            name: Interface name
+            
+        Returns:
+            The first interface with that name, or None
+        """
+        if self._interfaces_by_name is None:
+            index = {}
+            for interface in self.interfaces:
+                index.setdefault(interface.name, interface)
+            self._interfaces_by_name = index
+        return self._interfaces_by_name.get(name)
     
 
+@lru_cache(maxsize=16)
+def _load_yaml(path: str) -> Dict[str, Any]:
+    """Load a YAML settings file, cached by path since settings are read-only at runtime."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+@lru_cache(maxsize=4096)
+def _default_vlan_name(vlan_id: int) -> str:
+    """Get the shared default name string for a VLAN ID."""
+    return f"VLAN{vlan_id}"
+
+
+def _prefetch_files(paths: Iterable[str]):
+    """Start asynchronous kernel read-ahead for files (no-op without posix_fadvise)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+
+@lru_cache(maxsize=512)
+def _detect_device_type(device_name: str) -> str:
+    """Detect device type from name."""
+    name_lower = device_name.lower()
+    if name_lower.startswith(('pc', 'host')):
+        return 'pc'
+    elif name_lower.startswith(('sw', 's')):
+        return 'switch'
+    elif name_lower.startswith('r'):
+        return 'router'
+    elif name_lower.startswith(('fw', 'asa')):
+        return 'firewall'
+    else:
+        return 'router'  # Default to router
+
+
+# Default interface bandwidth by interface kind
+_SWITCH_BANDWIDTH_DEFAULTS = {
+    InterfaceKind.GIGABIT: "1000000Kbps",  # 1 Gbps
+}
+_ROUTER_BANDWIDTH_DEFAULTS = {
+    InterfaceKind.GIGABIT: "1000000Kbps",  # 1 Gbps
+    InterfaceKind.FAST: "100000Kbps",  # 100 Mbps
+}
+
+
+def _intern_names(device: NetworkDevice) -> NetworkDevice:
+    """Intern the name strings a device is keyed by throughout topology building."""
+    device.name = sys.intern(device.name)
+    device.name_lower = sys.intern(device.name_lower)
+    device.device_type = sys.intern(device.device_type)
+    for interface in device.interfaces:
+        interface.name = sys.intern(interface.name)
+        interface.name_lower = sys.intern(interface.name_lower)
+    return device
+
+
 class ConfigParser:
     """Parser for Cisco configuration files."""
     
-    def __init__(self, config_file: str = "config/settings.yaml"):
-        """Initialize parser with configuration."""
+    def __init__(self, config_file: str = "config/settings.yaml", config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize parser with configuration.
+        
+        Args:
+            config_file: Path to the YAML settings file
+            config: Already-loaded settings; when given, config_file is not read
+        """
         self.config_file = config_file
-        self.config = self._load_config()
+        self.config = config if config is not None else self._load_config()
         
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
-            with open(self.config_file, 'r') as f:
-                return yaml.safe_load(f)
+            return _load_yaml(os.path.abspath(self.config_file))
         except FileNotFoundError:
             logger.warning(f"Config file {self.config_file} not found, using defaults")
             return self._get_default_config()
@@ -80,35 +249,91 @@ class ConfigParser:
             }
         }
     
-    def parse_directory(self, config_dir: str) -> List[NetworkDevice]:
+    def parse_directory(self, config_dir: str, prefetch: bool = False) -> Iterator[NetworkDevice]:
         """
         Parse all configuration files in directory.
         
+        The directory is scanned immediately; devices are parsed lazily and
+        yielded as they become available so consumers can start early.
+        
         Args:
             config_dir: Directory containing config files
+            prefetch: Hint the kernel to read all config files ahead in one
+                batch before parsing (helps cold-cache reads of many files)
             
         Returns:
-            List of parsed network devices
+            Iterator over parsed network devices
         """
-        devices = []
         config_path = Path(config_dir)
         
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration directory not found: {config_dir}")
         
         # Look for device directories (R1, R2, SW1, etc.)
-        for device_dir in config_path.iterdir():
-            if device_dir.is_dir():
-                config_file = device_dir / "config.dump"
-                if config_file.exists():
-                    logger.info(f"Parsing {device_dir.name} configuration")
-                    device = self.parse_device_config(str(config_file), device_dir.name)
+        # scandir entries carry the file type, avoiding a stat per directory
+        jobs = []
+        with os.scandir(config_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    config_file = os.path.join(entry.path, "config.dump")
+                    if os.path.isfile(config_file):
+                        logger.info(f"Parsing {entry.name} configuration")
+                        jobs.append((config_file, entry.name))
+                    else:
+                        logger.warning(f"No config.dump found in {entry.path}")
+        
+        if prefetch:
+            _prefetch_files(config_file for config_file, _ in jobs)
+        
+        return self._iter_parsed_devices(jobs)
+    
+    def parse_directory_list(self, config_dir: str, prefetch: bool = False) -> List[NetworkDevice]:
+        """
+        Parse all configuration files in directory into a list.
+        
+        Args:
+            config_dir: Directory containing config files
+            prefetch: See parse_directory
+            
+        Returns:
+            List of parsed network devices
+        """
+        return list(self.parse_directory(config_dir, prefetch))
+    
+    def _iter_parsed_devices(self, jobs: List[Tuple[str, str]]) -> Iterator[NetworkDevice]:
+        """Parse (config_file, device_name) jobs, yielding devices in order."""
+        # Devices share no state, so larger directories are parsed across processes
+        if self._use_parallel_parse(jobs):
+            with ProcessPoolExecutor(initializer=_init_parse_worker,
+                                     initargs=(self.config_file, self.config)) as executor:
+                # Jobs carry only the path and name; each worker has its own parser
+                futures = [executor.submit(_parse_device_in_worker, config_file, device_name)
+                           for config_file, device_name in jobs]
+                for future in futures:
+                    device = future.result()
                     if device:
-                        devices.append(device)
-                else:
-                    logger.warning(f"No config.dump found in {device_dir}")
+                        # Unpickled strings are fresh copies, so intern them again here
+                        yield _intern_names(device)
+        else:
+            for config_file, device_name in jobs:
+                device = self.parse_device_config(config_file, device_name)
+                if device:
+                    yield device
+    
+    def _use_parallel_parse(self, jobs: List[Tuple[str, str]]) -> bool:
+        """Check whether a directory holds enough configuration to pay for a process pool."""
+        if (os.cpu_count() or 1) < 2:
+            return False
         
-        return devices
+        total_bytes = 0
+        for config_file, _ in jobs:
+            try:
+                total_bytes += os.path.getsize(config_file)
+            except OSError:
+                continue
+        
+        return (total_bytes >= PARALLEL_PARSE_MIN_BYTES
+                and total_bytes >= len(jobs) * PARALLEL_PARSE_MIN_AVG_BYTES)
     
     def parse_device_config(self, config_file: str, device_name: str) -> Optional[NetworkDevice]:
         """
@@ -122,17 +347,27 @@ class ConfigParser:
             Parsed NetworkDevice or None if parsing fails
         """
         try:
-            with open(config_file, 'r') as f:
-                config_lines = f.readlines()
-            
             device = NetworkDevice(
                 name=device_name,
                 device_type=self._detect_device_type(device_name),
                 config_file=config_file
             )
             
-            self._parse_config_lines(config_lines, device)
-            return device
+            with open(config_file, 'rb') as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Empty or unmappable files (pipes, special files) are
+                    # streamed line by line from the file object itself
+                    self._parse_config_lines(io.TextIOWrapper(f, encoding='utf-8', errors='replace'), device)
+                else:
+                    with mm:
+                        # Decode lines lazily instead of materializing the whole file
+                        config_lines = (raw.decode('utf-8', 'replace') for raw in iter(mm.readline, b''))
+                        self._parse_config_lines(config_lines, device)
+            
+            device.freeze()
+            return _intern_names(device)
             
         except Exception as e:
             logger.error(f"Error parsing {config_file}: {e}")
@@ -140,188 +375,231 @@ class ConfigParser:
     
     def _detect_device_type(self, device_name: str) -> str:
         """Detect device type from name."""
-        name_lower = device_name.lower()
-        if name_lower.startswith('pc') or name_lower.startswith('host'):
-            return 'pc'
-        elif name_lower.startswith('sw') or name_lower.startswith('s'):
-            return 'switch'
-        elif name_lower.startswith('r'):
-            return 'router'
-        elif name_lower.startswith('fw') or name_lower.startswith('asa'):
-            return 'firewall'
-        else:
-            return 'router'  # Default to router
+        return _detect_device_type(device_name)
     
-    def _parse_config_lines(self, lines: List[str], device: NetworkDevice):
+    def _parse_config_lines(self, lines: Iterable[str], device: NetworkDevice):
         """Parse configuration lines and populate device object."""
-        current_interface = None
-        current_router_process = None
-        in_interface_config = False
-        in_router_config = False
+        # Active configuration block: (Interface, RoutingProtocol or VLAN owner,
+        # dispatch table for its indented commands)
+        block = None
+        block_commands = None
         
-        for line_num, line in enumerate(lines):
-            original_line = line
+        # Bind hot-loop lookups to locals once per file
+        get_handler = self._TOP_LEVEL_HANDLERS.get
+        
+        for line in lines:
+            indented = line[:1] in (' ', '\t')
             line = line.strip()
             
             # Skip empty lines and comments
-            if not line or line.startswith('!'):
+            if not line or line[0] == '!':
                 continue
             
-            # Hostname
-            if line.startswith('hostname '):
-                device.hostname = line.split()[1]
-            
-            # Interface configuration
-            elif line.startswith('interface '):
-                in_interface_config = True
-                in_router_config = False  # Exit router config when entering interface
-                interface_name = ' '.join(line.split()[1:])
-                current_interface = Interface(
-                    name=normalize_interface_name(interface_name)
-                )
-                # Set default values based on device type
-                self._set_interface_defaults(current_interface, device.device_type)
-                device.interfaces.append(current_interface)
-            
-            # Router configuration
-            elif line.startswith('router '):
-                in_router_config = True
-                in_interface_config = False  # Exit interface config when entering router
-                parts = line.split()
-                protocol = parts[1]
-                process_id = parts[2] if len(parts) > 2 else None
-                current_router_process = RoutingProtocol(
-                    protocol=protocol,
-                    process_id=process_id
-                )
-                device.routing_protocols.append(current_router_process)
-            
-            # Exit interface configuration - only exit if we hit a non-indented line that's not a comment
-            elif in_interface_config and not original_line.startswith(' ') and not line.startswith('!') and line != '':
-                in_interface_config = False
-                current_interface = None
+            # Classify the line by its first token; only lines with a
+            # handler are fully tokenized
+            command = line.split(None, 1)[0]
             
-            # Exit router configuration - only exit if we hit a non-indented line that's not a comment
-            elif in_router_config and not original_line.startswith(' ') and not line.startswith('!') and line != '':
-                in_router_config = False
-                current_router_process = None
+            # Top-level commands
+            handler = get_handler(command)
+            if handler is not None:
+                block, block_commands = handler(self, line, line.split(), device)
             
-            # Interface-specific commands (must be indented)
-            elif in_interface_config and current_interface and original_line.startswith(' '):
-                self._parse_interface_command(line, current_interface)
-            
-            # Router-specific commands (must be indented)
-            elif in_router_config and current_router_process and original_line.startswith(' '):
-                self._parse_router_command(line, current_router_process)
-            
-            # VLAN configuration
-            elif line.startswith('vlan '):
-                self._parse_vlan_command(line, device)
+            # Block-specific commands (must be indented); any other
+            # non-indented line exits the current block
+            elif block is not None:
+                if indented:
+                    handler = block_commands.get(command)
+                    if handler is not None:
+                        handler(self, line, line.split(), block)
+                else:
+                    block = None
+                    block_commands = None
     
-    def _parse_interface_command(self, line: str, interface: Interface):
-        """Parse interface-specific configuration command."""
-        line = line.strip()
-        
-        if line.startswith('ip address '):
-            parts = line.split()
-            if len(parts) >= 4:  # Need at least "ip address x.x.x.x y.y.y.y"
-                interface.ip_address = parts[2]
-                interface.subnet_mask = parts[3]
-        
-        elif line.startswith('bandwidth '):
-            parts = line.split()
-            if len(parts) >= 2:
-                # Cisco bandwidth is in Kbps
-                interface.bandwidth = f"{parts[1]}Kbps"
-        
-        elif line.startswith('mtu '):
-            parts = line.split()
-            if len(parts) >= 2:
-                try:
-                    interface.mtu = int(parts[1])
-                except ValueError:
-                    pass
-        
-        elif line.startswith('description '):
-            interface.description = ' '.join(line.split()[1:])
-        
-        elif line.startswith('switchport access vlan '):
-            parts = line.split()
-            if len(parts) >= 4:
-                try:
-                    interface.vlan = int(parts[3])
-                except ValueError:
-                    pass
+    def _parse_hostname_command(self, line: str, parts: List[str], device: NetworkDevice):
+        """Parse hostname command."""
+        if len(parts) >= 2:
+            device.hostname = parts[1]
+        return None, None
     
-    def _set_interface_defaults(self, interface: Interface, device_type: str):
-        """Set default values for interface based on device type."""
-        if device_type == 'pc':
-            # PC interfaces typically have these defaults
-            interface.bandwidth = "100000Kbps"  # 100 Mbps default
-            interface.mtu = 1500
-            interface.description = interface.description or "PC Interface"
-        elif device_type == 'switch':
-            # Switch interfaces
-            if interface.name.lower().startswith('gi') or 'gigabit' in interface.name.lower():
-                interface.bandwidth = "1000000Kbps"  # 1 Gbps
-            else:
-                interface.bandwidth = "100000Kbps"  # 100 Mbps
-            interface.mtu = 1500
-            interface.description = interface.description or "Switch Port"
-        elif device_type == 'router':
-            # Router interfaces
-            if interface.name.lower().startswith('gi') or 'gigabit' in interface.name.lower():
-                interface.bandwidth = "1000000Kbps"  # 1 Gbps
-            elif interface.name.lower().startswith('fa') or 'fastethernet' in interface.name.lower():
-                interface.bandwidth = "100000Kbps"  # 100 Mbps
-            else:
-                interface.bandwidth = "10000Kbps"  # 10 Mbps default
-            interface.mtu = 1500
-            interface.description = interface.description or "Router Interface"
-        
-        elif line == 'shutdown':
+    def _enter_interface_config(self, line: str, parts: List[str], device: NetworkDevice):
+        """Start an interface configuration block."""
+        if len(parts) < 2:
+            return None, None
+        interface_name = line.split(None, 1)[1]
+        interface = Interface(
+            name=normalize_interface_name(interface_name)
+        )
+        # Set default values based on device type
+        self._set_interface_defaults(interface, device.device_type)
+        device.interfaces.append(interface)
+        return interface, self._INTERFACE_COMMANDS
+    
+    def _enter_router_config(self, line: str, parts: List[str], device: NetworkDevice):
+        """Start a routing protocol configuration block."""
+        if len(parts) < 2:
+            return None, None
+        routing_protocol = RoutingProtocol(
+            protocol=parts[1],
+            process_id=parts[2] if len(parts) > 2 else None
+        )
+        device.routing_protocols.append(routing_protocol)
+        return routing_protocol, self._ROUTER_COMMANDS
+    
+    def _parse_interface_ip(self, line: str, parts: List[str], interface: Interface):
+        """Parse 'ip address <ip> <mask>'."""
+        if len(parts) >= 4 and parts[1] == 'address':
+            interface.ip_address = parts[2]
+            interface.subnet_mask = parts[3]
+    
+    def _parse_interface_bandwidth(self, line: str, parts: List[str], interface: Interface):
+        """Parse 'bandwidth <kbps>'."""
+        if len(parts) >= 2:
+            # Cisco bandwidth is in Kbps
+            interface.set_bandwidth(f"{parts[1]}Kbps")
+    
+    def _parse_interface_mtu(self, line: str, parts: List[str], interface: Interface):
+        """Parse 'mtu <bytes>'."""
+        if len(parts) >= 2:
+            try:
+                interface.mtu = int(parts[1])
+            except ValueError:
+                pass
+    
+    def _parse_interface_description(self, line: str, parts: List[str], interface: Interface):
+        """Parse 'description <text>'."""
+        if len(parts) >= 2:
+            interface.set_description(line.split(None, 1)[1])
+    
+    def _parse_interface_switchport(self, line: str, parts: List[str], interface: Interface):
+        """Parse 'switchport access vlan <id>'."""
+        if len(parts) >= 4 and parts[1] == 'access' and parts[2] == 'vlan':
+            try:
+                interface.vlan = int(parts[3])
+            except ValueError:
+                pass
+    
+    def _parse_interface_shutdown(self, line: str, parts: List[str], interface: Interface):
+        """Parse 'shutdown'."""
+        if len(parts) == 1:
             interface.enabled = False
-        
-        elif line == 'no shutdown':
+    
+    def _parse_interface_no(self, line: str, parts: List[str], interface: Interface):
+        """Parse negated commands; only 'no shutdown' affects the model."""
+        if len(parts) == 2 and parts[1] == 'shutdown':
             interface.enabled = True
     
-    def _parse_router_command(self, line: str, routing_protocol: RoutingProtocol):
-        """Parse routing protocol configuration command."""
-        line = line.strip()
-        
-        if line.startswith('network '):
-            parts = line.split()
-            if len(parts) >= 2:
-                network = parts[1]
-                if len(parts) >= 3:
-                    # Include wildcard mask if present
-                    network += f" {parts[2]}"
-                routing_protocol.networks.append(network)
-        
-        elif line.startswith('neighbor '):
-            parts = line.split()
-            if len(parts) >= 2:
-                routing_protocol.neighbors.append(parts[1])
-        
-        elif line.startswith('area '):
-            parts = line.split()
-            if len(parts) >= 2:
-                routing_protocol.area = parts[1]
+    def _set_interface_defaults(self, interface: Interface, device_type: str):
+        """Set default values for interface based on device type."""
+        set_defaults = self._INTERFACE_DEFAULTS.get(device_type)
+        if set_defaults is not None:
+            set_defaults(self, interface)
+    
+    def _set_pc_interface_defaults(self, interface: Interface):
+        """PC interfaces typically have these defaults."""
+        interface.set_bandwidth("100000Kbps")  # 100 Mbps default
+        interface.mtu = 1500
+        interface.set_description(interface.description or "PC Interface")
+    
+    def _set_switch_interface_defaults(self, interface: Interface):
+        """Switch interfaces."""
+        interface.set_bandwidth(_SWITCH_BANDWIDTH_DEFAULTS.get(
+            interface.kind, "100000Kbps"  # 100 Mbps
+        ))
+        interface.mtu = 1500
+        interface.set_description(interface.description or "Switch Port")
     
-    def _parse_vlan_command(self, line: str, device: NetworkDevice):
+    def _set_router_interface_defaults(self, interface: Interface):
+        """Router interfaces."""
+        interface.set_bandwidth(_ROUTER_BANDWIDTH_DEFAULTS.get(
+            interface.kind, "10000Kbps"  # 10 Mbps default
+        ))
+        interface.mtu = 1500
+        interface.set_description(interface.description or "Router Interface")
+    
+    def _parse_router_network(self, line: str, parts: List[str], routing_protocol: RoutingProtocol):
+        """Parse 'network <address> [wildcard] ...'."""
+        if len(parts) >= 2:
+            network = parts[1]
+            if len(parts) >= 3:
+                # Include wildcard mask if present
+                network += f" {parts[2]}"
+            routing_protocol.networks.append(network)
+    
+    def _parse_router_neighbor(self, line: str, parts: List[str], routing_protocol: RoutingProtocol):
+        """Parse 'neighbor <address> ...'."""
+        if len(parts) >= 2:
+            routing_protocol.neighbors.append(parts[1])
+    
+    def _parse_router_area(self, line: str, parts: List[str], routing_protocol: RoutingProtocol):
+        """Parse 'area <id> ...'."""
+        if len(parts) >= 2:
+            routing_protocol.area = parts[1]
+    
+    def _parse_vlan_command(self, line: str, parts: List[str], device: NetworkDevice):
         """Parse VLAN configuration command."""
-        parts = line.split()
         if len(parts) >= 2:
             try:
                 vlan_id = int(parts[1])
                 # Set default VLAN name
-                device.vlans[vlan_id] = f"VLAN{vlan_id}"
+                device.vlans[vlan_id] = _default_vlan_name(vlan_id)
+                device._last_vlan_id = vlan_id
+                return device, self._VLAN_COMMANDS
             except ValueError:
                 pass
-        elif line.strip().startswith('name ') and len(device.vlans) > 0:
-            # Parse VLAN name (assumes it follows vlan command)
-            vlan_name = ' '.join(line.split()[1:])
-            # Update the last VLAN added
-            last_vlan_id = max(device.vlans.keys()) if device.vlans else None
-            if last_vlan_id:
-                device.vlans[last_vlan_id] = vlan_name
\ No newline at end of file
+        return None, None
+    
+    def _parse_vlan_name(self, line: str, parts: List[str], device: NetworkDevice):
+        """Parse 'name <text>' for the VLAN whose block we are in."""
+        if len(parts) >= 2 and device._last_vlan_id is not None:
+            device.vlans[device._last_vlan_id] = line.split(None, 1)[1]
+    
+    # Per-device-type interface defaults
+    _INTERFACE_DEFAULTS = {
+        'pc': _set_pc_interface_defaults,
+        'switch': _set_switch_interface_defaults,
+        'router': _set_router_interface_defaults,
+    }
+    
+    # First-token dispatch tables for commands inside interface/router/VLAN blocks
+    _INTERFACE_COMMANDS = {
+        'ip': _parse_interface_ip,
+        'bandwidth': _parse_interface_bandwidth,
+        'mtu': _parse_interface_mtu,
+        'description': _parse_interface_description,
+        'switchport': _parse_interface_switchport,
+        'shutdown': _parse_interface_shutdown,
+        'no': _parse_interface_no,
+    }
+    
+    _ROUTER_COMMANDS = {
+        'network': _parse_router_network,
+        'neighbor': _parse_router_neighbor,
+        'area': _parse_router_area,
+    }
+    
+    _VLAN_COMMANDS = {
+        'name': _parse_vlan_name,
+    }
+    
+    # First-token dispatch table for top-level configuration commands
+    _TOP_LEVEL_HANDLERS = {
+        'hostname': _parse_hostname_command,
+        'interface': _enter_interface_config,
+        'router': _enter_router_config,
+        'vlan': _parse_vlan_command,
+    }
+
+
+# Parser owned by each parse worker process, built once by _init_parse_worker
+_worker_parser: Optional[ConfigParser] = None
+
+
+def _init_parse_worker(config_file: str, config: Dict[str, Any]):
+    """Build the worker process's parser from the parent's already-loaded settings."""
+    global _worker_parser
+    _worker_parser = ConfigParser(config_file, config)
+
+
+def _parse_device_in_worker(config_file: str, device_name: str) -> Optional[NetworkDevice]:
+    """Parse one device configuration in a worker process."""
+    return _worker_parser.parse_device_config(config_file, device_name)
@@ -2,16 +2,108 @@
 Network analysis and optimization recommendations.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+import copy
+import html
+import os
+import re
+import string
+import zlib
+import numpy as np
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import chain
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass, field
 from loguru import logger
 
 from .topology_builder import NetworkTopology, NetworkLink
-from .config_parser import NetworkDevice
+from .config_parser import NetworkDevice, Interface
+from ._analyze_kernels import TYPE_UNKNOWN, TYPE_ROUTER, TYPE_SWITCH, TYPE_OTHER, score_links, warm_up
 from ..utils.helpers import parse_bandwidth
 
+# Below this many links, thread start-up outweighs chunked bandwidth analysis
+PARALLEL_ANALYSIS_MIN_LINKS = 4096
 
-@dataclass
+_DEVICE_TYPE_CODES = {'router': TYPE_ROUTER, 'switch': TYPE_SWITCH}
+
+
+def _name_id(name: str) -> int:
+    """Stable integer id for a device name (independent of PYTHONHASHSEED)."""
+    return zlib.crc32(name.encode('utf-8'))
+
+
+_REPORT_TEMPLATE = string.Template("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Network Analysis Report</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                .header { background-color: #f0f0f0; padding: 20px; border-radius: 5px; }
+                .section { margin: 20px 0; }
+                .issue { background-color: #ffe6e6; padding: 10px; margin: 5px 0; border-radius: 3px; }
+                .recommendation { background-color: #e6f3ff; padding: 10px; margin: 5px 0; border-radius: 3px; }
+                .stats { background-color: #f0f8f0; padding: 15px; border-radius: 5px; }
+                table { border-collapse: collapse; width: 100%; }
+                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+                th { background-color: #f2f2f2; }
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>Network Analysis Report</h1>
+                <p>Generated on: $timestamp</p>
+            </div>
+            
+            <div class="section">
+                <h2>Network Statistics</h2>
+                <div class="stats">
+                    <p><strong>Total Devices:</strong> $total_devices</p>
+                    <p><strong>Total Links:</strong> $total_links</p>
+                    <p><strong>Total Subnets:</strong> $total_subnets</p>
+                    <p><strong>Average Utilization:</strong> $average_utilization</p>
+                </div>
+            </div>
+            
+            <div class="section">
+                <h2>Configuration Issues</h2>
+                $issues
+            </div>
+            
+            <div class="section">
+                <h2>Optimization Recommendations</h2>
+                $recommendations
+            </div>
+            
+            <div class="section">
+                <h2>Bandwidth Analysis</h2>
+                $bandwidth_analysis
+            </div>
+        </body>
+        </html>
+        """)
+
+# Static report text around the streamed issue, recommendation and bandwidth sections
+_REPORT_HEAD, _REPORT_AFTER_ISSUES, _REPORT_AFTER_RECOMMENDATIONS, _REPORT_TAIL = re.split(
+    r'\$(?:issues|recommendations|bandwidth_analysis)\b', _REPORT_TEMPLATE.template
+)
+_REPORT_HEAD = string.Template(_REPORT_HEAD)
+
+# Per-entry report markup, filled with format_map
+_ISSUE_TEMPLATE = """
+            <div class="issue {severity_class}">
+                <strong>{title}:</strong>
+                {description}
+                <br><em>Recommendation: {recommendation}</em>
+            </div>
+            """
+_RECOMMENDATION_TEMPLATE = '<div class="recommendation">{recommendation}</div>'
+_OVERUTILIZED_LINK_TEMPLATE = "<li>{source} ↔ {target}: {utilization:.1%} utilization</li>"
+_BOTTLENECK_TEMPLATE = "<li>{type} at {location}</li>"
+
+
+@dataclass(slots=True)
 class AnalysisResult:
     """Network analysis results."""
     bandwidth_analysis: Dict[str, Any] = field(default_factory=dict)
@@ -28,6 +120,26 @@ class NetworkAnalyzer:
         """Initialize analyzer with configuration."""
         self.config = config
         self.bandwidth_threshold = config.get('analysis', {}).get('bandwidth_threshold', 0.8)
+        self.cache_size = config.get('analysis', {}).get('cache_size', 32)
+        self.top_k_links = config.get('analysis', {}).get('top_k_links', 10)
+        
+        # Recent results keyed by topology fingerprint, oldest first
+        self._analysis_cache: OrderedDict = OrderedDict()
+        
+        # Lookup indexes rebuilt per analysis run
+        self._device_index: Dict[str, NetworkDevice] = {}
+        self._iface_index: Dict[Tuple[str, str], Interface] = {}
+        self._degree: Counter = Counter()
+        self._device_types: Counter = Counter()
+        # device name -> (has_default_route, has_ospf), filled by the configuration pass
+        self._device_flags: Dict[str, Tuple[bool, bool]] = {}
+        # Indices into topology.links above the bandwidth threshold
+        self._over_idx: np.ndarray = np.empty(0, dtype=np.intp)
+        # The worst of those, highest utilization first, capped at top_k_links
+        self._top_over_idx: np.ndarray = np.empty(0, dtype=np.intp)
+        
+        # Compile the link scoring kernel (if numba is installed) before any analysis runs
+        warm_up()
     
     def analyze_network(self, topology: NetworkTopology, devices: List[NetworkDevice]) -> AnalysisResult:
         """
@@ -40,10 +152,33 @@ class NetworkAnalyzer:
         Returns:
             Analysis results
         """
+        topo_key = self._topology_fingerprint(topology, devices)
+        cached = self._analysis_cache.get(topo_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(topo_key)
+            result, utilizations = cached
+            for link, utilization in zip(topology.links, utilizations):
+                link.utilization = utilization
+            logger.info("Reusing cached network analysis")
+            # Callers own their result; a shared one would leak their edits into later hits
+            return copy.deepcopy(result)
+        
         logger.info("Starting network analysis")
         
         result = AnalysisResult()
         
+        # Index devices and interfaces by name so per-link lookups are O(1)
+        self._device_index = {d.name: d for d in devices}
+        self._iface_index = {(d.name, i.name): i for d in devices for i in d.interfaces}
+        
+        # Device type distribution, shared by recommendations and statistics
+        self._device_types = Counter(d.device_type for d in devices)
+        
+        # Connections per device, shared by bottleneck and statistics calculations
+        self._degree = Counter(chain.from_iterable(
+            (link.source_device, link.target_device) for link in topology.links
+        ))
+        
         # Analyze bandwidth utilization
         result.bandwidth_analysis = self._analyze_bandwidth(topology)
         
@@ -59,104 +194,170 @@ class NetworkAnalyzer:
         # Generate load balancing suggestions
         result.load_balancing_suggestions = self._generate_load_balancing_suggestions(topology)
         
+        if self.cache_size > 0:
+            self._analysis_cache[topo_key] = (copy.deepcopy(result), [link.utilization for link in topology.links])
+            while len(self._analysis_cache) > self.cache_size:
+                self._analysis_cache.popitem(last=False)
+        
         logger.info("Network analysis completed")
         return result
     
-    def _analyze_bandwidth(self, topology: NetworkTopology) -> Dict[str, Any]:
-        """Analyze bandwidth utilization across the network."""
+    def _topology_fingerprint(self, topology: NetworkTopology, devices: List[NetworkDevice]) -> Tuple:
+        """Build a hashable key covering everything the analysis reads."""
+        device_key = tuple(
+            (
+                d.name,
+                d.device_type,
+                tuple((i.name, i.ip_address, i.mtu) for i in d.interfaces),
+                tuple((rp.protocol, tuple(rp.networks)) for rp in d.routing_protocols),
+                len(d.vlans)
+            )
+            for d in devices
+        )
+        link_key = tuple(
+            (l.source_device, l.target_device, l.source_interface, l.target_interface, l.bandwidth)
+            for l in topology.links
+        )
+        return (self.bandwidth_threshold, device_key, link_key, len(topology.devices), len(topology.subnets))
+    
+    def _analyze_bandwidth(self, topology: NetworkTopology, top_k: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Analyze bandwidth utilization across the network.
+        
+        Args:
+            topology: Network topology
+            top_k: Number of worst overutilized links to report (defaults to
+                the configured top_k_links; 0 reports all of them)
+            
+        Returns:
+            Bandwidth analysis
+        """
+        if top_k is None:
+            top_k = self.top_k_links
+        
         analysis = {
             'total_links': len(topology.links),
             'overutilized_links': [],
+            'overutilized_count': 0,
             'underutilized_links': [],
             'average_utilization': 0.0,
             'bottlenecks': []
         }
         
-        total_utilization = 0.0
-        
-        for link in topology.links:
-            # Simulate utilization (in real implementation, this would come from monitoring data)
-            utilization = self._estimate_link_utilization(link, topology)
-            link.utilization = utilization
-            total_utilization += utilization
-            
-            if utilization > self.bandwidth_threshold:
-                analysis['overutilized_links'].append({
-                    'source': link.source_device,
-                    'target': link.target_device,
-                    'utilization': utilization,
-                    'bandwidth': link.bandwidth,
-                    'severity': 'high' if utilization > 0.9 else 'medium'
-                })
-            elif utilization < 0.1:
-                analysis['underutilized_links'].append({
-                    'source': link.source_device,
-                    'target': link.target_device,
-                    'utilization': utilization,
-                    'bandwidth': link.bandwidth
-                })
+        links = topology.links
         
-        if topology.links:
-            analysis['average_utilization'] = total_utilization / len(topology.links)
+        # Links are scored independently, so large topologies are analyzed in chunks
+        if len(links) >= PARALLEL_ANALYSIS_MIN_LINKS:
+            chunk_size = max(1, len(links) // (4 * (os.cpu_count() or 1)))
+            chunks = [links[i:i + chunk_size] for i in range(0, len(links), chunk_size)]
+            with ThreadPoolExecutor() as executor:
+                util = np.concatenate(list(executor.map(self._analyze_bandwidth_chunk, chunks)))
+        else:
+            util = self._analyze_bandwidth_chunk(links)
+        
+        over = np.nonzero(util > self.bandwidth_threshold)[0]
+        under = np.nonzero((util <= self.bandwidth_threshold) & (util < 0.1))[0]
+        self._over_idx = over
+        self._top_over_idx = self._select_top_links(util, over, top_k)
+        
+        severity = np.where(util[self._top_over_idx] > 0.9, 'high', 'medium').tolist()
+        analysis['overutilized_links'] = [
+            {
+                'source': links[i].source_device,
+                'target': links[i].target_device,
+                'utilization': links[i].utilization,
+                'bandwidth': links[i].bandwidth,
+                'severity': link_severity
+            }
+            for i, link_severity in zip(self._top_over_idx.tolist(), severity)
+        ]
+        analysis['overutilized_count'] = int(over.size)
+        analysis['underutilized_links'] = [
+            {
+                'source': links[i].source_device,
+                'target': links[i].target_device,
+                'utilization': links[i].utilization,
+                'bandwidth': links[i].bandwidth
+            }
+            for i in under.tolist()
+        ]
+        
+        if links:
+            analysis['average_utilization'] = float(util.mean())
         
         # Identify bottlenecks
         analysis['bottlenecks'] = self._identify_bottlenecks(topology)
         
         return analysis
     
-    def _estimate_link_utilization(self, link: NetworkLink, topology: NetworkTopology) -> float:
-        """Estimate link utilization based on network characteristics."""
-        # This is a simplified estimation - in reality, you'd use SNMP or other monitoring
-        
-        # Base utilization on device types
-        source_device = next((d for d in topology.devices if d.name == link.source_device), None)
-        target_device = next((d for d in topology.devices if d.name == link.target_device), None)
-        
-        base_utilization = 0.3  # Default 30%
-        
-        # Adjust based on device types
-        if source_device and target_device:
-            if source_device.device_type == 'router' and target_device.device_type == 'router':
-                base_utilization = 0.4  # Inter-router links typically higher
-            elif 'switch' in [source_device.device_type, target_device.device_type]:
-                base_utilization = 0.2  # Switch links typically lower
-        
-        # Add some randomness for simulation
-        import random
-        random.seed(hash(f"{link.source_device}-{link.target_device}"))
-        variation = random.uniform(-0.1, 0.3)
+    @staticmethod
+    def _select_top_links(util: np.ndarray, candidates: np.ndarray, top_k: int) -> np.ndarray:
+        """Return up to top_k candidate link indices, highest utilization first."""
+        if top_k and candidates.size > top_k:
+            # Partial selection is O(n); only the k survivors are sorted
+            candidates = candidates[np.argpartition(util[candidates], -top_k)[-top_k:]]
+        return candidates[np.argsort(-util[candidates], kind='stable')]
+    
+    def _analyze_bandwidth_chunk(self, links: List[NetworkLink]) -> np.ndarray:
+        """Score a slice of links, storing and returning their utilization."""
+        # Simulate utilization (in real implementation, this would come from monitoring data)
+        count = len(links)
+        device_index = self._device_index
+        src_ids = np.fromiter((_name_id(l.source_device) for l in links), dtype=np.uint64, count=count)
+        tgt_ids = np.fromiter((_name_id(l.target_device) for l in links), dtype=np.uint64, count=count)
+        src_types = np.fromiter(
+            (self._device_type_code(device_index.get(l.source_device)) for l in links),
+            dtype=np.int8, count=count
+        )
+        tgt_types = np.fromiter(
+            (self._device_type_code(device_index.get(l.target_device)) for l in links),
+            dtype=np.int8, count=count
+        )
+        util = self._estimate_link_utilization_vec(src_ids, tgt_ids, src_types, tgt_types)
+        for link, utilization in zip(links, util.tolist()):
+            link.utilization = utilization
         
-        return max(0.0, min(1.0, base_utilization + variation))
+        return util
+    
+    @staticmethod
+    def _device_type_code(device: Optional[NetworkDevice]) -> int:
+        """Encode a device's type for the vectorized utilization estimate."""
+        if device is None:
+            return TYPE_UNKNOWN
+        return _DEVICE_TYPE_CODES.get(device.device_type, TYPE_OTHER)
+    
+    def _estimate_link_utilization_vec(self, src_ids: np.ndarray, tgt_ids: np.ndarray,
+                                       src_types: np.ndarray, tgt_types: np.ndarray) -> np.ndarray:
+        """Estimate link utilization for all links based on network characteristics."""
+        # This is a simplified estimation - in reality, you'd use SNMP or other monitoring
+        return score_links(src_types, tgt_types, src_ids, tgt_ids)
     
     def _identify_bottlenecks(self, topology: NetworkTopology) -> List[Dict[str, Any]]:
         """Identify potential network bottlenecks."""
         bottlenecks = []
         
-        # Find links with high utilization
-        for link in topology.links:
-            if link.utilization > 0.8:
-                bottlenecks.append({
-                    'type': 'bandwidth_bottleneck',
-                    'location': f"{link.source_device} <-> {link.target_device}",
-                    'utilization': link.utilization,
-                    'bandwidth': link.bandwidth,
-                    'recommendation': 'Consider upgrading link bandwidth or implementing load balancing'
-                })
+        # Find links with high utilization, worst first
+        links = topology.links
+        for i in self._top_over_idx.tolist():
+            link = links[i]
+            bottlenecks.append({
+                'type': 'bandwidth_bottleneck',
+                'location': f"{link.source_device} <-> {link.target_device}",
+                'utilization': link.utilization,
+                'bandwidth': link.bandwidth,
+                'recommendation': 'Consider upgrading link bandwidth or implementing load balancing'
+            })
         
         # Find single points of failure
-        device_connections = {}
-        for link in topology.links:
-            device_connections[link.source_device] = device_connections.get(link.source_device, 0) + 1
-            device_connections[link.target_device] = device_connections.get(link.target_device, 0) + 1
-        
-        for device, connections in device_connections.items():
-            if connections == 1:
-                bottlenecks.append({
-                    'type': 'single_point_of_failure',
-                    'location': device,
-                    'connections': connections,
-                    'recommendation': 'Add redundant connections to improve network resilience'
-                })
+        bottlenecks.extend([
+            {
+                'type': 'single_point_of_failure',
+                'location': device,
+                'connections': connections,
+                'recommendation': 'Add redundant connections to improve network resilience'
+            }
+            for device, connections in self._degree.items() if connections == 1
+        ])
         
         return bottlenecks
     
@@ -164,55 +365,71 @@ class NetworkAnalyzer:
         """Check for common configuration issues."""
         issues = []
         
-        # Check for duplicate IP addresses
-        ip_addresses = {}
+        # Single device pass: duplicate IP addresses and missing default gateways
+        ip_groups = defaultdict(list)
+        router_missing_default = []
+        device_flags = self._device_flags = {}
         for device in devices:
+            name = device.name
             for interface in device.interfaces:
-                if interface.ip_address:
-                    if interface.ip_address in ip_addresses:
-                        issues.append({
-                            'type': 'duplicate_ip',
-                            'severity': 'high',
-                            'description': f"Duplicate IP address {interface.ip_address}",
-                            'devices': [ip_addresses[interface.ip_address], device.name],
-                            'recommendation': 'Assign unique IP addresses to avoid conflicts'
-                        })
-                    else:
-                        ip_addresses[interface.ip_address] = device.name
-        
-        # Check for MTU mismatches
-        for link in topology.links:
-            source_device = next((d for d in devices if d.name == link.source_device), None)
-            target_device = next((d for d in devices if d.name == link.target_device), None)
+                ip_address = interface.ip_address
+                if ip_address:
+                    ip_groups[ip_address].append(name)
             
-            if source_device and target_device:
-                source_interface = next((i for i in source_device.interfaces if i.name == link.source_interface), None)
-                target_interface = next((i for i in target_device.interfaces if i.name == link.target_interface), None)
-                
-                if source_interface and target_interface:
-                    if source_interface.mtu and target_interface.mtu:
-                        if source_interface.mtu != target_interface.mtu:
-                            issues.append({
-                                'type': 'mtu_mismatch',
-                                'severity': 'medium',
-                                'description': f"MTU mismatch between {link.source_device} ({source_interface.mtu}) and {link.target_device} ({target_interface.mtu})",
-                                'recommendation': 'Configure matching MTU sizes on both ends of the link'
-                            })
-        
-        # Check for missing default gateways (simplified check)
-        for device in devices:
+            has_default_route = any(
+                network.startswith('0.0.0.0') for rp in device.routing_protocols for network in rp.networks
+            )
+            has_ospf = any(rp.protocol == 'ospf' for rp in device.routing_protocols)
+            device_flags[name] = (has_default_route, has_ospf)
+            
+            # Missing default gateways (simplified check)
             if device.device_type == 'router':
-                has_default_route = any(
-                    '0.0.0.0' in network for rp in device.routing_protocols for network in rp.networks
-                )
                 if not has_default_route and len(device.routing_protocols) == 0:
-                    issues.append({
+                    router_missing_default.append({
                         'type': 'missing_default_route',
                         'severity': 'medium',
                         'description': f"Router {device.name} may be missing default route configuration",
                         'recommendation': 'Configure default route or routing protocol'
                     })
         
+        for ip_address, owners in ip_groups.items():
+            if len(owners) > 1:
+                issues.append({
+                    'type': 'duplicate_ip',
+                    'severity': 'high',
+                    'description': f"Duplicate IP address {ip_address}",
+                    'devices': owners,
+                    'recommendation': 'Assign unique IP addresses to avoid conflicts'
+                })
+        
+        # Check for MTU mismatches
+        iface_index = self._iface_index
+        checked_links = set()
+        for link in topology.links:
+            source_key = (link.source_device, link.source_interface)
+            target_key = (link.target_device, link.target_interface)
+            
+            # Links stored in both directions are only checked once
+            link_key = (source_key, target_key) if source_key <= target_key else (target_key, source_key)
+            if link_key in checked_links:
+                continue
+            checked_links.add(link_key)
+            
+            source_interface = iface_index.get(source_key)
+            target_interface = iface_index.get(target_key)
+            
+            if source_interface and target_interface:
+                if source_interface.mtu and target_interface.mtu:
+                    if source_interface.mtu != target_interface.mtu:
+                        issues.append({
+                            'type': 'mtu_mismatch',
+                            'severity': 'medium',
+                            'description': f"MTU mismatch between {link.source_device} ({source_interface.mtu}) and {link.target_device} ({target_interface.mtu})",
+                            'recommendation': 'Configure matching MTU sizes on both ends of the link'
+                        })
+        
+        issues.extend(router_missing_default)
+        
         return issues
     
     def _generate_optimization_recommendations(self, topology: NetworkTopology, devices: List[NetworkDevice]) -> List[str]:
@@ -224,20 +441,20 @@ class NetworkAnalyzer:
             recommendations.append("Consider adding redundant links to improve network resilience")
         
         # Check for routing protocol optimization
-        router_count = sum(1 for d in devices if d.device_type == 'router')
+        router_count = self._device_types['router']
         if router_count > 3:
-            ospf_routers = sum(1 for d in devices if any(rp.protocol == 'ospf' for rp in d.routing_protocols))
+            ospf_routers = sum(has_ospf for _, has_ospf in self._device_flags.values())
             if ospf_routers < router_count * 0.5:
                 recommendations.append("Consider implementing OSPF for better scalability in larger networks")
         
         # Bandwidth optimization
-        high_util_links = sum(1 for link in topology.links if link.utilization > 0.8)
+        high_util_links = self._over_idx.size
         if high_util_links > 0:
             recommendations.append(f"Upgrade bandwidth on {high_util_links} overutilized links")
         
         # VLAN optimization
-        total_vlans = sum(len(device.vlans) for device in devices)
-        if total_vlans == 0 and any(d.device_type == 'switch' for d in devices):
+        total_vlans = sum(map(len, (device.vlans for device in devices)))
+        if total_vlans == 0 and self._device_types['switch']:
             recommendations.append("Consider implementing VLANs for better network segmentation")
         
         return recommendations
@@ -247,16 +464,17 @@ class NetworkAnalyzer:
         suggestions = []
         
         # Find overutilized links that could benefit from load balancing
-        for link in topology.links:
-            if link.utilization > self.bandwidth_threshold:
-                # Look for alternative paths
-                # This is simplified - in reality you'd use graph algorithms
-                suggestions.append({
-                    'link': f"{link.source_device} <-> {link.target_device}",
-                    'current_utilization': link.utilization,
-                    'suggestion': 'Implement ECMP or configure secondary paths for load distribution',
-                    'priority': 'high' if link.utilization > 0.9 else 'medium'
-                })
+        links = topology.links
+        for i in self._over_idx.tolist():
+            link = links[i]
+            # Look for alternative paths
+            # This is simplified - in reality you'd use graph algorithms
+            suggestions.append({
+                'link': f"{link.source_device} <-> {link.target_device}",
+                'current_utilization': link.utilization,
+                'suggestion': 'Implement ECMP or configure secondary paths for load distribution',
+                'priority': 'high' if link.utilization > 0.9 else 'medium'
+            })
         
         return suggestions
     
@@ -266,140 +484,111 @@ class NetworkAnalyzer:
             'total_devices': len(topology.devices),
             'total_links': len(topology.links),
             'total_subnets': len(topology.subnets),
-            'device_types': {},
+            'device_types': dict(self._device_types),
             'average_degree': 0.0,
             'network_density': 0.0
         }
         
-        # Device type distribution
-        for device in topology.devices:
-            device_type = device.device_type
-            stats['device_types'][device_type] = stats['device_types'].get(device_type, 0) + 1
-        
         # Network connectivity metrics
         if topology.devices:
-            total_possible_links = len(topology.devices) * (len(topology.devices) - 1) / 2
+            device_count = len(topology.devices)
+            total_possible_links = device_count * (device_count - 1) // 2
             stats['network_density'] = len(topology.links) / total_possible_links if total_possible_links > 0 else 0
             
             # Average degree (connections per device)
-            stats['average_degree'] = (2 * len(topology.links)) / len(topology.devices)
+            stats['average_degree'] = sum(self._degree.values()) / len(topology.devices)
         
         return stats
     
     def generate_report(self, analysis: AnalysisResult, output_file: str):
         """Generate HTML analysis report."""
-        html_content = self._generate_html_report(analysis)
-        
-        with open(output_file, 'w') as f:
-            f.write(html_content)
+        # Stream sections to a temporary file rather than building the whole document,
+        # and only replace the previous report once rendering has finished
+        tmp_file = f"{output_file}.tmp"
+        try:
+            with open(tmp_file, 'w', buffering=1 << 16) as f:
+                f.writelines(self._iter_html_report(analysis))
+            os.replace(tmp_file, output_file)
+        finally:
+            # Only left behind when rendering failed
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
         
         logger.info(f"Analysis report generated: {output_file}")
     
     def _generate_html_report(self, analysis: AnalysisResult) -> str:
         """Generate HTML report content."""
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Network Analysis Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
-                .section {{ margin: 20px 0; }}
-                .issue {{ background-color: #ffe6e6; padding: 10px; margin: 5px 0; border-radius: 3px; }}
-                .recommendation {{ background-color: #e6f3ff; padding: 10px; margin: 5px 0; border-radius: 3px; }}
-                .stats {{ background-color: #f0f8f0; padding: 15px; border-radius: 5px; }}
-                table {{ border-collapse: collapse; width: 100%; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #f2f2f2; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Network Analysis Report</h1>
-                <p>Generated on: {self._get_current_timestamp()}</p>
-            </div>
-            
-            <div class="section">
-                <h2>Network Statistics</h2>
-                <div class="stats">
-                    <p><strong>Total Devices:</strong> {analysis.network_statistics.get('total_devices', 0)}</p>
-                    <p><strong>Total Links:</strong> {analysis.network_statistics.get('total_links', 0)}</p>
-                    <p><strong>Total Subnets:</strong> {analysis.network_statistics.get('total_subnets', 0)}</p>
-                    <p><strong>Average Utilization:</strong> {analysis.bandwidth_analysis.get('average_utilization', 0):.1%}</p>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>Configuration Issues</h2>
-                {self._format_issues_html(analysis.configuration_issues)}
-            </div>
-            
-            <div class="section">
-                <h2>Optimization Recommendations</h2>
-                {self._format_recommendations_html(analysis.optimization_recommendations)}
-            </div>
-            
-            <div class="section">
-                <h2>Bandwidth Analysis</h2>
-                {self._format_bandwidth_analysis_html(analysis.bandwidth_analysis)}
-            </div>
-        </body>
-        </html>
-        """
-        return html
+        return "".join(self._iter_html_report(analysis))
     
-    def _format_issues_html(self, issues: List[Dict[str, Any]]) -> str:
-        """Format configuration issues as HTML."""
+    def _iter_html_report(self, analysis: AnalysisResult) -> Iterator[str]:
+        """Yield HTML report content in document order."""
+        stats = analysis.network_statistics
+        yield _REPORT_HEAD.substitute(
+            timestamp=self._get_current_timestamp(),
+            total_devices=stats.get('total_devices', 0),
+            total_links=stats.get('total_links', 0),
+            total_subnets=stats.get('total_subnets', 0),
+            average_utilization=f"{analysis.bandwidth_analysis.get('average_utilization', 0):.1%}"
+        )
+        yield from self._iter_issues_html(analysis.configuration_issues)
+        yield _REPORT_AFTER_ISSUES
+        yield from self._iter_recommendations_html(analysis.optimization_recommendations)
+        yield _REPORT_AFTER_RECOMMENDATIONS
+        yield from self._iter_bandwidth_analysis_html(analysis.bandwidth_analysis)
+        yield _REPORT_TAIL
+    
+    def _iter_issues_html(self, issues: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield configuration issues as HTML."""
         if not issues:
-            return "<p>No configuration issues found.</p>"
+            yield "<p>No configuration issues found.</p>"
+            return
         
-        html = ""
+        escape = html.escape
         for issue in issues:
-            severity_class = f"issue-{issue.get('severity', 'medium')}"
-            html += f"""
-            <div class="issue {severity_class}">
-                <strong>{issue.get('type', 'Unknown').replace('_', ' ').title()}:</strong>
-                {issue.get('description', '')}
-                <br><em>Recommendation: {issue.get('recommendation', '')}</em>
-            </div>
-            """
-        return html
+            yield _ISSUE_TEMPLATE.format_map({
+                'severity_class': 'issue-' + issue.get('severity', 'medium'),
+                'title': escape(issue.get('type', 'Unknown').replace('_', ' ').title()),
+                'description': escape(issue.get('description', '')),
+                'recommendation': escape(issue.get('recommendation', ''))
+            })
     
-    def _format_recommendations_html(self, recommendations: List[str]) -> str:
-        """Format recommendations as HTML."""
+    def _iter_recommendations_html(self, recommendations: List[str]) -> Iterator[str]:
+        """Yield recommendations as HTML."""
         if not recommendations:
-            return "<p>No specific recommendations at this time.</p>"
+            yield "<p>No specific recommendations at this time.</p>"
+            return
         
-        html = ""
         for rec in recommendations:
-            html += f'<div class="recommendation">{rec}</div>'
-        return html
+            yield _RECOMMENDATION_TEMPLATE.format_map({'recommendation': html.escape(rec)})
     
-    def _format_bandwidth_analysis_html(self, analysis: Dict[str, Any]) -> str:
-        """Format bandwidth analysis as HTML."""
+    def _iter_bandwidth_analysis_html(self, analysis: Dict[str, Any]) -> Iterator[str]:
+        """Yield bandwidth analysis as HTML."""
         overutilized = analysis.get('overutilized_links', [])
         bottlenecks = analysis.get('bottlenecks', [])
         
-        html = f"<p><strong>Average Utilization:</strong> {analysis.get('average_utilization', 0):.1%}</p>"
+        yield f"<p><strong>Average Utilization:</strong> {analysis.get('average_utilization', 0):.1%}</p>"
         
         if overutilized:
-            html += "<h3>Overutilized Links</h3><ul>"
+            yield "<h3>Overutilized Links</h3><ul>"
             for link in overutilized:
-                html += f"<li>{link['source']} ↔ {link['target']}: {link['utilization']:.1%} utilization</li>"
-            html += "</ul>"
+                yield _OVERUTILIZED_LINK_TEMPLATE.format_map({
+                    'source': html.escape(link['source']),
+                    'target': html.escape(link['target']),
+                    'utilization': link['utilization']
+                })
+            yield "</ul>"
         
         if bottlenecks:
-            html += "<h3>Identified Bottlenecks</h3><ul>"
+            yield "<h3>Identified Bottlenecks</h3><ul>"
             for bottleneck in bottlenecks:
-                html += f"<li>{bottleneck['type']} at {bottleneck['location']}</li>"
-            html += "</ul>"
-        
-        return html
+                yield _BOTTLENECK_TEMPLATE.format_map({
+                    'type': html.escape(bottleneck['type']),
+                    'location': html.escape(bottleneck['location'])
+                })
+            yield "</ul>"
     
     def _get_current_timestamp(self) -> str:
         """Get current timestamp for report."""
-        from datetime import datetime
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     def print_summary(self, analysis: AnalysisResult):
@@ -2,17 +2,95 @@
 Network topology builder from device configurations.
 """
 
+import os
+import re
 import json
 import networkx as nx
-from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass, asdict
+import numpy as np
+from collections import OrderedDict, defaultdict
+from itertools import chain, combinations
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Tuple, Optional, Iterator
+from dataclasses import dataclass, field, fields
 from loguru import logger
 
-from .config_parser import NetworkDevice, Interface
-from ..utils.helpers import validate_ip_address, calculate_subnet
+try:
+    import igraph
+except ImportError:  # optional C-backed backend for path analysis
+    igraph = None
 
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder
+    orjson = None
 
-@dataclass
+from .config_parser import NetworkDevice, Interface, InterfaceKind
+from ..utils.helpers import (
+    validate_ip_address, calculate_subnet, parse_bandwidth, ipv4_to_int,
+    netmask_prefix_length, ips_to_uint32, prefix_masks_uint32
+)
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+# Number of per-source BFS predecessor maps kept for path queries
+BFS_CACHE_SIZE = 256
+
+
+def _description_tokens(description_lower: str) -> set:
+    """Split a lowercased interface description into the names it can mention."""
+    words = description_lower.split()
+    tokens = set(words)
+    for word in words:
+        tokens.update(part for part in _NON_ALNUM.split(word) if part)
+    return tokens
+
+
+def _link_key(source_device: str, source_interface: str,
+              target_device: str, target_interface: str) -> frozenset:
+    """Direction-independent identity of a link between two interfaces."""
+    return frozenset(((source_device, source_interface), (target_device, target_interface)))
+
+
+def _chunk_bounds(count: int, workers: int) -> List[Tuple[int, int]]:
+    """Split range(count) into at most workers contiguous (start, stop) chunks."""
+    size = max(1, -(-count // workers))
+    return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+
+# Link bandwidth in bps assumed for interfaces without a configured bandwidth
+_DEFAULT_BPS_BY_KIND = {
+    InterfaceKind.GIGABIT: 1_000_000_000,
+    InterfaceKind.FAST: 100_000_000,
+    InterfaceKind.ETHERNET: 10_000_000,
+}
+
+
+@lru_cache(maxsize=None)
+def _init_field_names(cls) -> Tuple[str, ...]:
+    """Names of a dataclass's constructor fields, which excludes derived caches."""
+    return tuple(f.name for f in fields(cls) if f.init)
+
+
+def _shallow_asdict(obj) -> Dict[str, Any]:
+    """Copy a flat dataclass's constructor fields into a dict without asdict's deep copy."""
+    return {name: getattr(obj, name) for name in _init_field_names(type(obj))}
+
+
+@lru_cache(maxsize=256)
+def _format_bandwidth(bps: int) -> str:
+    """Convert a bandwidth in bps to a human readable string."""
+    if bps >= 1_000_000_000:
+        return f"{bps // 1_000_000_000}Gbps"
+    elif bps >= 1_000_000:
+        return f"{bps // 1_000_000}Mbps"
+    elif bps >= 1_000:
+        return f"{bps // 1_000}Kbps"
+    else:
+        return f"{bps}bps"
+
+
+@dataclass(slots=True)
 class NetworkLink:
     """Network link between devices."""
     source_device: str
@@ -24,12 +102,168 @@ class NetworkLink:
     link_type: str = "ethernet"
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkTopology:
     """Complete network topology."""
     devices: List[NetworkDevice]
     links: List[NetworkLink]
     subnets: Dict[str, List[str]]  # subnet -> list of device names
+
+
+# Two interfaces that hierarchical discovery proposes to link, as
+# (device1, interface1, device2, interface2)
+_Candidate = Tuple[NetworkDevice, Interface, NetworkDevice, Interface]
+
+
+@dataclass(slots=True)
+class _LinkIndexes:
+    """
+    Read-only lookups for hierarchical link discovery.
+    
+    Kept apart from TopologyBuilder so discovery workers receive these
+    lookups once instead of the whole builder with every job.
+    """
+    desc_index: Dict[str, Dict[str, Interface]] = field(default_factory=dict)  # token -> {device name -> first interface mentioning it}
+    trunk_index: Dict[Tuple[str, str], Interface] = field(default_factory=dict)  # (device name, token) -> trunk interface
+    uplink_by_switch: Dict[str, Optional[Interface]] = field(default_factory=dict)
+    subnets_by_device: Dict[str, set] = field(default_factory=dict)
+    
+    def find_described_interface(self, device, mentioned) -> Optional[Interface]:
+        """Find the first interface on device whose description mentions another device."""
+        return self.desc_index.get(mentioned.name_lower, {}).get(device.name)
+    
+    def should_connect_switch_to_router(self, switch, router) -> bool:
+        """Determine if switch should connect to router."""
+        # Check if the switch has an interface in one of the router's subnets
+        switch_subnets = self.subnets_by_device.get(switch.name)
+        if switch_subnets and not switch_subnets.isdisjoint(self.subnets_by_device.get(router.name, ())):
+            return True
+        
+        # Check if either side has an interface description mentioning the other
+        return (self.find_described_interface(router, switch) is not None or
+                self.find_described_interface(switch, router) is not None)
+    
+    def should_connect_pc_to_switch(self, pc, switch, pc_subnet) -> bool:
+        """Determine if PC should connect to switch based on subnet/VLAN."""
+        # Check if PC's subnet matches any VLAN subnet that the switch handles
+        if not pc_subnet:
+            return False
+        
+        # Check switch interface descriptions for PC name
+        if self.find_described_interface(switch, pc):
+            return True
+        
+        # Default logic: connect PC to first available switch
+        return True
+    
+    def should_connect_switches(self, switch1, switch2) -> bool:
+        """Determine if switches should be connected via trunk."""
+        # Check for trunk interface descriptions
+        return self.find_trunk_interface(switch1, switch2) is not None
+    
+    def find_switch_interface(self, router, switch):
+        """Find router interface that connects to switch."""
+        # Look for interface with switch name in description
+        interface = self.find_described_interface(router, switch)
+        if interface:
+            return interface
+        
+        # Fallback: any available interface
+        return router.interfaces[0] if router.interfaces else None
+    
+    def find_pc_interface(self, switch, pc):
+        """Find switch interface that connects to PC."""
+        # Look for interface with PC name in description
+        interface = self.find_described_interface(switch, pc)
+        if interface:
+            return interface
+        
+        # Fallback: first FastEthernet interface
+        for interface in switch.interfaces:
+            if interface.kind == InterfaceKind.FAST:
+                return interface
+        
+        return None
+    
+    def find_trunk_interface(self, switch, target_switch):
+        """Find trunk interface connecting to target switch."""
+        return self.trunk_index.get((switch.name, target_switch.name_lower))
+
+
+def _devices_by_type(devices: List[NetworkDevice]
+                     ) -> Tuple[List[NetworkDevice], List[NetworkDevice], List[NetworkDevice]]:
+    """Split devices into (routers, switches, pcs), keeping their order."""
+    routers = [d for d in devices if d.device_type == 'router']
+    switches = [d for d in devices if d.device_type == 'switch']
+    pcs = [d for d in devices if d.device_type == 'pc']
+    return routers, switches, pcs
+
+
+def _pc_subnet(pc):
+    """Get the subnet of a PC's first interface, or None if it has no address."""
+    if not pc.interfaces:
+        return None
+    
+    pc_interface = pc.interfaces[0]
+    if not pc_interface.ip_address:
+        return None
+    
+    return calculate_subnet(pc_interface.ip_address, pc_interface.subnet_mask)
+
+
+def _links_switch_router(indexes: _LinkIndexes, switches: List[NetworkDevice],
+                         routers: List[NetworkDevice]) -> Iterator[_Candidate]:
+    """Connect switches to routers based on interface descriptions and subnets."""
+    for switch in switches:
+        for router in routers:
+            if indexes.should_connect_switch_to_router(switch, router):
+                # Find best interfaces to connect
+                switch_interface = indexes.uplink_by_switch.get(switch.name)
+                router_interface = indexes.find_switch_interface(router, switch)
+                
+                if switch_interface and router_interface:
+                    yield switch, switch_interface, router, router_interface
+
+
+def _links_pc_switch(indexes: _LinkIndexes, pcs: List[NetworkDevice],
+                     switches: List[NetworkDevice]) -> Iterator[_Candidate]:
+    """Connect PCs to switches based on VLAN and subnet matching."""
+    for pc in pcs:
+        # The PC's subnet does not depend on the switch, so compute it once
+        pc_subnet = _pc_subnet(pc)
+        if pc_subnet is None:
+            continue
+        
+        for switch in switches:
+            if indexes.should_connect_pc_to_switch(pc, switch, pc_subnet):
+                # Find matching interfaces
+                pc_interface = pc.interfaces[0] if pc.interfaces else None
+                switch_interface = indexes.find_pc_interface(switch, pc)
+                
+                if pc_interface and switch_interface:
+                    yield pc, pc_interface, switch, switch_interface
+
+
+def _links_switch_switch(indexes: _LinkIndexes, switches: List[NetworkDevice],
+                         following: List[NetworkDevice]) -> Iterator[_Candidate]:
+    """
+    Connect switches to each other (trunk links).
+    
+    Args:
+        indexes: Lookups built by TopologyBuilder._build_indexes
+        switches: Consecutive run of the switch list
+        following: Switch list starting just after the first entry of switches,
+            so each switch is paired only with the switches after it
+    """
+    for i, switch1 in enumerate(switches):
+        for switch2 in following[i:]:
+            if indexes.should_connect_switches(switch1, switch2):
+                # Find trunk interfaces
+                switch1_trunk = indexes.find_trunk_interface(switch1, switch2)
+                switch2_trunk = indexes.find_trunk_interface(switch2, switch1)
+                
+                if switch1_trunk and switch2_trunk:
+                    yield switch1, switch1_trunk, switch2, switch2_trunk
     
 
 class TopologyBuilder:
@@ -39,38 +273,79 @@ class TopologyBuilder:
         """Initialize with config parser."""
         self.config_parser = config_parser
         self.graph = nx.Graph()
+        
+        # Only pays off once process start-up is small next to the pairwise scans
+        self.parallel_discovery = config_parser.config.get('topology', {}).get('parallel_discovery', False)
+        
+        # igraph copy of self.graph for path analysis, built on first use
+        self._ig = None
+        self._ig_ids: Dict[str, int] = {}
+        self._ig_names: List[str] = []
+        
+        # Description and subnet lookups, rebuilt for each hierarchical link discovery
+        self._indexes = _LinkIndexes()
+        
+        # Endpoint keys of links emitted so far, reset for each discovery
+        self._link_keys: set = set()
+        
+        # Compressed sparse row adjacency of self.graph for traversal
+        self._csr_indptr = np.zeros(1, dtype=np.int64)
+        self._csr_indices = np.zeros(0, dtype=np.int32)
+        self._csr_names = np.array([], dtype=object)
+        self._csr_ids: Dict[str, int] = {}
+        
+        # Bumped on every graph rebuild; cached traversal results are only
+        # valid for the version they were computed at
+        self._graph_version = 0
+        self._bfs_cache: OrderedDict = OrderedDict()
+        self._bfs_cache_version = 0
     
-    def build_topology(self, devices: List[NetworkDevice]) -> NetworkTopology:
+    def build_topology(self, devices: List[NetworkDevice], *, need_subnets: bool = True) -> NetworkTopology:
         """
         Build network topology from device configurations.
         
         Args:
             devices: List of network devices
+            need_subnets: Build the subnet -> devices map; callers that never
+                read topology.subnets can skip it and get an empty map
             
         Returns:
             Complete network topology
         """
         logger.info("Building network topology")
+        self._ig = None
+        self._graph_version += 1
         
         # Create graph nodes for devices
-        for device in devices:
-            self.graph.add_node(device.name, device_type=device.device_type)
+        self.graph.add_nodes_from(
+            (device.name, {'device_type': device.device_type}) for device in devices
+        )
+        
+        # Group addressed interfaces by subnet once for link and subnet discovery
+        subnet_groups = self._group_interfaces_by_subnet(devices)
         
         # Discover links between devices
-        links = self._discover_links(devices)
+        links = self._discover_links(devices, subnet_groups)
         
-        # Add links to graph
-        for link in links:
-            self.graph.add_edge(
+        # Add links to graph in one bulk call
+        self.graph.add_edges_from(
+            (
                 link.source_device,
                 link.target_device,
-                source_interface=link.source_interface,
-                target_interface=link.target_interface,
-                bandwidth=link.bandwidth
+                {
+                    'source_interface': link.source_interface,
+                    'target_interface': link.target_interface,
+                    'bandwidth': link.bandwidth
+                }
             )
+            for link in links
+        )
+        
+        # Flat adjacency for traversal queries
+        self._to_csr()
         
         # Discover subnets
-        subnets = self._discover_subnets(devices)
+        subnets = self._discover_subnets(devices, subnet_groups) if need_subnets else {}
         
         topology = NetworkTopology(
             devices=devices,
@@ -81,299 +356,277 @@ class TopologyBuilder:
         logger.info(f"Built topology with {len(devices)} devices, {len(links)} links, {len(subnets)} subnets")
         return topology
     
-    def _discover_links(self, devices: List[NetworkDevice]) -> List[NetworkLink]:
+    def _discover_links(self, devices: List[NetworkDevice],
+                        subnet_groups: Optional[Dict[str, List[Tuple[NetworkDevice, Interface]]]] = None
+                        ) -> List[NetworkLink]:
         """
         Discover links between devices using hierarchical network topology rules.
         
         Args:
             devices: List of network devices
+            subnet_groups: Precomputed result of _group_interfaces_by_subnet
             
         Returns:
             List of discovered network links
         """
         links = []
+        self._link_keys = set()
         
         # First, discover subnet-based connections (routers)
-        subnet_links = self._discover_subnet_links(devices)
+        subnet_links = self._discover_subnet_links(devices, subnet_groups)
         links.extend(subnet_links)
         
         # Then, discover hierarchical connections (switches to routers, PCs to switches)
-        hierarchical_links = self._discover_hierarchical_links(devices)
+        hierarchical_links = self._discover_hierarchical_links(devices, subnet_groups)
         links.extend(hierarchical_links)
         
         return links
     
-    def _discover_subnet_links(self, devices: List[NetworkDevice]) -> List[NetworkLink]:
-        """Discover links based on IP subnets (mainly for routers)."""
-        links = []
-        device_interfaces = {}
+    def _group_interfaces_by_subnet(self, devices: List[NetworkDevice]
+                                    ) -> Dict[str, List[Tuple[NetworkDevice, Interface]]]:
+        """
+        Group addressed interfaces by subnet using vectorized bitwise masking.
+        
+        Args:
+            devices: List of network devices
+            
+        Returns:
+            Dictionary mapping subnet string to (device, interface) pairs, with
+            subnets and members in configuration order
+        """
+        members = []
+        ips = []
+        prefixes = []
         
-        # Build mapping of subnets to device interfaces (only for routers)
         for device in devices:
-            if device.device_type == 'router':
-                for interface in device.interfaces:
-                    if interface.ip_address and interface.subnet_mask:
-                        subnet = calculate_subnet(interface.ip_address, interface.subnet_mask)
-                        if subnet:
-                            subnet_str = str(subnet)
-                            if subnet_str not in device_interfaces:
-                                device_interfaces[subnet_str] = []
-                            device_interfaces[subnet_str].append((device, interface))
-        
-        # Find links (interfaces in same subnet)
-        for subnet, interfaces in device_interfaces.items():
-            if len(interfaces) >= 2:
-                # Create links between all devices in same subnet
-                for i in range(len(interfaces)):
-                    for j in range(i + 1, len(interfaces)):
-                        device1, interface1 = interfaces[i]
-                        device2, interface2 = interfaces[j]
-                        
-                        # Determine bandwidth (use minimum of both interfaces)
-                        bandwidth = self._determine_link_bandwidth(interface1, interface2)
-                        
-                        link = NetworkLink(
-                            source_device=device1.name,
-                            target_device=device2.name,
-                            source_interface=interface1.name,
-                            target_interface=interface2.name,
-                            bandwidth=bandwidth
-                        )
-                        links.append(link)
+            for interface in device.interfaces:
+                if interface.ip_address and interface.subnet_mask:
+                    prefix_len = netmask_prefix_length(interface.subnet_mask)
+                    if prefix_len is None or ipv4_to_int(interface.ip_address) is None:
+                        continue
+                    members.append((device, interface))
+                    ips.append(interface.ip_address)
+                    prefixes.append(prefix_len)
+        
+        if not members:
+            return {}
+        
+        prefix_arr = np.array(prefixes, dtype=np.uint8)
+        networks = ips_to_uint32(ips) & prefix_masks_uint32(prefix_arr)
+        
+        # Same network address with a different prefix is a different subnet
+        keys = (networks.astype(np.uint64) << np.uint64(6)) | prefix_arr.astype(np.uint64)
+        _, first_index, inverse, counts = np.unique(
+            keys, return_index=True, return_inverse=True, return_counts=True
+        )
+        
+        # Stable sort keeps members of each subnet in configuration order
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        
+        groups = {}
+        for group in np.argsort(first_index):
+            network = int(networks[first_index[group]])
+            subnet_str = (
+                f"{network >> 24}.{(network >> 16) & 255}.{(network >> 8) & 255}.{network & 255}"
+                f"/{prefixes[first_index[group]]}"
+            )
+            groups[subnet_str] = [members[i] for i in order[bounds[group]:bounds[group + 1]]]
+        
+        return groups
+    
+    def _discover_subnet_links(self, devices: List[NetworkDevice],
+                               subnet_groups: Optional[Dict[str, List[Tuple[NetworkDevice, Interface]]]] = None
+                               ) -> List[NetworkLink]:
+        """Discover links based on IP subnets (mainly for routers)."""
+        links = []
+        if subnet_groups is None:
+            subnet_groups = self._group_interfaces_by_subnet(devices)
+        
+        # Find links (router interfaces in same subnet)
+        for members in subnet_groups.values():
+            interfaces = [(device, interface) for device, interface in members
+                          if device.device_type == 'router']
+            # Create links between all devices in same subnet
+            for (device1, interface1), (device2, interface2) in combinations(interfaces, 2):
+                link = self._make_link(device1, interface1, device2, interface2)
+                if link:
+                    links.append(link)
         
         return links
     
-    def _discover_hierarchical_links(self, devices: List[NetworkDevice]) -> List[NetworkLink]:
+    def _discover_hierarchical_links(self, devices: List[NetworkDevice],
+                                     subnet_groups: Optional[Dict[str, List[Tuple[NetworkDevice, Interface]]]] = None
+                                     ) -> List[NetworkLink]:
         """Discover hierarchical connections based on network design patterns."""
         links = []
+        if subnet_groups is None:
+            subnet_groups = self._group_interfaces_by_subnet(devices)
+        self._build_indexes(devices, subnet_groups)
         
         # Separate devices by type
-        routers = [d for d in devices if d.device_type == 'router']
-        switches = [d for d in devices if d.device_type == 'switch']
-        pcs = [d for d in devices if d.device_type == 'pc']
-        
-        # Connect switches to routers based on interface descriptions and subnets
-        for switch in switches:
-            for router in routers:
-                if self._should_connect_switch_to_router(switch, router):
-                    # Find best interfaces to connect
-                    switch_interface = self._find_uplink_interface(switch)
-                    router_interface = self._find_switch_interface(router, switch)
-                    
-                    if switch_interface and router_interface:
-                        bandwidth = self._determine_link_bandwidth(switch_interface, router_interface)
-                        link = NetworkLink(
-                            source_device=switch.name,
-                            target_device=router.name,
-                            source_interface=switch_interface.name,
-                            target_interface=router_interface.name,
-                            bandwidth=bandwidth
-                        )
-                        links.append(link)
-        
-        # Connect PCs to switches based on VLAN and subnet matching
-        for pc in pcs:
-            for switch in switches:
-                if self._should_connect_pc_to_switch(pc, switch):
-                    # Find matching interfaces
-                    pc_interface = pc.interfaces[0] if pc.interfaces else None
-                    switch_interface = self._find_pc_interface(switch, pc)
-                    
-                    if pc_interface and switch_interface:
-                        bandwidth = self._determine_link_bandwidth(pc_interface, switch_interface)
-                        link = NetworkLink(
-                            source_device=pc.name,
-                            target_device=switch.name,
-                            source_interface=pc_interface.name,
-                            target_interface=switch_interface.name,
-                            bandwidth=bandwidth
-                        )
-                        links.append(link)
+        routers, switches, pcs = _devices_by_type(devices)
         
-        # Connect switches to each other (trunk links)
-        for i, switch1 in enumerate(switches):
-            for switch2 in switches[i+1:]:
-                if self._should_connect_switches(switch1, switch2):
-                    # Find trunk interfaces
-                    switch1_trunk = self._find_trunk_interface(switch1, switch2)
-                    switch2_trunk = self._find_trunk_interface(switch2, switch1)
-                    
-                    if switch1_trunk and switch2_trunk:
-                        bandwidth = self._determine_link_bandwidth(switch1_trunk, switch2_trunk)
-                        link = NetworkLink(
-                            source_device=switch1.name,
-                            target_device=switch2.name,
-                            source_interface=switch1_trunk.name,
-                            target_interface=switch2_trunk.name,
-                            bandwidth=bandwidth
-                        )
+        if not self.parallel_discovery:
+            candidates = chain(
+                _links_switch_router(self._indexes, switches, routers),
+                _links_pc_switch(self._indexes, pcs, switches),
+                _links_switch_switch(self._indexes, switches, switches[1:])
+            )
+            for device1, interface1, device2, interface2 in candidates:
+                link = self._make_link(device1, interface1, device2, interface2)
+                if link:
+                    links.append(link)
+            return links
+        
+        # Each phase only reads the device lists and indexes, so chunks of the
+        # outer loop run across processes. Workers receive the devices and
+        # indexes once; a job is just a phase name and a chunk range
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_discovery_worker,
+                                 initargs=(self._indexes, devices)) as executor:
+            futures = [executor.submit(_discover_in_worker, 'switch_router', lo, hi)
+                       for lo, hi in _chunk_bounds(len(switches), workers)]
+            futures += [executor.submit(_discover_in_worker, 'pc_switch', lo, hi)
+                        for lo, hi in _chunk_bounds(len(pcs), workers)]
+            futures += [executor.submit(_discover_in_worker, 'switch_switch', lo, hi)
+                        for lo, hi in _chunk_bounds(len(switches), workers)]
+            # Links are made here in submission order, so duplicates across
+            # chunks are dropped exactly as on the serial path
+            for future in futures:
+                for device1_pos, interface1_pos, device2_pos, interface2_pos in future.result():
+                    device1 = devices[device1_pos]
+                    device2 = devices[device2_pos]
+                    link = self._make_link(device1, device1.interfaces[interface1_pos],
+                                           device2, device2.interfaces[interface2_pos])
+                    if link:
                         links.append(link)
         
         return links
     
-    def _should_connect_switch_to_router(self, switch, router) -> bool:
-        """Determine if switch should connect to router."""
-        # Check if router has interface descriptions mentioning the switch
-        for interface in router.interfaces:
-            if interface.description and switch.name.lower() in interface.description.lower():
-                return True
-        
-        # Check if switch has uplink interface descriptions mentioning router
-        for interface in switch.interfaces:
-            if interface.description and ('uplink' in interface.description.lower() or 
-                                        'router' in interface.description.lower()):
-                return True
+    def _make_link(self, device1: NetworkDevice, interface1: Interface,
+                   device2: NetworkDevice, interface2: Interface) -> Optional[NetworkLink]:
+        """
+        Create a link between two interfaces unless it was already discovered.
         
-        return True  # Default: connect all switches to routers
+        Args:
+            device1: Source device
+            interface1: Source interface
+            device2: Target device
+            interface2: Target interface
+            
+        Returns:
+            New link, or None if the same interface pair is already linked
+        """
+        key = _link_key(device1.name, interface1.name, device2.name, interface2.name)
+        if key in self._link_keys:
+            return None
+        self._link_keys.add(key)
+        
+        # Determine bandwidth (use minimum of both interfaces)
+        return NetworkLink(
+            source_device=device1.name,
+            target_device=device2.name,
+            source_interface=interface1.name,
+            target_interface=interface2.name,
+            bandwidth=self._determine_link_bandwidth(interface1, interface2)
+        )
     
-    def _should_connect_pc_to_switch(self, pc, switch) -> bool:
-        """Determine if PC should connect to switch based on subnet/VLAN."""
-        if not pc.interfaces:
-            return False
+    def _build_indexes(self, devices: List[NetworkDevice],
+                       subnet_groups: Dict[str, List[Tuple[NetworkDevice, Interface]]]):
+        """
+        Index interface descriptions and subnets once for hierarchical link discovery.
         
-        pc_interface = pc.interfaces[0]
-        if not pc_interface.ip_address:
-            return False
+        Builds a token -> {device name -> first interface mentioning it} map,
+        a (device name, token) -> trunk interface map, each switch's
+        uplink interface, and the set of subnets each device is attached to.
         
-        # Check if PC's subnet matches any VLAN subnet that the switch handles
-        pc_subnet = calculate_subnet(pc_interface.ip_address, pc_interface.subnet_mask)
-        if not pc_subnet:
-            return False
+        Args:
+            devices: List of network devices
+            subnet_groups: Result of _group_interfaces_by_subnet
+        """
+        desc_index = defaultdict(dict)
+        trunk_index = {}
+        uplink_by_switch = {}
+        subnets_by_device = defaultdict(set)
         
-        # Check switch interface descriptions for PC name
-        for interface in switch.interfaces:
-            if (interface.description and 
-                pc.name.lower() in interface.description.lower()):
-                return True
+        for subnet_str, members in subnet_groups.items():
+            for device, _ in members:
+                subnets_by_device[device.name].add(subnet_str)
         
-        # Default logic: connect PC to first available switch
-        return True
-    
-    def _should_connect_switches(self, switch1, switch2) -> bool:
-        """Determine if switches should be connected via trunk."""
-        # Check for trunk interface descriptions
-        for interface in switch1.interfaces:
-            if (interface.description and 
-                switch2.name.lower() in interface.description.lower() and
-                'trunk' in interface.description.lower()):
-                return True
+        for device in devices:
+            for interface in device.interfaces:
+                if not interface.description:
+                    continue
+                description_lower = interface.description_lower
+                is_trunk = 'trunk' in description_lower
+                for token in _description_tokens(description_lower):
+                    desc_index[token].setdefault(device.name, interface)
+                    if is_trunk:
+                        trunk_index.setdefault((device.name, token), interface)
+            
+            if device.device_type == 'switch':
+                uplink_by_switch[device.name] = self._find_uplink_interface(device)
         
-        return False  # Only connect if explicitly configured
+        self._indexes = _LinkIndexes(desc_index, trunk_index, uplink_by_switch, subnets_by_device)
     
     def _find_uplink_interface(self, switch):
         """Find uplink interface on switch (typically Gigabit)."""
         # Look for Gigabit interfaces with uplink descriptions
         for interface in switch.interfaces:
-            if (interface.name.lower().startswith('gi') and 
-                interface.description and 
-                ('uplink' in interface.description.lower() or 
-                 'router' in interface.description.lower())):
+            if (interface.kind == InterfaceKind.GIGABIT and 
+                ('uplink' in interface.description_lower or 
+                 'router' in interface.description_lower)):
                 return interface
         
         # Fallback: any Gigabit interface
         for interface in switch.interfaces:
-            if interface.name.lower().startswith('gi'):
-                return interface
-        
-        return None
-    
-    def _find_switch_interface(self, router, switch):
-        """Find router interface that connects to switch."""
-        # Look for interface with switch name in description
-        for interface in router.interfaces:
-            if (interface.description and 
-                switch.name.lower() in interface.description.lower()):
-                return interface
-        
-        # Fallback: any available interface
-        return router.interfaces[0] if router.interfaces else None
-    
-    def _find_pc_interface(self, switch, pc):
-        """Find switch interface that connects to PC."""
-        # Look for interface with PC name in description
-        for interface in switch.interfaces:
-            if (interface.description and 
-                pc.name.lower() in interface.description.lower()):
-                return interface
-        
-        # Fallback: first FastEthernet interface
-        for interface in switch.interfaces:
-            if interface.name.lower().startswith('fa'):
-                return interface
-        
-        return None
-    
-    def _find_trunk_interface(self, switch, target_switch):
-        """Find trunk interface connecting to target switch."""
-        for interface in switch.interfaces:
-            if (interface.description and 
-                target_switch.name.lower() in interface.description.lower() and
-                'trunk' in interface.description.lower()):
+            if interface.kind == InterfaceKind.GIGABIT:
                 return interface
         
         return None
     
     def _determine_link_bandwidth(self, interface1: Interface, interface2: Interface) -> str:
         """Determine link bandwidth from interface configurations."""
-        # Get bandwidth from interfaces
-        bw1 = interface1.bandwidth or self._get_default_bandwidth(interface1.name)
-        bw2 = interface2.bandwidth or self._get_default_bandwidth(interface2.name)
-        
-        # Parse bandwidth values
-        from ..utils.helpers import parse_bandwidth
-        bw1_bps = parse_bandwidth(bw1)
-        bw2_bps = parse_bandwidth(bw2)
+        # Get bandwidth from interfaces (parsed at config time)
+        bw1_bps = interface1.bandwidth_bps if interface1.bandwidth else self._get_default_bandwidth_bps(interface1.kind)
+        bw2_bps = interface2.bandwidth_bps if interface2.bandwidth else self._get_default_bandwidth_bps(interface2.kind)
         
         # Use minimum bandwidth
         min_bw_bps = min(bw1_bps, bw2_bps) if bw1_bps > 0 and bw2_bps > 0 else max(bw1_bps, bw2_bps)
         
         # Convert back to human readable format
-        if min_bw_bps >= 1_000_000_000:
-            return f"{min_bw_bps // 1_000_000_000}Gbps"
-        elif min_bw_bps >= 1_000_000:
-            return f"{min_bw_bps // 1_000_000}Mbps"
-        elif min_bw_bps >= 1_000:
-            return f"{min_bw_bps // 1_000}Kbps"
-        else:
-            return f"{min_bw_bps}bps"
-    
-    def _get_default_bandwidth(self, interface_name: str) -> str:
-        """Get default bandwidth based on interface type."""
-        interface_lower = interface_name.lower()
-        
-        if 'gi' in interface_lower or 'gigabit' in interface_lower:
-            return "1000Mbps"
-        elif 'fa' in interface_lower or 'fast' in interface_lower:
-            return "100Mbps"
-        elif 'et' in interface_lower or 'ethernet' in interface_lower:
-            return "10Mbps"
-        else:
-            return self.config_parser.config.get('device_defaults', {}).get('router', {}).get('default_bandwidth', '1000Mbps')
+        return _format_bandwidth(min_bw_bps)
     
-    def _discover_subnets(self, devices: List[NetworkDevice]) -> Dict[str, List[str]]:
+    def _get_default_bandwidth_bps(self, kind: InterfaceKind) -> int:
+        """Get default bandwidth in bps based on interface kind."""
+        bandwidth_bps = _DEFAULT_BPS_BY_KIND.get(kind)
+        if bandwidth_bps is None:
+            bandwidth_bps = parse_bandwidth(
+                self.config_parser.config.get('device_defaults', {}).get('router', {}).get('default_bandwidth', '1000Mbps')
+            )
+        return bandwidth_bps
+    
+    def _discover_subnets(self, devices: List[NetworkDevice],
+                          subnet_groups: Optional[Dict[str, List[Tuple[NetworkDevice, Interface]]]] = None
+                          ) -> Dict[str, List[str]]:
         """
         Discover network subnets and which devices are connected to them.
         
         Args:
             devices: List of network devices
+            subnet_groups: Precomputed result of _group_interfaces_by_subnet
             
         Returns:
             Dictionary mapping subnet to list of connected devices
         """
-        subnets = {}
+        if subnet_groups is None:
+            subnet_groups = self._group_interfaces_by_subnet(devices)
         
-        for device in devices:
-            for interface in device.interfaces:
-                if interface.ip_address and interface.subnet_mask:
-                    subnet = calculate_subnet(interface.ip_address, interface.subnet_mask)
-                    if subnet:
-                        subnet_str = str(subnet)
-                        if subnet_str not in subnets:
-                            subnets[subnet_str] = []
-                        if device.name not in subnets[subnet_str]:
-                            subnets[subnet_str].append(device.name)
-        
-        return subnets
+        return {
+            subnet_str: list(dict.fromkeys(device.name for device, _ in members))
+            for subnet_str, members in subnet_groups.items()
+        }
     
     def save_topology(self, topology: NetworkTopology, output_file: str):
         """
@@ -386,7 +639,7 @@ class TopologyBuilder:
         # Convert to serializable format
         topology_dict = {
             'devices': [self._device_to_dict(device) for device in topology.devices],
-            'links': [asdict(link) for link in topology.links],
+            'links': [self._dataclass_to_json(link) for link in topology.links],
             'subnets': topology.subnets,
             'statistics': {
                 'total_devices': len(topology.devices),
@@ -396,8 +649,12 @@ class TopologyBuilder:
             }
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(topology_dict, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(topology_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(topology_dict, f, indent=2)
         
         logger.info(f"Topology saved to {output_file}")
     
@@ -408,14 +665,18 @@ class TopologyBuilder:
             'device_type': device.device_type,
             'hostname': device.hostname,
             'interfaces': [self._interface_to_dict(interface) for interface in device.interfaces],
-            'routing_protocols': [asdict(rp) for rp in device.routing_protocols],
+            'routing_protocols': [self._dataclass_to_json(rp) for rp in device.routing_protocols],
             'vlans': device.vlans,
             'config_file': device.config_file
         }
     
+    def _dataclass_to_json(self, obj):
+        """Prepare a plain dataclass for JSON; orjson serializes dataclasses natively."""
+        return obj if orjson is not None else _shallow_asdict(obj)
+    
     def _interface_to_dict(self, interface: Interface) -> Dict[str, Any]:
-        """Convert Interface to dictionary."""
-        return asdict(interface)
+        """Convert Interface to dictionary (cached lowercase forms and kind are left out)."""
+        return _shallow_asdict(interface)
     
     def _get_device_type_counts(self, devices: List[NetworkDevice]) -> Dict[str, int]:
         """Get count of each device type."""
@@ -429,19 +690,218 @@ class TopologyBuilder:
         """Get NetworkX graph representation."""
         return self.graph
     
+    def _get_igraph(self):
+        """Get the igraph copy of the topology graph, or None if igraph is not installed."""
+        if igraph is None:
+            return None
+        if self._ig is None:
+            self._ig_names = list(self.graph.nodes())
+            self._ig_ids = {name: vid for vid, name in enumerate(self._ig_names)}
+            self._ig = igraph.Graph(
+                n=len(self._ig_names),
+                edges=[(self._ig_ids[u], self._ig_ids[v]) for u, v in self.graph.edges()]
+            )
+        return self._ig
+    
+    def _to_csr(self):
+        """Rebuild the CSR adjacency arrays from the topology graph."""
+        names = list(self.graph.nodes())
+        ids = {name: node_id for node_id, name in enumerate(names)}
+        n = len(names)
+        m = self.graph.number_of_edges()
+        
+        edges_u = np.fromiter((ids[u] for u, _ in self.graph.edges()), dtype=np.int32, count=m)
+        edges_v = np.fromiter((ids[v] for _, v in self.graph.edges()), dtype=np.int32, count=m)
+        
+        # Store both directions of each undirected edge
+        src = np.concatenate((edges_u, edges_v))
+        dst = np.concatenate((edges_v, edges_u))
+        
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        
+        self._csr_indptr = indptr
+        self._csr_indices = dst[np.argsort(src, kind='stable')]
+        self._csr_names = np.array(names, dtype=object)
+        self._csr_ids = ids
+    
+    def _bfs_levels(self, source_id: int) -> np.ndarray:
+        """Hop count per node from a source, -1 where unreachable."""
+        return self._bfs_tree(source_id)[0]
+    
+    def _bfs_tree(self, source_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Level-synchronous BFS over the CSR adjacency.
+        
+        Args:
+            source_id: CSR id of the start node
+            
+        Returns:
+            Tuple of int32 hop count per node (-1 where unreachable) and
+            int32 BFS predecessor per node (-1 for the source and unreachable nodes)
+        """
+        indptr = self._csr_indptr
+        indices = self._csr_indices
+        dist = np.full(indptr.size - 1, -1, dtype=np.int32)
+        pred = np.full(indptr.size - 1, -1, dtype=np.int32)
+        dist[source_id] = 0
+        frontier = np.array([source_id], dtype=np.int64)
+        level = 0
+        
+        while frontier.size:
+            level += 1
+            starts = indptr[frontier]
+            lengths = indptr[frontier + 1] - starts
+            total = int(lengths.sum())
+            if not total:
+                break
+            
+            # Gather all neighbor slices of the frontier in one shot
+            offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(total)
+            neighbors = indices[offsets]
+            owners = np.repeat(frontier, lengths)
+            fresh = dist[neighbors] < 0
+            
+            # First frontier node reaching each new node becomes its predecessor
+            frontier, first = np.unique(neighbors[fresh], return_index=True)
+            pred[frontier] = owners[fresh][first]
+            dist[frontier] = level
+        
+        return dist, pred
+    
+    def _bfs_predecessors(self, source_id: int) -> np.ndarray:
+        """
+        Get the BFS predecessor array for a source, cached per graph version.
+        
+        Args:
+            source_id: CSR id of the start node
+            
+        Returns:
+            int32 predecessor per node, -1 for the source and unreachable nodes
+        """
+        if self._bfs_cache_version != self._graph_version:
+            self._bfs_cache.clear()
+            self._bfs_cache_version = self._graph_version
+        
+        pred = self._bfs_cache.get(source_id)
+        if pred is not None:
+            self._bfs_cache.move_to_end(source_id)
+            return pred
+        
+        pred = self._bfs_tree(source_id)[1]
+        self._bfs_cache[source_id] = pred
+        if len(self._bfs_cache) > BFS_CACHE_SIZE:
+            self._bfs_cache.popitem(last=False)
+        return pred
+    
+    def bfs(self, source: str) -> List[str]:
+        """
+        Breadth-first traversal from a device.
+        
+        Args:
+            source: Start device name
+            
+        Returns:
+            Reachable device names ordered by hop count
+        """
+        source_id = self._csr_ids.get(source)
+        if source_id is None:
+            return []
+        
+        dist = self._bfs_levels(source_id)
+        reachable = np.flatnonzero(dist >= 0)
+        order = reachable[np.argsort(dist[reachable], kind='stable')]
+        return self._csr_names[order].tolist()
+    
+    def diameter(self) -> int:
+        """
+        Network diameter computed over the CSR adjacency.
+        
+        Returns:
+            Longest shortest path in hops, 0 for an empty graph, -1 if not connected
+        """
+        n = self._csr_indptr.size - 1
+        if n == 0:
+            return 0
+        
+        longest = 0
+        for node_id in range(n):
+            dist = self._bfs_levels(node_id)
+            if (dist < 0).any():
+                return -1
+            longest = max(longest, int(dist.max()))
+        return longest
+    
     def find_shortest_path(self, source: str, target: str) -> Optional[List[str]]:
         """Find shortest path between two devices."""
-        try:
-            return nx.shortest_path(self.graph, source, target)
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
+        source_id = self._csr_ids.get(source)
+        target_id = self._csr_ids.get(target)
+        if source_id is None or target_id is None:
             return None
+        
+        # Chase predecessors back from the target; repeat queries from the
+        # same source reuse its cached BFS
+        pred = self._bfs_predecessors(source_id)
+        path = [target_id]
+        while path[-1] != source_id:
+            previous = int(pred[path[-1]])
+            if previous < 0:
+                return None
+            path.append(previous)
+        
+        return self._csr_names[path[::-1]].tolist()
     
     def get_network_diameter(self) -> int:
         """Get network diameter (longest shortest path)."""
         if not self.graph.nodes():
             return 0
-        try:
-            return nx.diameter(self.graph)
-        except nx.NetworkXError:
+        
+        ig = self._get_igraph()
+        if ig is not None:
             # Graph is not connected
-            return -1
\ No newline at end of file
+            if not ig.is_connected():
+                return -1
+            return int(ig.diameter(directed=False))
+        
+        return self.diameter()
+
+
+# Device lists and lookups owned by each discovery worker process, set once by
+# _init_discovery_worker
+_worker_discovery: Optional[Tuple[_LinkIndexes, List[NetworkDevice], List[NetworkDevice],
+                                  List[NetworkDevice], Dict[int, Tuple[int, int]]]] = None
+
+
+def _init_discovery_worker(indexes: _LinkIndexes, devices: List[NetworkDevice]):
+    """Keep the parent's lookups and devices in the worker process for every job."""
+    global _worker_discovery
+    routers, switches, pcs = _devices_by_type(devices)
+    # id(interface) -> (device position, interface position) in the parent's devices list
+    positions = {id(interface): (device_pos, interface_pos)
+                 for device_pos, device in enumerate(devices)
+                 for interface_pos, interface in enumerate(device.interfaces)}
+    _worker_discovery = (indexes, routers, switches, pcs, positions)
+
+
+def _discover_in_worker(phase: str, start: int, stop: int) -> List[Tuple[int, int, int, int]]:
+    """
+    Run one chunk of a hierarchical discovery phase in a worker process.
+    
+    Args:
+        phase: 'switch_router', 'pc_switch' or 'switch_switch'
+        start: First index of the chunk in the phase's outer device list
+        stop: End of the chunk
+        
+    Returns:
+        Candidate links as (device1, interface1, device2, interface2) positions
+        in the parent's devices list and those devices' interface lists
+    """
+    indexes, routers, switches, pcs, positions = _worker_discovery
+    if phase == 'switch_router':
+        candidates = _links_switch_router(indexes, switches[start:stop], routers)
+    elif phase == 'pc_switch':
+        candidates = _links_pc_switch(indexes, pcs[start:stop], switches)
+    else:
+        candidates = _links_switch_switch(indexes, switches[start:stop], switches[start + 1:])
+    return [positions[id(interface1)] + positions[id(interface2)]
+            for _, interface1, _, interface2 in candidates]
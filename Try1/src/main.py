@@ -20,9 +20,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.topology_builder import TopologyBuilder
 from src.core.config_parser import ConfigParser
-from src.core.network_analyzer import NetworkAnalyzer
-from src.simulation.simulator import NetworkSimulator
-from src.validation.config_validator import ConfigValidator
 from src.utils.logger import setup_logger
 
 
@@ -64,12 +61,15 @@ def cli(config_dir: str, output: Optional[str], analyze: bool,
         
         # Parse configuration files
         logger.info(f"Parsing configuration files from: {config_dir}")
-        devices = config_parser.parse_directory(config_dir)
+        devices = config_parser.parse_directory_list(config_dir)
         logger.info(f"Found {len(devices)} network devices")
         
         # Build topology
         logger.info("Building network topology")
-        topology = topology_builder.build_topology(devices)
+        # Only the saved topology, analysis and visualization read the subnet map
+        topology = topology_builder.build_topology(
+            devices, need_subnets=bool(output or analyze or visualize)
+        )
         
         # Save topology if output specified
         if output:
@@ -79,6 +79,7 @@ def cli(config_dir: str, output: Optional[str], analyze: bool,
         # Perform analysis if requested
         if analyze:
             logger.info("Performing network analysis")
+            from src.core.network_analyzer import NetworkAnalyzer
             analyzer = NetworkAnalyzer(config_parser.config)
             analysis_results = analyzer.analyze_network(topology, devices)
             
@@ -92,6 +93,7 @@ def cli(config_dir: str, output: Optional[str], analyze: bool,
         # Run validation if requested
         if validate:
             logger.info("Validating network configurations")
+            from src.validation.config_validator import ConfigValidator
             validator = ConfigValidator(config_parser.config)
             validation_results = validator.validate_all(devices, topology)
             validator.print_validation_results(validation_results)
@@ -99,6 +101,7 @@ def cli(config_dir: str, output: Optional[str], analyze: bool,
         # Run simulation if requested
         if simulate:
             logger.info(f"Running {scenario} simulation")
+            from src.simulation.simulator import NetworkSimulator
             simulator = NetworkSimulator(config_parser.config)
             simulation_results = simulator.run_simulation(topology, devices, scenario)
             simulator.print_simulation_results(simulation_results)
@@ -2,25 +2,138 @@
 Inter-Process Communication manager for network simulation.
 """
 
+import sys
 import threading
 import time
 import queue
-from typing import Dict, List, Any, Optional, Set, Tuple
-from dataclasses import dataclass
+import heapq
+import itertools
+import random
+import numpy as np
+from typing import Dict, List, Any, Optional, Set, Tuple, FrozenSet
+from dataclasses import dataclass, field
 from loguru import logger
 
+# Maximum number of queued messages the processor drains per wakeup
+MESSAGE_BATCH_SIZE = 64
+
+# Maximum number of spare IPCMessage wrappers kept for reuse
+MESSAGE_POOL_SIZE = 1024
+
+# Default simulated link latency in seconds, used when simulation.link_latency is not set
+DEFAULT_LINK_LATENCY = 0.001
+
+
+class _AtomicCounter:
+    """Counter whose increments are a single C-level next() on itertools.count.
+    
+    Incrementing needs no lock. Reading also advances the underlying count,
+    so reads are serialized and the number of reads so far is subtracted.
+    """
+    __slots__ = ('_count', '_reads', '_read_lock')
+    
+    def __init__(self):
+        self._count = itertools.count()
+        self._reads = 0
+        self._read_lock = threading.Lock()
+    
+    def increment(self):
+        next(self._count)
+    
+    @property
+    def value(self) -> int:
+        with self._read_lock:
+            value = next(self._count) - self._reads
+            self._reads += 1
+        return value
+
+
+class LinkPropertyTable:
+    """Column-oriented (structure-of-arrays) store of per-link simulation properties."""
+    
+    def __init__(self, capacity: int = 64):
+        self.latency = np.zeros(capacity, dtype=np.float64)
+        self.packet_loss = np.zeros(capacity, dtype=np.float64)
+        self.enabled = np.zeros(capacity, dtype=bool)
+        self.count = 0
+    
+    def add(self, latency: float, packet_loss: float, enabled: bool = True) -> int:
+        """Append a link and return its id, growing the arrays as needed."""
+        if self.count == len(self.latency):
+            capacity = 2 * len(self.latency)
+            self.latency = np.resize(self.latency, capacity)
+            self.packet_loss = np.resize(self.packet_loss, capacity)
+            self.enabled = np.resize(self.enabled, capacity)
+        
+        link_id = self.count
+        self.set(link_id, latency, packet_loss, enabled)
+        self.count += 1
+        return link_id
+    
+    def set(self, link_id: int, latency: float, packet_loss: float, enabled: bool = True):
+        """Overwrite all properties of an existing link."""
+        self.latency[link_id] = latency
+        self.packet_loss[link_id] = packet_loss
+        self.enabled[link_id] = enabled
+    
+    def clear(self):
+        """Forget all links, keeping the allocated arrays."""
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return self.count
+
 
 @dataclass
 class Connection:
-    """Represents a connection between two network nodes."""
+    """Represents a connection between two network nodes.
+    
+    Latency, packet loss and the enabled flag live in the manager's
+    LinkPropertyTable under link_id, so they can be updated in bulk.
+    """
     node1: str
     node2: str
     interface1: str
     interface2: str
-    enabled: bool = True
+    link_id: int
+    links: LinkPropertyTable = field(repr=False, compare=False)
     bandwidth: Optional[str] = None
-    latency: float = 0.001  # 1ms default latency
-    packet_loss: float = 0.0  # No packet loss by default
+    # Per-link generator so loss checks don't contend on the global RNG
+    rng: random.Random = field(default_factory=random.Random, init=False, repr=False, compare=False)
+    
+    @property
+    def enabled(self) -> bool:
+        return bool(self.links.enabled[self.link_id])
+    
+    @enabled.setter
+    def enabled(self, value: bool):
+        self.links.enabled[self.link_id] = value
+    
+    @property
+    def latency(self) -> float:
+        return self.links.latency.item(self.link_id)
+    
+    @latency.setter
+    def latency(self, value: float):
+        self.links.latency[self.link_id] = value
+    
+    @property
+    def packet_loss(self) -> float:
+        return self.links.packet_loss.item(self.link_id)
+    
+    @packet_loss.setter
+    def packet_loss(self, value: float):
+        self.links.packet_loss[self.link_id] = value
+
+
+@dataclass(slots=True)
+class IPCMessage:
+    """A message in flight between two nodes, recycled through a pool."""
+    source: str
+    target: str
+    message: Optional[Dict[str, Any]]
+    timestamp: float
+    connection: Optional[Connection]
 
 
 class IPCManager:
@@ -30,24 +143,42 @@ class IPCManager:
         """Initialize IPC manager."""
         self.config = config
         self.timeout = config.get('ipc_timeout', 5000) / 1000.0  # Convert to seconds
+        # Base latency of every link; 0 delivers messages inline unless a link is given loss
+        self.link_latency = config.get('link_latency', DEFAULT_LINK_LATENCY)
         
-        # Connection management
-        self.connections: Dict[Tuple[str, str], Connection] = {}
-        self.node_queues: Dict[str, queue.Queue] = {}
+        # Connection management, keyed by the unordered pair of node names
+        self.connections: Dict[FrozenSet[str], Connection] = {}
+        # Enabled neighbors per node, so lookups don't scan every connection
+        self.adjacency: Dict[str, Set[str]] = {}
+        self.disabled_edges: Set[FrozenSet[str]] = set()
+        self.link_properties = LinkPropertyTable()
+        self.node_instances: Dict[str, Any] = {}
         self.message_stats = {
-            'sent': 0,
-            'delivered': 0,
-            'dropped': 0,
-            'queued': 0
+            'sent': _AtomicCounter(),
+            'delivered': _AtomicCounter(),
+            'dropped': _AtomicCounter(),
+            'queued': _AtomicCounter()
         }
         
+        # Connections with latency or loss to simulate; while zero, every
+        # message is delivered inline and the worker threads are not started
+        self._has_delay = 0
+        
         # Threading
         self.running = False
         self.worker_thread = None
-        self.lock = threading.RLock()
+        self.timer_thread = None
+        self.lock = threading.Lock()  # Never re-entered; keep critical sections short
         
         # Message processing
         self.message_queue = queue.Queue()
+        self._message_pool = queue.SimpleQueue()
+        
+        # Messages waiting out their link latency, as (deliver_at, seq, target, message);
+        # deadlines are time.monotonic() values
+        self.delay_heap: List[Tuple[float, int, str, Dict[str, Any]]] = []
+        self.delay_condition = threading.Condition()
+        self._delay_seq = itertools.count()
         
         self.start()
     
@@ -57,15 +188,43 @@ class IPCManager:
             return
         
         self.running = True
+        if self._has_delay:
+            self._start_workers()
+        logger.debug("IPC Manager started")
+    
+    def _start_workers(self):
+        """Start the message processor and timer threads if not running."""
+        if not self.running or (self.worker_thread and self.worker_thread.is_alive()):
+            return
+        
         self.worker_thread = threading.Thread(target=self._message_processor, daemon=True)
         self.worker_thread.start()
-        logger.debug("IPC Manager started")
+        self.timer_thread = threading.Thread(target=self._timer_processor, daemon=True)
+        self.timer_thread.start()
+        logger.debug("IPC Manager workers started")
+    
+    @staticmethod
+    def _is_delayed(connection: Connection) -> bool:
+        """Check whether a connection has latency or loss to simulate."""
+        return bool(connection.latency or connection.packet_loss)
+    
+    def _track_delay(self, was_delayed: bool, connection: Connection):
+        """Update the delayed-connection count after a connection changes."""
+        is_delayed = self._is_delayed(connection)
+        if is_delayed != was_delayed:
+            self._has_delay += 1 if is_delayed else -1
+        if is_delayed:
+            self._start_workers()
     
     def stop(self):
         """Stop the IPC manager."""
         self.running = False
-        if self.worker_thread and self.worker_thread.is_alive():
-            self.worker_thread.join(timeout=1.0)
+        with self.delay_condition:
+            self.delay_condition.notify_all()
+        
+        for thread in (self.worker_thread, self.timer_thread):
+            if thread and thread.is_alive():
+                thread.join(timeout=1.0)
     
     def cleanup(self):
         """Clean up IPC resources."""
@@ -73,14 +232,21 @@ class IPCManager:
         
         with self.lock:
             self.connections.clear()
-            self.node_queues.clear()
-            
-            # Clear all queues
-            while not self.message_queue.empty():
-                try:
-                    self.message_queue.get_nowait()
-                except queue.Empty:
-                    break
+            self.adjacency.clear()
+            self.disabled_edges.clear()
+            self.node_instances.clear()
+            self.link_properties.clear()
+            self._has_delay = 0
+        
+        # Clear all queues
+        while not self.message_queue.empty():
+            try:
+                self.message_queue.get_nowait()
+            except queue.Empty:
+                break
+        
+        with self.delay_condition:
+            self.delay_heap.clear()
     
     def create_connection(self, node1: str, node2: str, interface1: str, interface2: str, **kwargs):
         """
@@ -93,35 +259,42 @@ class IPCManager:
             interface2: Interface on second node
             **kwargs: Additional connection parameters
         """
+        # Names are dict/set keys on every send; interned copies compare by identity
+        node1, node2 = sys.intern(node1), sys.intern(node2)
+        interface1, interface2 = sys.intern(interface1), sys.intern(interface2)
+        
+        latency = kwargs.get('latency', self.link_latency)
+        packet_loss = kwargs.get('packet_loss', 0.0)
+        
         with self.lock:
-            # Create bidirectional connection entries
-            conn_key1 = (node1, node2)
-            conn_key2 = (node2, node1)
+            # One entry serves both directions; re-creating a link reuses its slot
+            conn_key = frozenset((node1, node2))
+            previous = self.connections.get(conn_key)
+            if previous is not None:
+                was_delayed = self._is_delayed(previous)
+                link_id = previous.link_id
+                self.link_properties.set(link_id, latency, packet_loss)
+            else:
+                was_delayed = False
+                link_id = self.link_properties.add(latency, packet_loss)
             
             connection = Connection(
                 node1=node1,
                 node2=node2,
                 interface1=interface1,
                 interface2=interface2,
-                bandwidth=kwargs.get('bandwidth'),
-                latency=kwargs.get('latency', 0.001),
-                packet_loss=kwargs.get('packet_loss', 0.0)
+                link_id=link_id,
+                links=self.link_properties,
+                bandwidth=kwargs.get('bandwidth')
             )
-            
-            self.connections[conn_key1] = connection
-            self.connections[conn_key2] = connection
-            
-            # Ensure node queues exist
-            self._ensure_node_queue(node1)
-            self._ensure_node_queue(node2)
+            self.connections[conn_key] = connection
+            self._track_delay(was_delayed, connection)
+            self.disabled_edges.discard(conn_key)
+            self.adjacency.setdefault(node1, set()).add(node2)
+            self.adjacency.setdefault(node2, set()).add(node1)
             
             logger.debug(f"Created connection: {node1}:{interface1} <-> {node2}:{interface2}")
     
-    def _ensure_node_queue(self, node_name: str):
-        """Ensure message queue exists for node."""
-        if node_name not in self.node_queues:
-            self.node_queues[node_name] = queue.Queue(maxsize=100)
-    
     def send_message(self, source: str, target: str, message: Dict[str, Any]):
         """
         Send message from source to target node.
@@ -135,30 +308,53 @@ class IPCManager:
             return False
         
         # Check if connection exists and is enabled
-        conn_key = (source, target)
-        connection = self.connections.get(conn_key)
+        connection = self.connections.get(frozenset((source, target)))
         
         if not connection or not connection.enabled:
-            self.message_stats['dropped'] += 1
+            self.message_stats['dropped'].increment()
             return False
         
+        # Nothing to simulate on this link, so hand the message over directly
+        if not self._has_delay or not self._is_delayed(connection):
+            self.message_stats['sent'].increment()
+            self._deliver_message(target, message)
+            return True
+        
         # Add message to processing queue
-        ipc_message = {
-            'source': source,
-            'target': target,
-            'message': message,
-            'timestamp': time.time(),
-            'connection': connection
-        }
+        ipc_message = self._acquire_message(source, target, message, connection)
         
         try:
             self.message_queue.put_nowait(ipc_message)
-            self.message_stats['sent'] += 1
+            self.message_stats['sent'].increment()
             return True
         except queue.Full:
-            self.message_stats['dropped'] += 1
+            self._release_message(ipc_message)
+            self.message_stats['dropped'].increment()
             return False
     
+    def _acquire_message(self, source: str, target: str, message: Dict[str, Any],
+                         connection: Connection) -> IPCMessage:
+        """Take a message wrapper from the pool, or create one if it is empty."""
+        try:
+            ipc_message = self._message_pool.get_nowait()
+        except queue.Empty:
+            return IPCMessage(source, target, message, time.monotonic(), connection)
+        
+        ipc_message.source = source
+        ipc_message.target = target
+        ipc_message.message = message
+        ipc_message.timestamp = time.monotonic()
+        ipc_message.connection = connection
+        return ipc_message
+    
+    def _release_message(self, ipc_message: IPCMessage):
+        """Return a message wrapper to the pool."""
+        if self._message_pool.qsize() < MESSAGE_POOL_SIZE:
+            # Drop references so pooled wrappers don't keep payloads alive
+            ipc_message.message = None
+            ipc_message.connection = None
+            self._message_pool.put(ipc_message)
+    
     def broadcast_from_node(self, source: str, message: Dict[str, Any]):
         """
         Broadcast message from source to all connected neighbors.
@@ -182,14 +378,8 @@ class IPCManager:
         Returns:
             List of neighbor node names
         """
-        neighbors = []
-        
         with self.lock:
-            for (source, target), connection in self.connections.items():
-                if source == node and connection.enabled:
-                    neighbors.append(target)
-        
-        return neighbors
+            return list(self.adjacency.get(node, ()))
     
     def disable_connection(self, node1: str, node2: str):
         """
@@ -200,13 +390,13 @@ class IPCManager:
             node2: Second node
         """
         with self.lock:
-            conn_key1 = (node1, node2)
-            conn_key2 = (node2, node1)
-            
-            if conn_key1 in self.connections:
-                self.connections[conn_key1].enabled = False
-            if conn_key2 in self.connections:
-                self.connections[conn_key2].enabled = False
+            conn_key = frozenset((node1, node2))
+            connection = self.connections.get(conn_key)
+            if connection:
+                connection.enabled = False
+                self.disabled_edges.add(conn_key)
+                self.adjacency[node1].discard(node2)
+                self.adjacency[node2].discard(node1)
             
             logger.debug(f"Disabled connection: {node1} <-> {node2}")
     
@@ -219,139 +409,157 @@ class IPCManager:
             node2: Second node
         """
         with self.lock:
-            conn_key1 = (node1, node2)
-            conn_key2 = (node2, node1)
-            
-            if conn_key1 in self.connections:
-                self.connections[conn_key1].enabled = True
-            if conn_key2 in self.connections:
-                self.connections[conn_key2].enabled = True
+            conn_key = frozenset((node1, node2))
+            connection = self.connections.get(conn_key)
+            if connection:
+                connection.enabled = True
+                self.disabled_edges.discard(conn_key)
+                self.adjacency[node1].add(node2)
+                self.adjacency[node2].add(node1)
             
             logger.debug(f"Enabled connection: {node1} <-> {node2}")
     
     def enable_all_connections(self):
         """Enable all connections."""
         with self.lock:
-            for connection in self.connections.values():
-                connection.enabled = True
+            links = self.link_properties
+            links.enabled[:links.count] = True
+            for conn_key in self.disabled_edges:
+                connection = self.connections[conn_key]
+                self.adjacency[connection.node1].add(connection.node2)
+                self.adjacency[connection.node2].add(connection.node1)
+            self.disabled_edges.clear()
             logger.debug("Enabled all connections")
     
     def _message_processor(self):
         """Process messages in background thread."""
         while self.running:
             try:
-                # Get message with timeout
-                ipc_message = self.message_queue.get(timeout=0.1)
-                self._process_message(ipc_message)
-                self.message_queue.task_done()
-                
+                # Block for the first message, then take whatever else is ready
+                batch = [self.message_queue.get(timeout=0.1)]
             except queue.Empty:
                 continue
-            except Exception as e:
-                logger.error(f"Error processing message: {e}")
+            
+            while len(batch) < MESSAGE_BATCH_SIZE:
+                try:
+                    batch.append(self.message_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # One clock read serves the whole batch
+            now = time.monotonic()
+            for ipc_message in batch:
+                try:
+                    self._process_message(ipc_message, now)
+                except Exception as e:
+                    logger.error(f"Error processing message: {e}")
+                finally:
+                    self.message_queue.task_done()
     
-    def _process_message(self, ipc_message: Dict[str, Any]):
-        """Process individual message."""
-        source = ipc_message['source']
-        target = ipc_message['target']
-        message = ipc_message['message']
-        connection = ipc_message['connection']
-        
-        # Simulate network latency
-        if connection.latency > 0:
-            time.sleep(connection.latency)
+    def _process_message(self, ipc_message: IPCMessage, now: float):
+        """Process individual message received at monotonic time now."""
+        target = ipc_message.target
+        message = ipc_message.message
+        connection = ipc_message.connection
+        self._release_message(ipc_message)
         
         # Simulate packet loss
-        if connection.packet_loss > 0:
-            import random
-            if random.random() < connection.packet_loss:
-                self.message_stats['dropped'] += 1
-                return
+        if connection.packet_loss and connection.rng.random() < connection.packet_loss:
+            self.message_stats['dropped'].increment()
+            return
+        
+        # Simulate network latency by scheduling delivery on the timer thread
+        if connection.latency > 0:
+            deliver_at = now + connection.latency
+            with self.delay_condition:
+                heapq.heappush(self.delay_heap, (deliver_at, next(self._delay_seq), target, message))
+                self.delay_condition.notify()
+            return
         
         # Deliver message to target node
         self._deliver_message(target, message)
     
+    def _timer_processor(self):
+        """Deliver delayed messages once their latency has elapsed."""
+        while True:
+            with self.delay_condition:
+                while self.running and not self.delay_heap:
+                    self.delay_condition.wait()
+                if not self.running:
+                    return
+                
+                # Sleep only until the earliest deadline (or a new, earlier message)
+                wait_time = self.delay_heap[0][0] - time.monotonic()
+                if wait_time > 0:
+                    self.delay_condition.wait(timeout=wait_time)
+                    continue
+                
+                now = time.monotonic()
+                ready = []
+                while self.delay_heap and self.delay_heap[0][0] <= now:
+                    ready.append(heapq.heappop(self.delay_heap))
+            
+            for _, _, target, message in ready:
+                self._deliver_message(target, message)
+    
     def _deliver_message(self, target: str, message: Dict[str, Any]):
         """Deliver message to target node."""
         with self.lock:
-            if target not in self.node_queues:
-                self.message_stats['dropped'] += 1
-                return
-            
-            target_queue = self.node_queues[target]
+            node_instance = self.node_instances.get(target)
+        
+        if node_instance is None:
+            self.message_stats['dropped'].increment()
+            return
         
         try:
-            target_queue.put_nowait(message)
-            self.message_stats['delivered'] += 1
-        except queue.Full:
-            self.message_stats['dropped'] += 1
+            node_instance.receive_message(message)
+            self.message_stats['delivered'].increment()
+        except Exception as e:
+            self.message_stats['dropped'].increment()
+            logger.error(f"Error delivering message to {target}: {e}")
     
     def register_node(self, node_name: str, node_instance):
         """
         Register a node instance for message delivery.
         
+        Messages are handed to the node's receive_message method directly,
+        so no per-node thread is started.
+        
         Args:
             node_name: Node name
             node_instance: Node instance with receive_message method
         """
         with self.lock:
-            self._ensure_node_queue(node_name)
-            
-            # Start message delivery thread for this node
-            delivery_thread = threading.Thread(
-                target=self._node_message_delivery,
-                args=(node_name, node_instance),
-                daemon=True
-            )
-            delivery_thread.start()
-    
-    def _node_message_delivery(self, node_name: str, node_instance):
-        """Deliver messages to specific node."""
-        node_queue = self.node_queues[node_name]
-        
-        while self.running:
-            try:
-                message = node_queue.get(timeout=0.1)
-                
-                # Deliver to node instance
-                if hasattr(node_instance, 'receive_message'):
-                    node_instance.receive_message(message)
-                
-                node_queue.task_done()
-                
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.error(f"Error delivering message to {node_name}: {e}")
+            self.node_instances[sys.intern(node_name)] = node_instance
     
     def get_connection_info(self, node1: str, node2: str) -> Optional[Connection]:
         """Get connection information between two nodes."""
         with self.lock:
-            return self.connections.get((node1, node2))
+            return self.connections.get(frozenset((node1, node2)))
     
     def get_all_connections(self) -> List[Connection]:
         """Get all connections."""
         with self.lock:
-            # Return unique connections (avoid duplicates from bidirectional entries)
-            unique_connections = {}
-            for connection in self.connections.values():
-                key = tuple(sorted([connection.node1, connection.node2]))
-                unique_connections[key] = connection
-            
-            return list(unique_connections.values())
+            return list(self.connections.values())
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get IPC statistics."""
+        # Counters are read without the manager lock
+        stats = {name: counter.value for name, counter in self.message_stats.items()}
+        
         with self.lock:
-            stats = self.message_stats.copy()
-            stats.update({
-                'active_connections': len(self.get_all_connections()),
-                'enabled_connections': len([c for c in self.connections.values() if c.enabled]) // 2,
-                'registered_nodes': len(self.node_queues),
-                'queued_messages': sum(q.qsize() for q in self.node_queues.values())
-            })
-            
-            return stats
+            active_connections = len(self.connections)
+            disabled_connections = len(self.disabled_edges)
+            registered_nodes = len(self.node_instances)
+        
+        stats.update({
+            'active_connections': active_connections,
+            'enabled_connections': active_connections - disabled_connections,
+            'registered_nodes': registered_nodes,
+            'queued_messages': self.message_queue.qsize()
+        })
+        
+        return stats
     
     def set_connection_properties(self, node1: str, node2: str, **properties):
         """
@@ -363,19 +571,16 @@ class IPCManager:
             **properties: Properties to set (latency, packet_loss, bandwidth)
         """
         with self.lock:
-            conn_key1 = (node1, node2)
-            conn_key2 = (node2, node1)
-            
-            for conn_key in [conn_key1, conn_key2]:
-                if conn_key in self.connections:
-                    connection = self.connections[conn_key]
-                    
-                    if 'latency' in properties:
-                        connection.latency = properties['latency']
-                    if 'packet_loss' in properties:
-                        connection.packet_loss = properties['packet_loss']
-                    if 'bandwidth' in properties:
-                        connection.bandwidth = properties['bandwidth']
+            connection = self.connections.get(frozenset((node1, node2)))
+            if connection:
+                was_delayed = self._is_delayed(connection)
+                if 'latency' in properties:
+                    connection.latency = properties['latency']
+                if 'packet_loss' in properties:
+                    connection.packet_loss = properties['packet_loss']
+                if 'bandwidth' in properties:
+                    connection.bandwidth = properties['bandwidth']
+                self._track_delay(was_delayed, connection)
     
     def simulate_congestion(self, node1: str, node2: str, congestion_level: float):
         """
@@ -387,7 +592,7 @@ class IPCManager:
             congestion_level: Congestion level (0.0 to 1.0)
         """
         # Increase latency and packet loss based on congestion
-        base_latency = 0.001
+        base_latency = self.link_latency
         base_packet_loss = 0.0
         
         new_latency = base_latency * (1 + congestion_level * 10)
@@ -404,8 +609,12 @@ class IPCManager:
     def clear_congestion(self):
         """Clear all congestion simulation."""
         with self.lock:
-            for connection in self.connections.values():
-                connection.latency = 0.001
-                connection.packet_loss = 0.0
+            links = self.link_properties
+            links.latency[:links.count] = self.link_latency
+            links.packet_loss[:links.count] = 0.0
+            # Every link is back on the base latency, so either all or none are delayed
+            self._has_delay = len(self.connections) if self.link_latency else 0
+            if self._has_delay:
+                self._start_workers()
         
         logger.debug("Cleared all congestion simulation")
\ No newline at end of file
@@ -2,14 +2,46 @@
 Network node simulation representing individual devices.
 """
 
+import asyncio
 import threading
 import time
-import queue
+from collections import deque
+from concurrent.futures import CancelledError, TimeoutError as FutureTimeoutError
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 
 from ..core.config_parser import NetworkDevice
 
+# Seconds between periodic tasks (OSPF hellos) on an operational node
+PERIODIC_TASK_INTERVAL = 10
+
+# Simulated device boot time and routing reconvergence wait, in seconds
+BOOT_TIME = 0.5
+RECONVERGENCE_TIME = 1
+
+
+class _NodeEventLoop:
+    """A single asyncio event loop, on one daemon thread, shared by all nodes."""
+    
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the shared loop, starting its thread on first use."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="network-node-loop", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+
+_node_event_loop = _NodeEventLoop()
+
 
 @dataclass
 class NodeStatistics:
@@ -37,10 +69,15 @@ class NetworkNode:
         self.powered_on = False
         self.paused = False
         
-        # Threading
-        self.thread = None
+        # Each started node is a coroutine on the shared node event loop
+        self._loop = None
+        self._task = None
+        self._wakeup = None
         self.stop_event = threading.Event()
-        self.message_queue = queue.Queue()
+        # Single producer (IPC manager) / single consumer (node loop); deque
+        # append/popleft are atomic, so no queue mutex is needed per message
+        self.message_queue = deque()
+        self.message_event = threading.Event()
         
         # Network tables
         self.arp_table = {}  # ip -> mac
@@ -54,22 +91,63 @@ class NetworkNode:
         # Initialize interface states
         for interface in device.interfaces:
             self.interface_states[interface.name] = interface.enabled
+        
+        # Identity values derived from the (immutable) device config
+        self._router_id = self._compute_router_id()
+        self._interface_macs = {
+            interface.name: self._compute_interface_mac(interface.name)
+            for interface in device.interfaces
+        }
+        self._gateway_ips = {
+            interface.name: self._compute_gateway_ip(interface)
+            for interface in device.interfaces
+            if interface.ip_address and interface.subnet_mask
+        }
+        
+        # Outgoing discovery messages are fixed by the same config, so they are
+        # built once; receivers only read them, as with any broadcast
+        self._arp_requests = [
+            (interface.name, {
+                'type': 'arp_request',
+                'source': device.name,
+                'source_ip': interface.ip_address,
+                'target_ip': self._gateway_ips.get(interface.name, '0.0.0.0'),
+                'interface': interface.name
+            })
+            for interface in device.interfaces
+            if interface.ip_address
+        ]
+        self._ospf_hellos = [
+            {
+                'type': 'ospf_hello',
+                'source': device.name,
+                'process_id': rp.process_id,
+                'area': rp.area or '0',
+                'router_id': self._router_id
+            }
+            for rp in device.routing_protocols
+            if rp.protocol == 'ospf'
+        ]
     
     def start(self):
-        """Start the network node thread."""
-        if self.thread and self.thread.is_alive():
+        """Start the network node on the shared node event loop."""
+        if self._task and not self._task.done():
             return
         
         self.stop_event.clear()
-        self.thread = threading.Thread(target=self._run_node_loop, daemon=True)
-        self.thread.start()
-        self.start_time = time.time()
+        self._loop = _node_event_loop.get_loop()
+        self._task = asyncio.run_coroutine_threadsafe(self._run_node_loop(), self._loop)
+        self.start_time = time.monotonic()
     
     def stop(self):
         """Stop the network node."""
         self.stop_event.set()
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=1.0)
+        self._wake()
+        if self._task and not self._task.done():
+            try:
+                self._task.result(timeout=1.0)
+            except (FutureTimeoutError, CancelledError):
+                pass
         self.operational = False
         self.powered_on = False
     
@@ -80,99 +158,113 @@ class NetworkNode:
     def resume(self):
         """Resume node operations."""
         self.paused = False
+        self._wake()
+    
+    def _wake(self):
+        """Wake the node coroutine from any thread."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wakeup.set)
+    
+    async def _wait_for_wakeup(self, timeout: Optional[float]):
+        """Wait until woken (new message, resume, stop) or the timeout elapses."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
     
-    def _run_node_loop(self):
+    async def _run_node_loop(self):
         """Main node processing loop."""
+        self._wakeup = asyncio.Event()
+        
         while not self.stop_event.is_set():
+            self._wakeup.clear()
+            
             if self.paused:
-                time.sleep(0.1)
+                # resume() and stop() both wake the node
+                await self._wait_for_wakeup(None)
                 continue
             
             try:
                 # Process incoming messages
                 self._process_messages()
                 
+                now = time.monotonic()
+                
                 # Perform periodic tasks
                 if self.operational:
-                    self._perform_periodic_tasks()
+                    self._perform_periodic_tasks(now)
                 
                 # Update statistics
-                self._update_statistics()
-                
-                time.sleep(0.1)  # 100ms loop
+                self._update_statistics(now)
                 
             except Exception as e:
                 # Log error but continue running
                 pass
+            
+            # Sleep until the next periodic task is due, or until woken
+            await self._wait_for_wakeup(self._next_periodic_delay(time.monotonic()))
+    
+    def _next_periodic_delay(self, current_time: float) -> Optional[float]:
+        """Seconds until periodic tasks are due, or None if there are none."""
+        if not self.operational:
+            return None
+        return max(0.0, self.statistics.last_activity + PERIODIC_TASK_INTERVAL - current_time)
     
     def _process_messages(self):
         """Process incoming IPC messages."""
-        try:
-            while True:
-                message = self.message_queue.get_nowait()
-                self._handle_message(message)
-                self.statistics.packets_received += 1
-        except queue.Empty:
-            pass
+        # Clear before draining so a message arriving mid-drain re-arms the event
+        self.message_event.clear()
+        message_queue = self.message_queue
+        while message_queue:
+            message = message_queue.popleft()
+            self._handle_message(message)
+            self.statistics.packets_received += 1
     
     def _handle_message(self, message: Dict[str, Any]):
         """Handle incoming network message."""
-        msg_type = message.get('type')
-        
-        if msg_type == 'arp_request':
-            self._handle_arp_request(message)
-        elif msg_type == 'arp_reply':
-            self._handle_arp_reply(message)
-        elif msg_type == 'ospf_hello':
-            self._handle_ospf_hello(message)
-        elif msg_type == 'routing_update':
-            self._handle_routing_update(message)
-        elif msg_type == 'ping':
-            self._handle_ping(message)
-    
-    def _perform_periodic_tasks(self):
-        """Perform periodic network tasks."""
-        current_time = time.time()
-        
+        handler = self._MESSAGE_HANDLERS.get(message.get('type'))
+        if handler is not None:
+            handler(self, message)
+    
+    def _perform_periodic_tasks(self, current_time: float):
+        """Perform periodic network tasks at monotonic time current_time."""
         # Send OSPF hello packets (every 10 seconds)
-        if (current_time - self.statistics.last_activity) > 10:
+        if (current_time - self.statistics.last_activity) >= PERIODIC_TASK_INTERVAL:
             if self.device.device_type == 'router':
                 self._send_ospf_hello_periodic()
             self.statistics.last_activity = current_time
     
-    def _update_statistics(self):
-        """Update node statistics."""
+    def _update_statistics(self, current_time: float):
+        """Update node statistics at monotonic time current_time."""
         if self.start_time:
-            self.statistics.uptime = time.time() - self.start_time
+            self.statistics.uptime = current_time - self.start_time
     
     def power_on(self):
         """Simulate device power-on."""
+        self.begin_power_on()
+        
+        # Start basic services
+        time.sleep(BOOT_TIME)
+        self.set_operational_state(True)
+    
+    def begin_power_on(self):
+        """Power the device and bring up its interfaces, without waiting for boot."""
         self.powered_on = True
         
         # Initialize interfaces
         for interface in self.device.interfaces:
             if interface.enabled:
                 self.interface_states[interface.name] = True
-        
-        # Start basic services
-        time.sleep(0.5)  # Boot time
-        self.operational = True
     
     def perform_arp_discovery(self):
         """Perform ARP discovery for connected networks."""
         if not self.operational:
             return
         
-        for interface in self.device.interfaces:
-            if interface.ip_address and self.interface_states.get(interface.name, False):
+        for interface_name, arp_message in self._arp_requests:
+            if self.interface_states.get(interface_name, False):
                 # Send ARP request for gateway
-                arp_message = {
-                    'type': 'arp_request',
-                    'source': self.device.name,
-                    'source_ip': interface.ip_address,
-                    'target_ip': self._get_gateway_ip(interface),
-                    'interface': interface.name
-                }
                 self._broadcast_message(arp_message)
                 self.statistics.arp_requests_sent += 1
     
@@ -181,17 +273,8 @@ class NetworkNode:
         if not self.operational or self.device.device_type != 'router':
             return
         
-        # Check if OSPF is configured
-        ospf_processes = [rp for rp in self.device.routing_protocols if rp.protocol == 'ospf']
-        
-        for ospf_process in ospf_processes:
-            hello_message = {
-                'type': 'ospf_hello',
-                'source': self.device.name,
-                'process_id': ospf_process.process_id,
-                'area': ospf_process.area or '0',
-                'router_id': self._get_router_id()
-            }
+        # One hello per configured OSPF process
+        for hello_message in self._ospf_hellos:
             self._broadcast_message(hello_message)
             self.statistics.hello_packets_sent += 1
     
@@ -234,7 +317,7 @@ class NetworkNode:
         
         # Simulate routing reconvergence
         self.send_ospf_hello()
-        time.sleep(1)
+        time.sleep(RECONVERGENCE_TIME)
         self.update_routing_table()
     
     def simulate_interface_change(self):
@@ -357,6 +440,10 @@ class NetworkNode:
     
     def _get_gateway_ip(self, interface) -> str:
         """Get gateway IP for interface subnet."""
+        return self._gateway_ips.get(interface.name, '0.0.0.0')
+    
+    def _compute_gateway_ip(self, interface) -> str:
+        """Compute gateway IP for interface subnet."""
         if interface.ip_address and interface.subnet_mask:
             # Simplified - assume .1 is gateway
             ip_parts = interface.ip_address.split('.')
@@ -366,6 +453,10 @@ class NetworkNode:
     
     def _get_router_id(self) -> str:
         """Get router ID (simplified)."""
+        return self._router_id
+    
+    def _compute_router_id(self) -> str:
+        """Compute router ID (simplified)."""
         # Use first interface IP or device name hash
         for interface in self.device.interfaces:
             if interface.ip_address:
@@ -374,6 +465,13 @@ class NetworkNode:
     
     def _get_interface_mac(self, interface_name: str) -> str:
         """Get MAC address for interface (simulated)."""
+        mac = self._interface_macs.get(interface_name)
+        if mac is None:
+            mac = self._compute_interface_mac(interface_name)
+        return mac
+    
+    def _compute_interface_mac(self, interface_name: str) -> str:
+        """Compute MAC address for interface (simulated)."""
         # Generate deterministic MAC based on device and interface
         device_hash = hash(f"{self.device.name}:{interface_name}")
         mac_suffix = f"{device_hash % 0xFFFFFF:06x}"
@@ -398,6 +496,10 @@ class NetworkNode:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get node statistics."""
+        # The loop only runs on events, so bring uptime current while running
+        if self._task and not self._task.done():
+            self._update_statistics(time.monotonic())
+        
         return {
             'packets_sent': self.statistics.packets_sent,
             'packets_received': self.statistics.packets_received,
@@ -412,11 +514,21 @@ class NetworkNode:
     def set_operational_state(self, operational: bool):
         """Set operational state."""
         self.operational = operational
+        # Let the node loop pick up (or drop) its periodic schedule
+        self._wake()
     
     def receive_message(self, message: Dict[str, Any]):
         """Receive message from IPC manager."""
-        try:
-            self.message_queue.put_nowait(message)
-        except queue.Full:
-            # Drop message if queue is full
-            pass
\ No newline at end of file
+        self.message_queue.append(message)
+        if not self.message_event.is_set():
+            self.message_event.set()
+            self._wake()
+    
+    # Message type dispatch table for incoming messages
+    _MESSAGE_HANDLERS = {
+        'arp_request': _handle_arp_request,
+        'arp_reply': _handle_arp_reply,
+        'ospf_hello': _handle_ospf_hello,
+        'routing_update': _handle_routing_update,
+        'ping': _handle_ping,
+    }
\ No newline at end of file
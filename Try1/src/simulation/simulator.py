@@ -3,23 +3,99 @@ Network simulation engine.
 """
 
 import time
+import heapq
+import random
+import itertools
 import threading
-from typing import Dict, List, Any, Optional
+import numpy as np
+from collections import Counter
+from enum import IntEnum
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Any, Optional, Callable, Generator, NamedTuple, Tuple
 from dataclasses import dataclass, field
 from loguru import logger
 
 from ..core.topology_builder import NetworkTopology
 from ..core.config_parser import NetworkDevice
-from .network_node import NetworkNode
+from .network_node import NetworkNode, BOOT_TIME, RECONVERGENCE_TIME
 from .ipc_manager import IPCManager
 
+# Columns of the per-node statistics table; the node name column is sized per run
+_NODE_STATS_FIELDS = [
+    ('packets_sent', np.uint64),
+    ('packets_received', np.uint64),
+    ('hello_packets_sent', np.uint64),
+    ('arp_requests_sent', np.uint64),
+    ('routing_updates', np.uint64),
+    ('uptime', np.float64),
+    ('operational', np.bool_),
+    ('interfaces_up', np.uint32),
+    ('routing_table_size', np.uint32),
+    ('arp_table_size', np.uint32),
+]
+
+# A scenario phase: a generator that yields the simulated seconds to wait
+# before it continues
+SimulationProcess = Generator[float, None, None]
+
+
+class EventType(IntEnum):
+    """Kinds of logged simulation events."""
+    SIMULATION_STARTED = 0
+    PHASE_START = 1
+    DEVICE_STARTUP = 2
+    ARP_DISCOVERY = 3
+    OSPF_HELLO = 4
+    ROUTING_TABLE_UPDATE = 5
+    NETWORK_STABLE = 6
+    LINK_FAILURE = 7
+    RECOVERY_START = 8
+    RECOVERY_COMPLETE = 9
+    CONFIG_CHANGE = 10
+    FAULT_INJECTION = 11
+    
+    @property
+    def label(self) -> str:
+        """Snake-case name, e.g. 'phase_start'."""
+        return self.name.lower()
+
+
+class SimulationEvent(NamedTuple):
+    """A logged simulation event.
+    
+    The message is kept as a str.format template plus arguments and only
+    formatted when read. Also readable by key (event['message'],
+    event.get('device')) like the dicts events used to be.
+    """
+    timestamp: int  # time.monotonic_ns() when logged
+    type: EventType
+    template: str
+    args: Tuple[Any, ...] = ()
+    device: Optional[str] = None
+    
+    @property
+    def message(self) -> str:
+        return self.template.format(*self.args) if self.args else self.template
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
 
 @dataclass
 class SimulationResult:
     """Results from network simulation."""
     scenario: str
     duration: float
-    events: List[Dict[str, Any]] = field(default_factory=list)
+    events: List[SimulationEvent] = field(default_factory=list)
     statistics: Dict[str, Any] = field(default_factory=dict)
     node_states: Dict[str, Any] = field(default_factory=dict)
 
@@ -33,12 +109,35 @@ class NetworkSimulator:
         self.simulation_config = config.get('simulation', {})
         self.max_simulation_time = self.simulation_config.get('max_simulation_time', 300)
         self.thread_pool_size = self.simulation_config.get('thread_pool_size', 10)
+        # Virtual time drains scheduled delays immediately; real time waits them out
+        self.real_time = self.simulation_config.get('enable_real_time', False)
+        # Per-event debug logging is skipped outright unless some sink accepts DEBUG
+        self._debug_enabled = logger._core.min_level <= logger.level("DEBUG").no
+        # Fault injection draws from one generator; a configured seed makes runs reproducible
+        self._rng = random.Random(self.simulation_config.get('seed'))
         
         self.nodes = {}  # device_name -> NetworkNode
+        self._nodes_by_type: Dict[str, List[NetworkNode]] = {}  # device_type -> nodes, in creation order
+        self._ospf_router_nodes: List[NetworkNode] = []
         self.ipc_manager = None
-        self.simulation_running = False
-        self.simulation_paused = False
-        self.events = []
+        self._pool: Optional[ThreadPoolExecutor] = None  # per-node fan-out, one per run
+        # Set while the event loop may proceed (cleared by pause), and set once
+        # the run should end; the loop blocks on these rather than polling
+        self._run_event = threading.Event()
+        self._run_event.set()
+        self._stop_event = threading.Event()
+        self._stop_event.set()
+        self.events: List[SimulationEvent] = []
+        self._event_type_counts: Counter = Counter()
+        
+        # Discrete-event scheduler. Entries are mutable lists
+        # [simulated_time, seq, callback, cancelled, node] so cancelling only
+        # flips a flag; dead entries are skipped and compacted lazily
+        self._event_heap: List[list] = []
+        self._seq = itertools.count()
+        self._now = 0.0
+        self._cancelled_count = 0
+        self._pending_by_node: Dict[str, Dict[int, list]] = {}
         
     def run_simulation(self, topology: NetworkTopology, devices: List[NetworkDevice], scenario: str) -> SimulationResult:
         """
@@ -53,7 +152,7 @@ class NetworkSimulator:
             Simulation results
         """
         logger.info(f"Starting {scenario} simulation")
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
             # Initialize simulation
@@ -61,22 +160,27 @@ class NetworkSimulator:
             
             # Run scenario-specific simulation
             if scenario == 'day1':
-                self._run_day1_scenario()
+                self._start_process(self._run_day1_scenario())
             elif scenario == 'day2':
-                self._run_day2_scenario()
+                self._start_process(self._run_day2_scenario())
             else:
                 raise ValueError(f"Unknown scenario: {scenario}")
+            self._run_events()
             
             # Collect results
-            end_time = time.time()
-            duration = end_time - start_time
+            duration = (time.monotonic_ns() - start_ns) / 1e9
+            
+            statistics = self._collect_statistics()
+            node_states = self._collect_node_states()
             
+            # The result takes over the event list rather than a copy of it
+            events, self.events = self.events, []
             result = SimulationResult(
                 scenario=scenario,
                 duration=duration,
-                events=self.events.copy(),
-                statistics=self._collect_statistics(),
-                node_states=self._collect_node_states()
+                events=events,
+                statistics=statistics,
+                node_states=node_states
             )
             
             logger.info(f"Simulation completed in {duration:.2f} seconds")
@@ -85,10 +189,112 @@ class NetworkSimulator:
         finally:
             self._cleanup_simulation()
     
+    @property
+    def simulation_running(self) -> bool:
+        """Whether a simulation run is in progress."""
+        return not self._stop_event.is_set()
+    
+    @property
+    def simulation_paused(self) -> bool:
+        """Whether the simulation is paused."""
+        return not self._run_event.is_set()
+    
+    def _schedule(self, delay: float, callback: Callable[[], None], node: Optional[str] = None):
+        """
+        Schedule a callback to run after delay simulated seconds.
+        
+        Args:
+            delay: Simulated seconds from now
+            callback: Function to call
+            node: Node the event acts on, so it can be cancelled if the node fails
+        """
+        entry = [self._now + delay, next(self._seq), callback, False, node]
+        heapq.heappush(self._event_heap, entry)
+        if node is not None:
+            self._pending_by_node.setdefault(node, {})[entry[1]] = entry
+    
+    def _cancel_node_events(self, node: str):
+        """Cancel all pending events scheduled for a node."""
+        pending = self._pending_by_node.pop(node, None)
+        if not pending:
+            return
+        
+        for entry in pending.values():
+            entry[3] = True
+        self._cancelled_count += len(pending)
+    
+    def _compact_events(self):
+        """Drop cancelled entries from the event heap."""
+        self._event_heap = [entry for entry in self._event_heap if not entry[3]]
+        heapq.heapify(self._event_heap)
+        self._cancelled_count = 0
+    
+    def _start_process(self, process: SimulationProcess, delay: float = 0.0):
+        """Schedule a scenario process to start after delay simulated seconds."""
+        self._schedule(delay, partial(self._step_process, process))
+    
+    def _step_process(self, process: SimulationProcess):
+        """Run a process up to its next wait and reschedule it."""
+        try:
+            delay = next(process)
+        except StopIteration:
+            return
+        self._start_process(process, delay)
+    
+    def _run_events(self):
+        """Run scheduled events in simulated-time order until none remain."""
+        wall_start = time.monotonic()
+        sim_start = self._now
+        
+        while self._event_heap:
+            if not self._run_event.is_set():
+                # Paused time does not count towards real-time deadlines
+                paused_at = time.monotonic()
+                self._run_event.wait()
+                wall_start += time.monotonic() - paused_at
+            if self._stop_event.is_set():
+                break
+            
+            entry = heapq.heappop(self._event_heap)
+            event_time, seq, callback, _, node = entry
+            
+            if self.real_time and not entry[3]:
+                wait = (event_time - sim_start) - (time.monotonic() - wall_start)
+                if wait > 0 and self._stop_event.wait(wait):
+                    break
+            
+            # Checked after waiting, in case a fault was injected meanwhile
+            if entry[3]:
+                self._cancelled_count -= 1
+                continue
+            if node is not None:
+                self._pending_by_node.get(node, {}).pop(seq, None)
+            
+            self._now = event_time
+            callback()
+            
+            # Keep pop cost proportional to live events
+            if self._cancelled_count > len(self._event_heap) // 2:
+                self._compact_events()
+    
+    def _fan_out(self, func: Callable[[NetworkNode], Any], nodes: List[NetworkNode]):
+        """Apply func to each node on the worker pool and wait for all of them."""
+        if self._pool is None or len(nodes) < 2:
+            for node in nodes:
+                func(node)
+            return
+        
+        # Consuming the results waits for every node and re-raises any error
+        for _ in self._pool.map(func, nodes):
+            pass
+    
     def _initialize_simulation(self, topology: NetworkTopology, devices: List[NetworkDevice]):
         """Initialize simulation environment."""
         logger.info("Initializing simulation environment")
         
+        self._pool = ThreadPoolExecutor(max_workers=self.thread_pool_size,
+                                        thread_name_prefix="simulation-node")
+        
         # Initialize IPC manager
         self.ipc_manager = IPCManager(self.simulation_config)
         
@@ -96,6 +302,10 @@ class NetworkSimulator:
         for device in devices:
             node = NetworkNode(device, self.simulation_config, self.ipc_manager)
             self.nodes[device.name] = node
+            self._nodes_by_type.setdefault(device.device_type, []).append(node)
+        
+        self._ospf_router_nodes = [node for node in self._nodes_by_type.get('router', [])
+                                   if any(rp.protocol == 'ospf' for rp in node.device.routing_protocols)]
         
         # Configure node connections based on topology
         for link in topology.links:
@@ -115,171 +325,186 @@ class NetworkSimulator:
         for node in self.nodes.values():
             node.start()
         
-        self.simulation_running = True
-        self._log_event("simulation_started", "Simulation environment initialized")
+        self._event_heap.clear()
+        self._pending_by_node.clear()
+        self._cancelled_count = 0
+        self._now = 0.0
+        self._stop_event.clear()
+        self._log_event(EventType.SIMULATION_STARTED, "Simulation environment initialized")
     
-    def _run_day1_scenario(self):
+    def _run_day1_scenario(self) -> SimulationProcess:
         """Run Day-1 simulation scenario (device startup and discovery)."""
         logger.info("Running Day-1 scenario: Device startup and network discovery")
         
         # Phase 1: Device power-on sequence
-        self._log_event("phase_start", "Phase 1: Device power-on sequence")
-        self._simulate_device_startup()
+        self._log_event(EventType.PHASE_START, "Phase 1: Device power-on sequence")
+        yield from self._simulate_device_startup()
         
         # Phase 2: ARP and neighbor discovery
-        self._log_event("phase_start", "Phase 2: ARP and neighbor discovery")
-        self._simulate_arp_discovery()
+        self._log_event(EventType.PHASE_START, "Phase 2: ARP and neighbor discovery")
+        yield from self._simulate_arp_discovery()
         
         # Phase 3: Routing protocol convergence
-        self._log_event("phase_start", "Phase 3: Routing protocol convergence")
-        self._simulate_routing_convergence()
+        self._log_event(EventType.PHASE_START, "Phase 3: Routing protocol convergence")
+        yield from self._simulate_routing_convergence()
         
         # Phase 4: Network stabilization
-        self._log_event("phase_start", "Phase 4: Network stabilization")
-        self._simulate_network_stabilization()
+        self._log_event(EventType.PHASE_START, "Phase 4: Network stabilization")
+        yield from self._simulate_network_stabilization()
     
-    def _run_day2_scenario(self):
+    def _run_day2_scenario(self) -> SimulationProcess:
         """Run Day-2 simulation scenario (operational events and failures)."""
         logger.info("Running Day-2 scenario: Operational events and failure simulation")
         
         # Start with stable network
-        self._simulate_network_stabilization()
+        yield from self._simulate_network_stabilization()
         
         # Phase 1: Normal operation
-        self._log_event("phase_start", "Phase 1: Normal network operation")
-        time.sleep(2)
+        self._log_event(EventType.PHASE_START, "Phase 1: Normal network operation")
+        yield 2
         
         # Phase 2: Link failure simulation
-        self._log_event("phase_start", "Phase 2: Link failure simulation")
-        self._simulate_link_failures()
+        self._log_event(EventType.PHASE_START, "Phase 2: Link failure simulation")
+        yield from self._simulate_link_failures()
         
         # Phase 3: Recovery and reconvergence
-        self._log_event("phase_start", "Phase 3: Network recovery")
-        self._simulate_network_recovery()
+        self._log_event(EventType.PHASE_START, "Phase 3: Network recovery")
+        yield from self._simulate_network_recovery()
         
         # Phase 4: Configuration changes
-        self._log_event("phase_start", "Phase 4: Configuration change impact")
-        self._simulate_configuration_changes()
+        self._log_event(EventType.PHASE_START, "Phase 4: Configuration change impact")
+        yield from self._simulate_configuration_changes()
     
-    def _simulate_device_startup(self):
+    def _simulate_device_startup(self) -> SimulationProcess:
         """Simulate device startup sequence."""
         startup_order = ['router', 'switch', 'firewall']  # Typical startup order
         
         for device_type in startup_order:
-            devices_of_type = [node for node in self.nodes.values() 
-                             if node.device.device_type == device_type]
-            
-            for node in devices_of_type:
-                self._log_event("device_startup", f"Device {node.device.name} starting up", node.device.name)
-                node.power_on()
-                time.sleep(0.5)  # Stagger startup
+            for node in self._nodes_by_type.get(device_type, []):
+                self._log_event(EventType.DEVICE_STARTUP, "Device {} starting up", node.device.name, device=node.device.name)
+                node.begin_power_on()
+                # Boot completes unless the device fails first
+                self._schedule(BOOT_TIME, partial(node.set_operational_state, True), node.device.name)
+                yield BOOT_TIME + 0.5  # Stagger startup
     
-    def _simulate_arp_discovery(self):
+    def _simulate_arp_discovery(self) -> SimulationProcess:
         """Simulate ARP table population."""
         for node in self.nodes.values():
-            self._log_event("arp_discovery", f"Device {node.device.name} performing ARP discovery", node.device.name)
+            self._log_event(EventType.ARP_DISCOVERY, "Device {} performing ARP discovery", node.device.name, device=node.device.name)
             node.perform_arp_discovery()
-            time.sleep(0.2)
+            yield 0.2
     
-    def _simulate_routing_convergence(self):
+    def _simulate_routing_convergence(self) -> SimulationProcess:
         """Simulate routing protocol convergence."""
         # Simulate OSPF hello packets and LSA exchanges
-        router_nodes = [node for node in self.nodes.values() 
-                       if node.device.device_type == 'router']
+        router_nodes = self._nodes_by_type.get('router', [])
+        ospf_nodes = self._ospf_router_nodes
         
-        for node in router_nodes:
-            if any(rp.protocol == 'ospf' for rp in node.device.routing_protocols):
-                self._log_event("ospf_hello", f"Router {node.device.name} sending OSPF hello packets", node.device.name)
-                node.send_ospf_hello()
+        # All routers act at the same simulated instant, so fan them out
+        for node in ospf_nodes:
+            self._log_event(EventType.OSPF_HELLO, "Router {} sending OSPF hello packets", node.device.name, device=node.device.name)
+        self._fan_out(NetworkNode.send_ospf_hello, ospf_nodes)
         
         # Wait for convergence
-        time.sleep(3)
+        yield 3
         
         for node in router_nodes:
-            self._log_event("routing_table_update", f"Router {node.device.name} updating routing table", node.device.name)
-            node.update_routing_table()
+            self._log_event(EventType.ROUTING_TABLE_UPDATE, "Router {} updating routing table", node.device.name, device=node.device.name)
+        self._fan_out(NetworkNode.update_routing_table, router_nodes)
     
-    def _simulate_network_stabilization(self):
+    def _simulate_network_stabilization(self) -> SimulationProcess:
         """Simulate network reaching stable state."""
-        self._log_event("network_stable", "Network reached stable state")
+        self._log_event(EventType.NETWORK_STABLE, "Network reached stable state")
         
         # All nodes report ready
         for node in self.nodes.values():
             node.set_operational_state(True)
         
-        time.sleep(1)
+        yield 1
     
-    def _simulate_link_failures(self):
+    def _simulate_link_failures(self) -> SimulationProcess:
         """Simulate random link failures."""
-        import random
-        
         # Select random links to fail
         available_nodes = list(self.nodes.keys())
         if len(available_nodes) >= 2:
             # Fail a random connection
-            node1, node2 = random.sample(available_nodes, 2)
+            node1, node2 = self._rng.sample(available_nodes, 2)
             
-            self._log_event("link_failure", f"Link failure between {node1} and {node2}")
+            self._log_event(EventType.LINK_FAILURE, "Link failure between {} and {}", node1, node2)
             
             # Simulate link down
             self.ipc_manager.disable_connection(node1, node2)
             
-            # Nodes detect failure and reconverge
+            # Nodes detect failure and reconverge; pending timers are stale
             if node1 in self.nodes:
+                self._cancel_node_events(node1)
                 self.nodes[node1].handle_link_failure(node2)
             if node2 in self.nodes:
+                self._cancel_node_events(node2)
                 self.nodes[node2].handle_link_failure(node1)
             
-            time.sleep(2)
+            yield 2
     
-    def _simulate_network_recovery(self):
+    def _simulate_network_recovery(self) -> SimulationProcess:
         """Simulate network recovery from failures."""
-        self._log_event("recovery_start", "Starting network recovery")
+        self._log_event(EventType.RECOVERY_START, "Starting network recovery")
         
         # Re-enable failed connections
         self.ipc_manager.enable_all_connections()
         
-        # Nodes reconverge
-        for node in self.nodes.values():
-            if node.device.device_type == 'router':
-                node.reconverge_routing()
+        # Nodes reconverge (NetworkNode.reconverge_routing, on simulated time)
+        for node in self._nodes_by_type.get('router', []):
+            node.send_ospf_hello()
+            self._schedule(RECONVERGENCE_TIME, node.update_routing_table, node.device.name)
+            yield RECONVERGENCE_TIME
         
-        time.sleep(3)
-        self._log_event("recovery_complete", "Network recovery completed")
+        yield 3
+        self._log_event(EventType.RECOVERY_COMPLETE, "Network recovery completed")
     
-    def _simulate_configuration_changes(self):
+    def _simulate_configuration_changes(self) -> SimulationProcess:
         """Simulate configuration changes and their impact."""
-        import random
-        
         # Select random router for configuration change
-        routers = [node for node in self.nodes.values() 
-                  if node.device.device_type == 'router']
+        routers = self._nodes_by_type.get('router', [])
         
         if routers:
-            router = random.choice(routers)
-            self._log_event("config_change", f"Configuration change on {router.device.name}", router.device.name)
+            router = self._rng.choice(routers)
+            self._log_event(EventType.CONFIG_CHANGE, "Configuration change on {}", router.device.name, device=router.device.name)
             
             # Simulate interface shutdown/no shutdown
             router.simulate_interface_change()
-            time.sleep(1)
+            yield 1
     
     def _collect_statistics(self) -> Dict[str, Any]:
         """Collect simulation statistics."""
         stats = {
             'total_events': len(self.events),
             'nodes_simulated': len(self.nodes),
-            'event_types': {},
+            'event_types': {event_type.label: count  # counted as events are logged
+                            for event_type, count in self._event_type_counts.items()},
             'node_statistics': {}
         }
         
-        # Count event types
-        for event in self.events:
-            event_type = event.get('type', 'unknown')
-            stats['event_types'][event_type] = stats['event_types'].get(event_type, 0) + 1
-        
-        # Collect node statistics
-        for node_name, node in self.nodes.items():
-            stats['node_statistics'][node_name] = node.get_statistics()
+        # Collect node statistics, also as a structured array for columnar
+        # aggregation (e.g. table['routing_updates'].sum())
+        name_width = max((len(name) for name in self.nodes), default=1)
+        table = np.empty(len(self.nodes), dtype=[('node', f'U{name_width}')] + _NODE_STATS_FIELDS)
+        for row, (node_name, node) in enumerate(self.nodes.items()):
+            node_stats = node.get_statistics()
+            stats['node_statistics'][node_name] = node_stats
+            table[row] = (
+                node_name,
+                node_stats['packets_sent'],
+                node_stats['packets_received'],
+                node_stats['hello_packets_sent'],
+                node_stats['arp_requests_sent'],
+                node_stats['routing_updates'],
+                node_stats['uptime'],
+                node_stats['operational'],
+                node_stats['interfaces_up'],
+                len(node.routing_table),
+                len(node.arp_table)
+            )
+        stats['node_stats_array'] = table
         
         return stats
     
@@ -297,59 +522,81 @@ class NetworkSimulator:
         
         return states
     
-    def _log_event(self, event_type: str, message: str, device: str = None):
-        """Log simulation event."""
-        event = {
-            'timestamp': time.time(),
-            'type': event_type,
-            'message': message,
-            'device': device
-        }
+    def _log_event(self, event_type: EventType, template: str, *args: Any, device: Optional[str] = None):
+        """
+        Log simulation event.
+        
+        Args:
+            event_type: Kind of event
+            template: Message, with str.format fields for args
+            *args: Values formatted into the message when it is read
+            device: Device the event concerns
+        """
+        event = SimulationEvent(time.monotonic_ns(), event_type, template, args, device)
         self.events.append(event)
-        logger.debug(f"Simulation event: {message}")
+        self._event_type_counts[event_type] += 1
+        if self._debug_enabled:
+            logger.debug(f"Simulation event: {event.message}")
     
     def _cleanup_simulation(self):
         """Clean up simulation resources."""
         logger.info("Cleaning up simulation")
         
-        self.simulation_running = False
+        self._stop_event.set()
+        self._event_heap.clear()
+        self._pending_by_node.clear()
+        self._cancelled_count = 0
         
         # Stop all nodes
-        for node in self.nodes.values():
-            node.stop()
+        self._fan_out(NetworkNode.stop, list(self.nodes.values()))
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
         
         # Cleanup IPC manager
         if self.ipc_manager:
             self.ipc_manager.cleanup()
         
         self.nodes.clear()
+        self._nodes_by_type.clear()
+        self._ospf_router_nodes = []
         self.events.clear()
+        self._event_type_counts.clear()
     
     def pause_simulation(self):
         """Pause the simulation."""
-        self.simulation_paused = True
+        self._run_event.clear()
         for node in self.nodes.values():
             node.pause()
         logger.info("Simulation paused")
     
     def resume_simulation(self):
         """Resume the simulation."""
-        self.simulation_paused = False
         for node in self.nodes.values():
             node.resume()
+        self._run_event.set()
         logger.info("Simulation resumed")
     
+    def stop_simulation(self):
+        """Stop a running simulation after the current event."""
+        self._stop_event.set()
+        # Release a paused event loop so it can observe the stop
+        self._run_event.set()
+        logger.info("Simulation stop requested")
+    
     def inject_fault(self, fault_type: str, target: str, **kwargs):
         """Inject a fault for testing."""
-        self._log_event("fault_injection", f"Injecting {fault_type} fault on {target}")
+        self._log_event(EventType.FAULT_INJECTION, "Injecting {} fault on {}", fault_type, target)
         
         if fault_type == "link_failure" and target in self.nodes:
             neighbor = kwargs.get('neighbor')
             if neighbor:
                 self.ipc_manager.disable_connection(target, neighbor)
+                self._cancel_node_events(target)
                 self.nodes[target].handle_link_failure(neighbor)
         
         elif fault_type == "device_failure" and target in self.nodes:
+            self._cancel_node_events(target)
             self.nodes[target].simulate_device_failure()
         
         elif fault_type == "interface_down" and target in self.nodes:
@@ -384,7 +631,7 @@ class NetworkSimulator:
         if recent_events:
             print(f"\nRecent Events:")
             for event in recent_events:
-                device_info = f" [{event['device']}]" if event.get('device') else ""
-                print(f"  • {event['message']}{device_info}")
+                device_info = f" [{event.device}]" if event.device else ""
+                print(f"  • {event.message}{device_info}")
         
         print("=" * 50)
\ No newline at end of file
@@ -4,9 +4,45 @@ Helper utilities for network analysis.
 
 import re
 import ipaddress
-from typing import Union, Tuple, Optional
+import numpy as np
+from functools import lru_cache
+from typing import Union, Tuple, Optional, Iterable
 
 
+# Bandwidth unit multipliers to bps
+_BANDWIDTH_MULTIPLIERS = {
+    'bps': 1,
+    'kbps': 1_000,
+    'mbps': 1_000_000,
+    'gbps': 1_000_000_000,
+    'tbps': 1_000_000_000_000
+}
+
+# Bandwidth value with unit (e.g. "1000mbps"), and bare-number fallback
+_BANDWIDTH_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([kmgt]?bps)')
+_BANDWIDTH_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+# Common interface abbreviations
+_INTERFACE_ABBREVIATIONS = {
+    'GigabitEthernet': 'Gi',
+    'FastEthernet': 'Fa',
+    'Ethernet': 'Et',
+    'Serial': 'Se',
+    'Loopback': 'Lo',
+    'Vlan': 'Vl',
+    'Port-channel': 'Po'
+}
+
+# Longest names first so e.g. GigabitEthernet wins over Ethernet
+_INTERFACE_PREFIX_RE = re.compile(
+    '^(' + '|'.join(map(re.escape, sorted(_INTERFACE_ABBREVIATIONS, key=len, reverse=True))) + ')'
+)
+
+# Byte units, each 1024 (2**10) times the previous
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+@lru_cache(maxsize=4096)
 def parse_bandwidth(bandwidth_str: str) -> int:
     """
     Parse bandwidth string and return value in bps.
@@ -30,10 +66,10 @@ def parse_bandwidth(bandwidth_str: str) -> int:
     bw = bandwidth_str.strip().lower()
     
     # Extract number and unit
-    match = re.match(r'(\d+(?:\.\d+)?)\s*([kmgt]?bps)', bw)
+    match = _BANDWIDTH_RE.match(bw)
     if not match:
         # Try to extract just numbers (assume Mbps)
-        match = re.match(r'(\d+(?:\.\d+)?)', bw)
+        match = _BANDWIDTH_NUMBER_RE.match(bw)
         if match:
             return int(float(match.group(1)) * 1_000_000)  # Default to Mbps
         return 0
@@ -42,15 +78,7 @@ def parse_bandwidth(bandwidth_str: str) -> int:
     value = float(value)
     
     # Convert to bps
-    multipliers = {
-        'bps': 1,
-        'kbps': 1_000,
-        'mbps': 1_000_000,
-        'gbps': 1_000_000_000,
-        'tbps': 1_000_000_000_000
-    }
-    
-    return int(value * multipliers.get(unit, 1))
+    return int(value * _BANDWIDTH_MULTIPLIERS.get(unit, 1))
 
 
 def validate_ip_address(ip_str: str) -> bool:
@@ -70,6 +98,7 @@ def validate_ip_address(ip_str: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=4096)
 def calculate_subnet(ip_str: str, netmask: str) -> Optional[ipaddress.IPv4Network]:
     """
     Calculate subnet from IP and netmask.
@@ -86,16 +115,81 @@ def calculate_subnet(ip_str: str, netmask: str) -> Optional[ipaddress.IPv4Networ
             # CIDR notation
             return ipaddress.IPv4Network(f"{ip_str}{netmask}", strict=False)
         else:
-            # Subnet mask notation
-            ip = ipaddress.IPv4Address(ip_str)
-            mask = ipaddress.IPv4Address(netmask)
-            # Convert mask to prefix length
-            prefix_len = sum(bin(int(octet)).count('1') for octet in str(mask).split('.'))
-            return ipaddress.IPv4Network(f"{ip}/{prefix_len}", strict=False)
+            # Subnet mask notation; prefix length is the mask's set-bit count
+            prefix_len = int(ipaddress.IPv4Address(netmask)).bit_count()
+            return ipaddress.IPv4Network(f"{ip_str}/{prefix_len}", strict=False)
     except (ValueError, ipaddress.AddressValueError):
         return None
 
 
+@lru_cache(maxsize=65536)
+def ipv4_to_int(ip_str: str) -> Optional[int]:
+    """
+    Convert an IPv4 address string to its integer value.
+    
+    Args:
+        ip_str: IP address string
+        
+    Returns:
+        Address as an int, or None if invalid
+    """
+    try:
+        return int(ipaddress.IPv4Address(ip_str))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def netmask_prefix_length(netmask: str) -> Optional[int]:
+    """
+    Get the prefix length for a netmask, counting set bits like calculate_subnet.
+    
+    Args:
+        netmask: Netmask string (e.g., "255.255.255.0" or "/24")
+        
+    Returns:
+        Prefix length, or None if invalid
+    """
+    if netmask.startswith('/'):
+        try:
+            return ipaddress.IPv4Network(f"0.0.0.0{netmask}", strict=False).prefixlen
+        except ValueError:
+            return None
+    mask = ipv4_to_int(netmask)
+    if mask is None:
+        return None
+    return mask.bit_count()
+
+
+def ips_to_uint32(ip_strs: Iterable[str]) -> np.ndarray:
+    """
+    Convert IPv4 address strings to a uint32 array.
+    
+    Args:
+        ip_strs: Valid IP address strings
+        
+    Returns:
+        Array of addresses as uint32
+    """
+    return np.fromiter((ipv4_to_int(ip) for ip in ip_strs), dtype=np.uint32)
+
+
+def prefix_masks_uint32(prefix_lengths: np.ndarray) -> np.ndarray:
+    """
+    Convert prefix lengths to netmasks as a uint32 array.
+    
+    Args:
+        prefix_lengths: Array of prefix lengths (0-32)
+        
+    Returns:
+        Array of netmasks as uint32
+    """
+    prefix_lengths = prefix_lengths.astype(np.uint64)
+    full = np.uint64(0xFFFFFFFF)
+    return ((full << (np.uint64(32) - prefix_lengths)) & full).astype(np.uint32)
+
+
+@lru_cache(maxsize=4096)
 def normalize_interface_name(interface: str) -> str:
     """
     Normalize interface name to standard format.
@@ -106,24 +200,10 @@ def normalize_interface_name(interface: str) -> str:
     Returns:
         Normalized interface name
     """
-    # Common interface abbreviations
-    replacements = {
-        'GigabitEthernet': 'Gi',
-        'FastEthernet': 'Fa', 
-        'Ethernet': 'Et',
-        'Serial': 'Se',
-        'Loopback': 'Lo',
-        'Vlan': 'Vl',
-        'Port-channel': 'Po'
-    }
-    
-    normalized = interface
-    for full_name, abbrev in replacements.items():
-        if normalized.startswith(full_name):
-            normalized = normalized.replace(full_name, abbrev)
-            break
-    
-    return normalized
+    match = _INTERFACE_PREFIX_RE.match(interface)
+    if not match:
+        return interface
+    return _INTERFACE_ABBREVIATIONS[match.group(1)] + interface[match.end():]
 
 
 def format_bytes(bytes_value: int) -> str:
@@ -136,11 +216,12 @@ def format_bytes(bytes_value: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.1f} B"
+    
+    # Unit index is the number of whole 10-bit steps in the value
+    index = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (index * 10)):.1f} {_BYTE_UNITS[index]}"
 
 
 def parse_cisco_config_line(line: str) -> Tuple[str, list]:
@@ -9,6 +9,14 @@ from typing import Optional
 from loguru import logger
 
 
+# Console format for interactive terminals
+CONSOLE_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+
+# Plain formats for pipes and files; the source location is only included when verbose
+PLAIN_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}"
+PLAIN_VERBOSE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+
+
 def setup_logger(verbose: bool = False, log_file: Optional[str] = None) -> logging.Logger:
     """
     Setup logging configuration.
@@ -26,13 +34,13 @@ def setup_logger(verbose: bool = False, log_file: Optional[str] = None) -> loggi
     # Set log level
     level = "DEBUG" if verbose else "INFO"
     
-    # Add console handler
-    logger.add(
-        sys.stderr,
-        level=level,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        colorize=True
-    )
+    plain_format = PLAIN_VERBOSE_FORMAT if verbose else PLAIN_FORMAT
+    
+    # Add console handler, skipping ANSI rendering when output is redirected
+    if sys.stderr.isatty():
+        logger.add(sys.stderr, level=level, format=CONSOLE_FORMAT, colorize=True)
+    else:
+        logger.add(sys.stderr, level=level, format=plain_format, colorize=False)
     
     # Add file handler if specified
     if log_file:
@@ -42,7 +50,7 @@ def setup_logger(verbose: bool = False, log_file: Optional[str] = None) -> loggi
         logger.add(
             log_file,
             level=level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+            format=plain_format,
             rotation="10 MB",
             retention="7 days",
             compression="zip"
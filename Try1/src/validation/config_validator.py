@@ -2,7 +2,9 @@
 Configuration validation module.
 """
 
-from typing import List, Dict, Any
+from collections import Counter, OrderedDict, defaultdict
+from itertools import chain, groupby
+from typing import List, Dict, Any, Tuple, Iterable, Optional
 from dataclasses import dataclass
 from loguru import logger
 
@@ -10,7 +12,12 @@ from ..core.config_parser import NetworkDevice
 from ..core.topology_builder import NetworkTopology
 
 
-@dataclass
+# Report order and heading for each severity
+_SEVERITY_RANK = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+_SEVERITY_ICONS = {'critical': '[CRITICAL]', 'high': '[HIGH]', 'medium': '[MEDIUM]', 'low': '[LOW]'}
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Validation result for a specific check."""
     check_name: str
@@ -20,12 +27,53 @@ class ValidationResult:
     severity: str = 'medium'  # 'low', 'medium', 'high', 'critical'
 
 
+@dataclass
+class ValidationContext:
+    """Device lookups and link counts shared by the checks of one validation run."""
+    device_by_name: Dict[str, NetworkDevice]
+    degree: Counter  # device name -> link endpoints, in link order
+    device_types: Counter  # device type -> device count
+    
+    @classmethod
+    def build(cls, devices: Iterable[NetworkDevice], topology: NetworkTopology,
+              degree: Optional[Counter] = None) -> "ValidationContext":
+        """
+        Build the lookups in one pass over the devices and one over the links.
+        
+        Args:
+            devices: Network devices
+            topology: Network topology
+            degree: Link degree per device if the caller already counted it,
+                in which case the links are not walked again
+            
+        Returns:
+            Validation context
+        """
+        devices = list(devices)
+        device_by_name = {}
+        for device in devices:
+            # The first match wins, as with a scan
+            device_by_name.setdefault(device.name, device)
+        
+        device_types = Counter(device.device_type for device in devices)
+        if degree is None:
+            degree = Counter(chain.from_iterable(
+                (link.source_device, link.target_device) for link in topology.links
+            ))
+        
+        return cls(device_by_name, degree, device_types)
+
+
 class ConfigValidator:
     """Validates network device configurations."""
     
     def __init__(self, config: Dict[str, Any]):
         """Initialize validator with configuration."""
         self.config = config
+        self.cache_size = config.get('validation', {}).get('cache_size', 32)
+        
+        # Recent results keyed by input fingerprint, oldest first
+        self._validation_cache: OrderedDict = OrderedDict()
     
     def validate_all(self, devices: List[NetworkDevice], topology: NetworkTopology) -> List[ValidationResult]:
         """
@@ -38,57 +86,91 @@ class ConfigValidator:
         Returns:
             List of validation results
         """
+        input_key = self._input_fingerprint(devices, topology)
+        cached = self._validation_cache.get(input_key)
+        if cached is not None:
+            self._validation_cache.move_to_end(input_key)
+            logger.info("Reusing cached configuration validation")
+            return list(cached)
+        
         logger.info("Starting configuration validation")
         
-        results = []
+        context = ValidationContext.build(devices, topology)
         
-        # Run individual validation checks
-        results.extend(self._validate_duplicate_ips(devices))
-        results.extend(self._validate_vlan_consistency(devices))
-        results.extend(self._validate_gateway_addresses(devices))
-        results.extend(self._validate_mtu_consistency(devices, topology))
-        results.extend(self._validate_routing_protocols(devices))
-        results.extend(self._validate_network_loops(topology))
-        results.extend(self._validate_missing_components(devices, topology))
+        # Skip checks that cannot fire on this input; unset MTUs all default to 1500
+        has_ip_addresses = any(i.ip_address for d in devices for i in d.interfaces)
+        has_vlans = any(d.vlans for d in devices)
+        has_mtus = any(i.mtu for d in devices for i in d.interfaces)
+        
+        # Run individual validation checks and collect their results in one list build
+        results = list(chain.from_iterable((
+            self._validate_duplicate_ips(devices) if has_ip_addresses else (),
+            self._validate_vlan_consistency(devices) if has_vlans else (),
+            self._validate_gateway_addresses(devices),
+            self._validate_mtu_consistency(topology, context) if has_mtus else (),
+            self._validate_routing_protocols(devices, context),
+            self._validate_network_loops(topology),
+            self._validate_missing_components(devices, context)
+        )))
+        
+        if self.cache_size > 0:
+            self._validation_cache[input_key] = list(results)
+            while len(self._validation_cache) > self.cache_size:
+                self._validation_cache.popitem(last=False)
         
         logger.info(f"Validation completed: {len(results)} issues found")
         return results
     
+    def _input_fingerprint(self, devices: List[NetworkDevice], topology: NetworkTopology) -> Tuple:
+        """Build a hashable key covering everything the checks read."""
+        device_key = tuple(
+            (
+                d.name,
+                d.device_type,
+                tuple((i.name, i.ip_address, i.vlan, i.mtu) for i in d.interfaces),
+                tuple(rp.protocol for rp in d.routing_protocols),
+                tuple(d.vlans.items())
+            )
+            for d in devices
+        )
+        link_key = tuple(
+            (l.source_device, l.target_device, l.source_interface, l.target_interface)
+            for l in topology.links
+        )
+        topology_device_key = tuple(d.device_type for d in topology.devices)
+        return (device_key, link_key, topology_device_key)
+    
     def _validate_duplicate_ips(self, devices: List[NetworkDevice]) -> List[ValidationResult]:
         """Check for duplicate IP addresses within same VLAN/subnet."""
         results = []
-        ip_map = {}  # ip -> (device, interface, vlan)
+        owners = defaultdict(list)  # (ip, vlan) -> [(device, interface), ...]
         
         for device in devices:
             for interface in device.interfaces:
                 if interface.ip_address:
-                    key = interface.ip_address
-                    vlan = interface.vlan or 0
-                    
-                    if key in ip_map:
-                        existing_device, existing_interface, existing_vlan = ip_map[key]
-                        if vlan == existing_vlan:  # Same VLAN
-                            results.append(ValidationResult(
-                                check_name="duplicate_ip_address",
-                                status="fail",
-                                message=f"Duplicate IP {key} found on {device.name}:{interface.name} and {existing_device}:{existing_interface} in VLAN {vlan}",
-                                device=device.name,
-                                severity="high"
-                            ))
-                    else:
-                        ip_map[key] = (device.name, interface.name, vlan)
+                    owners[(interface.ip_address, interface.vlan or 0)].append((device.name, interface.name))
+        
+        # One result per duplicated address, naming every interface that uses it
+        for (ip, vlan), interfaces in owners.items():
+            if len(interfaces) > 1:
+                names = [f"{device_name}:{interface_name}" for device_name, interface_name in interfaces]
+                results.append(ValidationResult(
+                    check_name="duplicate_ip_address",
+                    status="fail",
+                    message=f"Duplicate IP {ip} found on {', '.join(names[:-1])} and {names[-1]} in VLAN {vlan}",
+                    device=interfaces[0][0],
+                    severity="high"
+                ))
         
         return results
     
     def _validate_vlan_consistency(self, devices: List[NetworkDevice]) -> List[ValidationResult]:
         """Validate VLAN configuration consistency."""
         results = []
-        vlan_names = {}  # vlan_id -> set of names
+        vlan_names = defaultdict(set)  # vlan_id -> set of names
         
         for device in devices:
             for vlan_id, vlan_name in device.vlans.items():
-                if vlan_id not in vlan_names:
-                    vlan_names[vlan_id] = set()
                 vlan_names[vlan_id].add(vlan_name)
         
         # Check for inconsistent VLAN names
@@ -125,46 +207,55 @@ class ConfigValidator:
         
         return results
     
-    def _validate_mtu_consistency(self, devices: List[NetworkDevice], topology: NetworkTopology) -> List[ValidationResult]:
+    def _validate_mtu_consistency(self, topology: NetworkTopology, context: ValidationContext) -> List[ValidationResult]:
         """Check for MTU mismatches on connected interfaces."""
         results = []
+        device_by_name = context.device_by_name
         
         for link in topology.links:
-            source_device = next((d for d in devices if d.name == link.source_device), None)
-            target_device = next((d for d in devices if d.name == link.target_device), None)
+            source_device = device_by_name.get(link.source_device)
+            target_device = device_by_name.get(link.target_device)
+            if not source_device or not target_device:
+                continue
             
-            if source_device and target_device:
-                source_interface = next((i for i in source_device.interfaces if i.name == link.source_interface), None)
-                target_interface = next((i for i in target_device.interfaces if i.name == link.target_interface), None)
-                
-                if source_interface and target_interface:
-                    source_mtu = source_interface.mtu or 1500  # Default MTU
-                    target_mtu = target_interface.mtu or 1500
-                    
-                    if source_mtu != target_mtu:
-                        results.append(ValidationResult(
-                            check_name="mtu_mismatch",
-                            status="warning",
-                            message=f"MTU mismatch between {link.source_device}:{link.source_interface} ({source_mtu}) and {link.target_device}:{link.target_interface} ({target_mtu})",
-                            severity="medium"
-                        ))
+            source_interface = source_device.get_interface(link.source_interface)
+            target_interface = target_device.get_interface(link.target_interface)
+            if not source_interface or not target_interface:
+                continue
+            
+            source_mtu = source_interface.mtu or 1500  # Default MTU
+            target_mtu = target_interface.mtu or 1500
+            if source_mtu == target_mtu:
+                continue
+            
+            results.append(ValidationResult(
+                check_name="mtu_mismatch",
+                status="warning",
+                message=f"MTU mismatch between {link.source_device}:{link.source_interface} ({source_mtu}) and {link.target_device}:{link.target_interface} ({target_mtu})",
+                severity="medium"
+            ))
         
         return results
     
-    def _validate_routing_protocols(self, devices: List[NetworkDevice]) -> List[ValidationResult]:
+    def _validate_routing_protocols(self, devices: List[NetworkDevice], context: ValidationContext) -> List[ValidationResult]:
         """Validate routing protocol configurations."""
         results = []
         
-        router_count = sum(1 for d in devices if d.device_type == 'router')
+        router_count = context.device_types['router']
         
         if router_count > 1:
-            # Check if routers have routing protocols configured
+            # One pass over the routers: which have no routing protocol, and
+            # whether any already runs BGP (stop looking once one does)
             routers_without_routing = []
+            has_bgp_router = False
             
             for device in devices:
-                if device.device_type == 'router':
-                    if not device.routing_protocols:
-                        routers_without_routing.append(device.name)
+                if device.device_type != 'router':
+                    continue
+                if not device.routing_protocols:
+                    routers_without_routing.append(device.name)
+                elif not has_bgp_router:
+                    has_bgp_router = any(rp.protocol == 'bgp' for rp in device.routing_protocols)
             
             if routers_without_routing:
                 results.append(ValidationResult(
@@ -175,17 +266,13 @@ class ConfigValidator:
                 ))
             
             # Suggest BGP for larger networks
-            if router_count > 5:
-                bgp_routers = sum(1 for d in devices if d.device_type == 'router' and 
-                                any(rp.protocol == 'bgp' for rp in d.routing_protocols))
-                
-                if bgp_routers == 0:
-                    results.append(ValidationResult(
-                        check_name="bgp_recommendation",
-                        status="warning",
-                        message=f"Consider implementing BGP for better scalability with {router_count} routers",
-                        severity="low"
-                    ))
+            if router_count > 5 and not has_bgp_router:
+                results.append(ValidationResult(
+                    check_name="bgp_recommendation",
+                    status="warning",
+                    message=f"Consider implementing BGP for better scalability with {router_count} routers",
+                    severity="low"
+                ))
         
         return results
     
@@ -194,34 +281,29 @@ class ConfigValidator:
         results = []
         
         # Simple loop detection - check if there are redundant paths without STP
-        switch_devices = [d for d in topology.devices if d.device_type == 'switch']
+        switch_count = sum(1 for d in topology.devices if d.device_type == 'switch')
         
-        if len(switch_devices) > 2:
+        if switch_count > 2:
             # If we have multiple switches, check for STP configuration
             # This is simplified - in reality you'd check actual STP config
             results.append(ValidationResult(
                 check_name="potential_loop_risk",
                 status="warning",
-                message=f"Multiple switches detected ({len(switch_devices)}). Ensure Spanning Tree Protocol is properly configured",
+                message=f"Multiple switches detected ({switch_count}). Ensure Spanning Tree Protocol is properly configured",
                 severity="medium"
             ))
         
         return results
     
-    def _validate_missing_components(self, devices: List[NetworkDevice], topology: NetworkTopology) -> List[ValidationResult]:
+    def _validate_missing_components(self, devices: List[NetworkDevice], context: ValidationContext) -> List[ValidationResult]:
         """Check for missing network components."""
         results = []
         
         # Check for single points of failure
-        device_connections = {}
-        for link in topology.links:
-            device_connections[link.source_device] = device_connections.get(link.source_device, 0) + 1
-            device_connections[link.target_device] = device_connections.get(link.target_device, 0) + 1
-        
-        for device_name, connections in device_connections.items():
+        for device_name, connections in context.degree.items():
             if connections == 1:
-                device = next((d for d in devices if d.name == device_name), None)
-                if device and device.device_type in ['router', 'switch']:
+                device = context.device_by_name.get(device_name)
+                if device and device.device_type in ('router', 'switch'):
                     results.append(ValidationResult(
                         check_name="single_point_of_failure",
                         status="warning",
@@ -230,14 +312,13 @@ class ConfigValidator:
                         severity="medium"
                     ))
         
-        # Check for isolated devices
-        connected_devices = set()
-        for link in topology.links:
-            connected_devices.add(link.source_device)
-            connected_devices.add(link.target_device)
+        # Check for isolated devices; any link endpoint counts as connected
+        isolated = context.device_by_name.keys() - context.degree.keys()
+        if not isolated:
+            return results
         
         for device in devices:
-            if device.name not in connected_devices:
+            if device.name in isolated:
                 results.append(ValidationResult(
                     check_name="isolated_device",
                     status="fail",
@@ -254,23 +335,17 @@ class ConfigValidator:
             print("\nAll validation checks passed!")
             return
         
-        print(f"\nValidation Results ({len(results)} issues found)")
-        print("=" * 60)
-        
-        # Group by severity
-        by_severity = {'critical': [], 'high': [], 'medium': [], 'low': []}
-        for result in results:
-            by_severity[result.severity].append(result)
-        
-        # Print by severity
-        severity_icons = {'critical': '[CRITICAL]', 'high': '[HIGH]', 'medium': '[MEDIUM]', 'low': '[LOW]'}
+        lines = [f"\nValidation Results ({len(results)} issues found)", "=" * 60]
         
-        for severity in ['critical', 'high', 'medium', 'low']:
-            issues = by_severity[severity]
-            if issues:
-                print(f"\n{severity_icons[severity]} {severity.upper()} ({len(issues)} issues):")
-                for issue in issues:
-                    device_info = f" [{issue.device}]" if issue.device else ""
-                    print(f"  - {issue.message}{device_info}")
+        # Group by severity (the sort is stable, so each group keeps result order)
+        ordered = sorted(results, key=lambda result: _SEVERITY_RANK[result.severity])
+        for severity, group in groupby(ordered, key=lambda result: result.severity):
+            issues = [
+                f"  - {issue.message} [{issue.device}]" if issue.device else f"  - {issue.message}"
+                for issue in group
+            ]
+            lines.append(f"\n{_SEVERITY_ICONS[severity]} {severity.upper()} ({len(issues)} issues):")
+            lines.extend(issues)
         
-        print("\n" + "=" * 60)
\ No newline at end of file
+        lines.append("\n" + "=" * 60)
+        print("\n".join(lines))
\ No newline at end of file
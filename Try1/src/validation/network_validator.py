@@ -2,12 +2,22 @@
 Network-level validation module.
 """
 
+from collections import Counter, defaultdict, deque
+from itertools import chain
 from typing import List, Dict, Any
+import numpy as np
 from loguru import logger
 
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import shortest_path
+except ImportError:  # optional C-backed all-pairs shortest paths
+    csr_matrix = shortest_path = None
+
 from ..core.topology_builder import NetworkTopology
 from ..core.config_parser import NetworkDevice
-from .config_validator import ValidationResult
+from ..utils.helpers import parse_bandwidth
+from .config_validator import ValidationResult, ValidationContext
 
 
 class NetworkValidator:
@@ -18,6 +28,7 @@ class NetworkValidator:
         self.config = config
         self.max_hops = config.get('validation', {}).get('max_hops', 15)
         self.min_bandwidth = config.get('validation', {}).get('min_bandwidth', '10Mbps')
+        self._min_bandwidth_bps = parse_bandwidth(self.min_bandwidth)
     
     def validate_network_topology(self, topology: NetworkTopology) -> List[ValidationResult]:
         """
@@ -31,14 +42,26 @@ class NetworkValidator:
         """
         results = []
         
-        results.extend(self._validate_connectivity(topology))
-        results.extend(self._validate_redundancy(topology))
-        results.extend(self._validate_scalability(topology))
-        results.extend(self._validate_performance(topology))
+        # One pass over the links gathers what every check below reads
+        adjacency = defaultdict(list)  # device -> neighbors, in link order
+        bandwidth_links = defaultdict(list)  # bandwidth string -> link indices
+        for index, link in enumerate(topology.links):
+            adjacency[link.source_device].append(link.target_device)
+            adjacency[link.target_device].append(link.source_device)
+            if link.bandwidth:
+                bandwidth_links[link.bandwidth].append(index)
+        
+        degree = Counter({device: len(neighbors) for device, neighbors in adjacency.items()})
+        context = ValidationContext.build(topology.devices, topology, degree)
+        
+        results.extend(self._validate_connectivity(topology, adjacency))
+        results.extend(self._validate_redundancy(topology, context))
+        results.extend(self._validate_scalability(topology, context, adjacency))
+        results.extend(self._validate_performance(topology, context, bandwidth_links))
         
         return results
     
-    def _validate_connectivity(self, topology: NetworkTopology) -> List[ValidationResult]:
+    def _validate_connectivity(self, topology: NetworkTopology, adjacency: Dict[str, List[str]]) -> List[ValidationResult]:
         """Validate network connectivity."""
         results = []
         
@@ -52,11 +75,10 @@ class NetworkValidator:
             ))
         
         # Check for network partitions (simplified)
-        connected_devices = set()
         if topology.links:
             # Start from first device and see how many we can reach
             start_device = topology.links[0].source_device
-            to_visit = [start_device]
+            to_visit = deque([start_device])
             visited = set()
             
             while to_visit:
@@ -64,13 +86,7 @@ class NetworkValidator:
                 if current in visited:
                     continue
                 visited.add(current)
-                
-                # Find connected devices
-                for link in topology.links:
-                    if link.source_device == current and link.target_device not in visited:
-                        to_visit.append(link.target_device)
-                    elif link.target_device == current and link.source_device not in visited:
-                        to_visit.append(link.source_device)
+                to_visit.extend(neighbor for neighbor in adjacency[current] if neighbor not in visited)
             
             # Check if all devices are reachable
             all_devices = {device.name for device in topology.devices}
@@ -86,20 +102,24 @@ class NetworkValidator:
         
         return results
     
-    def _validate_redundancy(self, topology: NetworkTopology) -> List[ValidationResult]:
+    def _validate_redundancy(self, topology: NetworkTopology, context: ValidationContext) -> List[ValidationResult]:
         """Validate network redundancy."""
         results = []
         
-        # Check for single points of failure
+        # One pass over the devices: single points of failure, plus link
+        # totals for the routers that have any links
         critical_devices = []
+        router_connections = 0
+        linked_routers = 0
         
-        for device in topology.devices:
-            # Count connections for this device
-            connections = sum(1 for link in topology.links 
-                            if link.source_device == device.name or link.target_device == device.name)
+        for device_name, device in context.device_by_name.items():
+            connections = context.degree[device_name]
             
-            if connections == 1 and device.device_type in ['router', 'switch']:
-                critical_devices.append(device.name)
+            if connections == 1 and device.device_type in ('router', 'switch'):
+                critical_devices.append(device_name)
+            if connections and device.device_type == 'router':
+                router_connections += connections
+                linked_routers += 1
         
         if critical_devices:
             results.append(ValidationResult(
@@ -110,21 +130,11 @@ class NetworkValidator:
             ))
         
         # Check for adequate redundancy in core network
-        router_count = sum(1 for d in topology.devices if d.device_type == 'router')
+        router_count = context.device_types['router']
         if router_count > 2:
             # Calculate average connections per router
-            router_connections = {}
-            for link in topology.links:
-                source_device = next((d for d in topology.devices if d.name == link.source_device), None)
-                target_device = next((d for d in topology.devices if d.name == link.target_device), None)
-                
-                if source_device and source_device.device_type == 'router':
-                    router_connections[link.source_device] = router_connections.get(link.source_device, 0) + 1
-                if target_device and target_device.device_type == 'router':
-                    router_connections[link.target_device] = router_connections.get(link.target_device, 0) + 1
-            
-            if router_connections:
-                avg_connections = sum(router_connections.values()) / len(router_connections)
+            if linked_routers:
+                avg_connections = router_connections / linked_routers
                 if avg_connections < 2:
                     results.append(ValidationResult(
                         check_name="insufficient_redundancy",
@@ -135,12 +145,13 @@ class NetworkValidator:
         
         return results
     
-    def _validate_scalability(self, topology: NetworkTopology) -> List[ValidationResult]:
+    def _validate_scalability(self, topology: NetworkTopology, context: ValidationContext,
+                              adjacency: Dict[str, List[str]]) -> List[ValidationResult]:
         """Validate network scalability."""
         results = []
         
         # Check network diameter (maximum hops between any two devices)
-        max_path_length = self._calculate_network_diameter(topology)
+        max_path_length = self._calculate_network_diameter(topology, adjacency)
         
         if max_path_length > self.max_hops:
             results.append(ValidationResult(
@@ -151,9 +162,7 @@ class NetworkValidator:
             ))
         
         # Check for hierarchical design
-        device_types = {}
-        for device in topology.devices:
-            device_types[device.device_type] = device_types.get(device.device_type, 0) + 1
+        device_types = context.device_types
         
         total_devices = len(topology.devices)
         if total_devices > 10:
@@ -168,20 +177,19 @@ class NetworkValidator:
         
         return results
     
-    def _validate_performance(self, topology: NetworkTopology) -> List[ValidationResult]:
+    def _validate_performance(self, topology: NetworkTopology, context: ValidationContext,
+                              bandwidth_links: Dict[str, List[int]]) -> List[ValidationResult]:
         """Validate network performance characteristics."""
         results = []
         
         # Check for bandwidth bottlenecks
-        from ..utils.helpers import parse_bandwidth
-        min_bandwidth_bps = parse_bandwidth(self.min_bandwidth)
-        
-        low_bandwidth_links = []
-        for link in topology.links:
-            if link.bandwidth:
-                link_bw_bps = parse_bandwidth(link.bandwidth)
-                if link_bw_bps < min_bandwidth_bps:
-                    low_bandwidth_links.append(f"{link.source_device}-{link.target_device}")
+        # Links share a handful of bandwidth strings, so classify each distinct one once
+        low_indices = sorted(chain.from_iterable(
+            indices for bandwidth, indices in bandwidth_links.items()
+            if parse_bandwidth(bandwidth) < self._min_bandwidth_bps
+        ))
+        low_bandwidth_links = [f"{topology.links[i].source_device}-{topology.links[i].target_device}"
+                               for i in low_indices]
         
         if low_bandwidth_links:
             results.append(ValidationResult(
@@ -192,12 +200,7 @@ class NetworkValidator:
             ))
         
         # Check for potential congestion points
-        device_load = {}
-        for link in topology.links:
-            device_load[link.source_device] = device_load.get(link.source_device, 0) + 1
-            device_load[link.target_device] = device_load.get(link.target_device, 0) + 1
-        
-        high_load_devices = [device for device, load in device_load.items() if load > 5]
+        high_load_devices = [device for device, load in context.degree.items() if load > 5]
         if high_load_devices:
             results.append(ValidationResult(
                 check_name="high_connection_density",
@@ -208,19 +211,26 @@ class NetworkValidator:
         
         return results
     
-    def _calculate_network_diameter(self, topology: NetworkTopology) -> int:
-        """Calculate network diameter using simple BFS."""
+    def _calculate_network_diameter(self, topology: NetworkTopology, adjacency: Dict[str, List[str]]) -> int:
+        """
+        Calculate network diameter (longest shortest path between reachable devices).
+        
+        Args:
+            topology: Network topology
+            adjacency: Device -> neighbor names built from the topology's links
+            
+        Returns:
+            Diameter in hops
+        """
         if not topology.links:
             return 0
         
-        # Build adjacency list
-        graph = {}
-        for device in topology.devices:
-            graph[device.name] = []
+        # Every device, linked or not, plus any link endpoint missing from the device list
+        graph = {device.name: [] for device in topology.devices}
+        graph.update(adjacency)
         
-        for link in topology.links:
-            graph[link.source_device].append(link.target_device)
-            graph[link.target_device].append(link.source_device)
+        if shortest_path is not None:
+            return self._calculate_network_diameter_csgraph(graph)
         
         max_distance = 0
         
@@ -232,13 +242,27 @@ class NetworkValidator:
         
         return max_distance
     
+    def _calculate_network_diameter_csgraph(self, graph: Dict[str, List[str]]) -> int:
+        """Calculate network diameter with SciPy's all-pairs shortest paths."""
+        ids = {name: node_id for node_id, name in enumerate(graph)}
+        edge_count = sum(len(neighbors) for neighbors in graph.values())
+        
+        rows = np.fromiter((ids[name] for name, neighbors in graph.items() for _ in neighbors),
+                           dtype=np.int32, count=edge_count)
+        cols = np.fromiter((ids[neighbor] for neighbors in graph.values() for neighbor in neighbors),
+                           dtype=np.int32, count=edge_count)
+        adjacency = csr_matrix((np.ones(rows.size), (rows, cols)), shape=(len(ids), len(ids)))
+        
+        distances = shortest_path(adjacency, directed=False, unweighted=True)
+        return int(distances[np.isfinite(distances)].max())
+    
     def _bfs_distances(self, graph: Dict[str, List[str]], start: str) -> Dict[str, int]:
         """Calculate distances from start node using BFS."""
         distances = {start: 0}
-        queue = [start]
+        queue = deque([start])
         
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             current_distance = distances[current]
             
             for neighbor in graph.get(current, []):
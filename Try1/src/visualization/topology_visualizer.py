@@ -4,74 +4,69 @@ Network Topology Visualizer
 Generates interactive HTML visualization from topology JSON files.
 """
 
+import gzip
 import json
 import os
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Callable
 from pathlib import Path
 import logging
 
+try:
+    import ijson
+except ImportError:  # optional streaming JSON parser for large topology files
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Device and link fields the visualization reads; everything else is dropped on load
+_DEVICE_FIELDS = ('name', 'device_type', 'hostname', 'interfaces', 'vlans', 'routing_protocols')
+_LINK_FIELDS = ('source_device', 'target_device')
 
-class TopologyVisualizer:
-    """Generate interactive HTML network topology visualization."""
-    
-    def __init__(self):
-        """Initialize the visualizer."""
-        self.devices = []
-        self.links = []
-        self.subnets = {}
-        self.statistics = {}
-        
-    def load_topology(self, topology_file: str) -> bool:
-        """
-        Load topology data from JSON file.
-        
-        Args:
-            topology_file: Path to topology JSON file
-            
-        Returns:
-            bool: True if loaded successfully
-        """
-        try:
-            with open(topology_file, 'r') as f:
-                topology_data = json.load(f)
-            
-            self.devices = topology_data.get('devices', [])
-            self.links = topology_data.get('links', [])
-            self.subnets = topology_data.get('subnets', {})
-            self.statistics = topology_data.get('statistics', {})
-            
-            logger.info(f"Loaded topology with {len(self.devices)} devices and {len(self.links)} links")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error loading topology file: {e}")
-            return False
-    
-    def generate_html_visualization(self, output_file: str = "network_topology.html"):
-        """
-        Generate interactive HTML visualization.
-        
-        Args:
-            output_file: Output HTML file path
-        """
-        html_content = self._generate_html_template()
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        logger.info(f"Network topology visualization saved to: {output_file}")
-    
-    def _generate_html_template(self) -> str:
-        """Generate the complete HTML template with embedded data."""
-        
-        # Prepare data for visualization
-        nodes_data = self._prepare_nodes_data()
-        edges_data = self._prepare_edges_data()
-        device_details = self._prepare_device_details()
-        
-        html_template = f"""
+# ijson prefixes of the values built while streaming a topology file
+_STREAM_PREFIXES = frozenset(('devices.item', 'links.item', 'subnets', 'statistics'))
+
+# Characters replaced when topology values are embedded in HTML, like html.escape
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+# Characters replaced in JSON embedded in the <script> block, so string values cannot
+# close the block or break the script; they only ever occur inside JSON strings
+_SCRIPT_JSON_ESCAPE = str.maketrans({
+    '<': '\\u003c', '>': '\\u003e', '&': '\\u0026', '\u2028': '\\u2028', '\u2029': '\\u2029'
+})
+
+# Compression level for .gz output; the repetitive markup and JSON compress well at the default speed
+_GZIP_LEVEL = 6
+
+# Node (color, shape, size, hierarchy level) per device type; level 0 is the top
+_NODE_STYLES = {
+    'router': ({'background': '#ff9800', 'border': '#f57c00'}, 'box', 40, 0),
+    'switch': ({'background': '#4caf50', 'border': '#388e3c'}, 'ellipse', 35, 1),
+    'pc': ({'background': '#2196f3', 'border': '#1976d2'}, 'dot', 25, 2),
+    'firewall': ({'background': '#f44336', 'border': '#d32f2f'}, 'diamond', 35, 0)
+}
+_DEFAULT_NODE_STYLE = ({'background': '#9e9e9e', 'border': '#757575'}, 'dot', 30, 1)
+
+# Label font shared by every node; it is only read when the nodes are serialized
+_NODE_FONT = {'size': 14, 'color': '#333333', 'face': 'Arial Bold'}
+
+# Edge (color, width, dashes) per unordered pair of endpoint device types
+_EDGE_STYLES = {
+    frozenset(('router',)): ('#ff6b35', 4, None),  # Core links, orange-red
+    frozenset(('router', 'switch')): ('#4ecdc4', 3, None),  # Distribution links, teal
+    frozenset(('switch', 'pc')): ('#45b7d1', 2, None)  # Access links, blue
+}
+_DEFAULT_EDGE_STYLE = ('#96ceb4', 2, [5, 5])  # Other connections, light green dashed
+
+# Edge curve settings shared by every edge
+_EDGE_SMOOTH = {'type': 'straightCross', 'roundness': 0.1}
+
+# Page head with the styles
+_HTML_HEAD = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -80,92 +75,92 @@ class TopologyVisualizer:
     <title>Network Topology Visualization</title>
     <script src="https://unpkg.com/vis-network/standalone/umd/vis-network.min.js"></script>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             margin: 0;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 20px;
             border-radius: 10px;
             margin-bottom: 20px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             margin: 0;
             font-size: 2.5em;
-        }}
+        }
         
-        .header p {{
+        .header p {
             margin: 10px 0 0 0;
             opacity: 0.9;
-        }}
+        }
         
-        .container {{
+        .container {
             display: flex;
             gap: 20px;
             height: 80vh;
-        }}
+        }
         
-        .topology-panel {{
+        .topology-panel {
             flex: 2;
             background: white;
             border-radius: 10px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
+        }
         
-        .info-panel {{
+        .info-panel {
             flex: 1;
             background: white;
             border-radius: 10px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
             padding: 20px;
             overflow-y: auto;
-        }}
+        }
         
-        #topology {{
+        #topology {
             width: 100%;
             height: 100%;
             border: none;
-        }}
+        }
         
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(2, 1fr);
             gap: 15px;
             margin-bottom: 20px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
             color: white;
             padding: 15px;
             border-radius: 8px;
             text-align: center;
-        }}
+        }
         
-        .stat-number {{
+        .stat-number {
             font-size: 2em;
             font-weight: bold;
             margin-bottom: 5px;
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             font-size: 0.9em;
             opacity: 0.9;
-        }}
+        }
         
-        .device-list {{
+        .device-list {
             margin-top: 20px;
-        }}
+        }
         
-        .device-item {{
+        .device-item {
             background: #f8f9fa;
             border: 1px solid #e9ecef;
             border-radius: 8px;
@@ -173,107 +168,107 @@ class TopologyVisualizer:
             margin-bottom: 10px;
             cursor: pointer;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .device-item:hover {{
+        .device-item:hover {
             background: #e3f2fd;
             border-color: #2196f3;
             transform: translateY(-2px);
             box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .device-name {{
+        .device-name {
             font-weight: bold;
             color: #333;
             margin-bottom: 5px;
-        }}
+        }
         
-        .device-type {{
+        .device-type {
             display: inline-block;
             padding: 3px 8px;
             border-radius: 12px;
             font-size: 0.8em;
             font-weight: bold;
             text-transform: uppercase;
-        }}
+        }
         
-        .device-type.router {{
+        .device-type.router {
             background: #ff9800;
             color: white;
-        }}
+        }
         
-        .device-type.switch {{
+        .device-type.switch {
             background: #4caf50;
             color: white;
-        }}
+        }
         
-        .device-type.pc {{
+        .device-type.pc {
             background: #2196f3;
             color: white;
-        }}
+        }
         
-        .device-type.firewall {{
+        .device-type.firewall {
             background: #f44336;
             color: white;
-        }}
+        }
         
-        .device-interfaces {{
+        .device-interfaces {
             margin-top: 10px;
             font-size: 0.9em;
             color: #666;
-        }}
+        }
         
-        .interface-count {{
+        .interface-count {
             background: #e0e0e0;
             padding: 2px 6px;
             border-radius: 10px;
             font-size: 0.8em;
-        }}
+        }
         
-        .subnet-list {{
+        .subnet-list {
             margin-top: 20px;
-        }}
+        }
         
-        .subnet-item {{
+        .subnet-item {
             background: #fff3e0;
             border-left: 4px solid #ff9800;
             padding: 10px;
             margin-bottom: 8px;
             border-radius: 0 8px 8px 0;
-        }}
+        }
         
-        .subnet-name {{
+        .subnet-name {
             font-weight: bold;
             color: #e65100;
-        }}
+        }
         
-        .subnet-devices {{
+        .subnet-devices {
             font-size: 0.9em;
             color: #666;
             margin-top: 5px;
-        }}
+        }
         
-        .controls {{
+        .controls {
             background: white;
             padding: 15px;
             border-radius: 10px;
             margin-bottom: 20px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .control-group {{
+        .control-group {
             display: flex;
             gap: 10px;
             align-items: center;
             margin-bottom: 10px;
-        }}
+        }
         
-        .control-group label {{
+        .control-group label {
             font-weight: bold;
             min-width: 100px;
-        }}
+        }
         
-        button {{
+        button {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             border: none;
@@ -282,51 +277,54 @@ class TopologyVisualizer:
             cursor: pointer;
             font-weight: bold;
             transition: all 0.3s ease;
-        }}
+        }
         
-        button:hover {{
+        button:hover {
             transform: translateY(-2px);
             box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }}
+        }
         
-        select {{
+        select {
             padding: 6px 12px;
             border: 1px solid #ddd;
             border-radius: 6px;
             background: white;
-        }}
+        }
         
-        .legend {{
+        .legend {
             background: white;
             padding: 15px;
             border-radius: 10px;
             margin-top: 20px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .legend h3 {{
+        .legend h3 {
             margin-top: 0;
             color: #333;
-        }}
+        }
         
-        .legend-item {{
+        .legend-item {
             display: flex;
             align-items: center;
             margin-bottom: 8px;
-        }}
+        }
         
-        .legend-color {{
+        .legend-color {
             width: 20px;
             height: 20px;
             border-radius: 50%;
             margin-right: 10px;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div class="header">
+"""
+
+# Header, controls and statistics cards; filled in with str.format
+_HTML_SUMMARY = """    <div class="header">
         <h1>Network Topology Visualization</h1>
-        <p>Interactive network diagram with {len(self.devices)} devices and {len(self.links)} connections</p>
+        <p>Interactive network diagram with {n_devices} devices and {n_links} connections</p>
     </div>
     
     <div class="controls">
@@ -347,31 +345,37 @@ class TopologyVisualizer:
             <h2>Network Statistics</h2>
             <div class="stats-grid">
                 <div class="stat-card">
-                    <div class="stat-number">{self.statistics.get('total_devices', 0)}</div>
+                    <div class="stat-number">{total_devices}</div>
                     <div class="stat-label">Total Devices</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">{self.statistics.get('total_links', 0)}</div>
+                    <div class="stat-number">{total_links}</div>
                     <div class="stat-label">Network Links</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">{self.statistics.get('total_subnets', 0)}</div>
+                    <div class="stat-number">{total_subnets}</div>
                     <div class="stat-label">Subnets</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">{len(set(d['device_type'] for d in self.devices))}</div>
+                    <div class="stat-number">{n_types}</div>
                     <div class="stat-label">Device Types</div>
                 </div>
             </div>
             
             <h3>Network Devices</h3>
             <div class="device-list" id="deviceList">
-                {self._generate_device_list_html()}
+                """
+
+# Closes the device list and opens the subnet list
+_HTML_SUBNETS_OPEN = """
             </div>
             
             <h3>Network Subnets</h3>
             <div class="subnet-list">
-                {self._generate_subnet_list_html()}
+                """
+
+# Closes the info panel with the legend and opens the script up to the node data
+_HTML_LEGEND = """
             </div>
             
             <div class="legend">
@@ -412,14 +416,15 @@ class TopologyVisualizer:
 
     <script>
         // Network data
-        const nodes = new vis.DataSet({nodes_data});
-        const edges = new vis.DataSet({edges_data});
-        const deviceDetails = {json.dumps(device_details, indent=2)};
+        const nodes = new vis.DataSet("""
+
+# Ends the device details statement, then the vis.js options, event handlers and helpers
+_HTML_TAIL_JS = """;
         
         // Network options - Simplified for clarity
-        let options = {{
-            layout: {{
-                hierarchical: {{
+        let options = {
+            layout: {
+                hierarchical: {
                     enabled: true,
                     direction: 'UD',
                     sortMethod: 'directed',
@@ -429,167 +434,416 @@ class TopologyVisualizer:
                     blockShifting: true,
                     edgeMinimization: true,
                     parentCentralization: true
-                }}
-            }},
-            physics: {{
+                }
+            },
+            physics: {
                 enabled: false
-            }},
-            nodes: {{
+            },
+            nodes: {
                 shape: 'dot',
                 size: 30,
-                font: {{
+                font: {
                     size: 16,
                     color: '#333333',
                     face: 'Arial Bold'
-                }},
+                },
                 borderWidth: 2,
                 shadow: false,
-                chosen: {{
-                    node: function(values, id, selected, hovering) {{
+                chosen: {
+                    node: function(values, id, selected, hovering) {
                         values.size = 35;
                         values.borderWidth = 3;
-                    }}
-                }}
-            }},
-            edges: {{
+                    }
+                }
+            },
+            edges: {
                 width: 2,
-                color: {{
+                color: {
                     color: '#666666',
                     highlight: '#ff4444',
                     hover: '#ff4444'
-                }},
-                smooth: {{
+                },
+                smooth: {
                     enabled: true,
                     type: 'straightCross',
                     roundness: 0.1
-                }},
-                font: {{
+                },
+                font: {
                     size: 0,  // Hide edge labels by default for cleaner look
                     color: '#666666'
-                }},
+                },
                 shadow: false,
-                arrows: {{
-                    to: {{
+                arrows: {
+                    to: {
                         enabled: false
-                    }}
-                }}
-            }},
-            interaction: {{
+                    }
+                }
+            },
+            interaction: {
                 hover: true,
                 selectConnectedEdges: true,
                 tooltipDelay: 200,
                 hideEdgesOnDrag: true,
                 hideNodesOnDrag: false
-            }}
-        }};
+            }
+        };
         
         // Initialize network
         const container = document.getElementById('topology');
-        const data = {{ nodes: nodes, edges: edges }};
+        const data = { nodes: nodes, edges: edges };
         const network = new vis.Network(container, data, options);
         
         // Event handlers
-        network.on('click', function(params) {{
-            if (params.nodes.length > 0) {{
+        network.on('click', function(params) {
+            if (params.nodes.length > 0) {
                 const nodeId = params.nodes[0];
                 showDeviceDetails(nodeId);
-            }}
-        }});
+            }
+        });
         
-        network.on('hoverNode', function(params) {{
+        network.on('hoverNode', function(params) {
             const nodeId = params.node;
             highlightConnectedNodes(nodeId);
-        }});
+        });
         
-        network.on('blurNode', function(params) {{
+        network.on('blurNode', function(params) {
             resetHighlight();
-        }});
+        });
+        
+        // Edge tooltips are built on first hover rather than embedded for every edge
+        network.on('hoverEdge', function(params) {
+            const edge = edges.get(params.edge);
+            if (edge && edge.title === undefined) {
+                edges.update({ id: edge.id, title: edgeTooltip(edge) });
+            }
+        });
         
         // Functions
-        function showDeviceDetails(nodeId) {{
+        function showDeviceDetails(nodeId) {
             const device = deviceDetails[nodeId];
-            if (device) {{
-                alert(`Device: ${{device.name}}\\n` +
-                      `Type: ${{device.device_type}}\\n` +
-                      `Hostname: ${{device.hostname}}\\n` +
-                      `Interfaces: ${{device.interfaces.length}}\\n` +
-                      `VLANs: ${{Object.keys(device.vlans).length}}`);
-            }}
-        }}
-        
-        function highlightConnectedNodes(nodeId) {{
-            const connectedNodes = network.getConnectedNodes(nodeId);
-            const connectedEdges = network.getConnectedEdges(nodeId);
+            if (device) {
+                alert(`Device: ${device.name}\\n` +
+                      `Type: ${device.device_type}\\n` +
+                      `Hostname: ${device.hostname}\\n` +
+                      `Interfaces: ${device.interfaces.length}\\n` +
+                      `VLANs: ${Object.keys(device.vlans).length}`);
+            }
+        }
+        
+        // Nodes currently drawn with a highlighted border
+        const highlightedNodes = new Set();
+        
+        function highlightConnectedNodes(nodeId) {
+            if (highlightedNodes.size > 0) {
+                resetHighlight();
+            }
             
-            // Highlight connected nodes
-            const updateNodes = nodes.map(node => {{
-                if (node.id === nodeId || connectedNodes.includes(node.id)) {{
-                    return {{ ...node, color: {{ background: node.color.background, border: '#ff4444' }} }};
-                }} else {{
-                    return {{ ...node, color: {{ background: node.color.background, border: '#cccccc' }} }};
-                }}
-            }});
+            // Update only the hovered node and its neighbors
+            const updateNodes = [];
+            for (const id of [nodeId, ...network.getConnectedNodes(nodeId)]) {
+                const node = nodes.get(id);
+                if (node && !highlightedNodes.has(id)) {
+                    highlightedNodes.add(id);
+                    updateNodes.push({ id: id, color: { background: node.color.background, border: '#ff4444' } });
+                }
+            }
             
             nodes.update(updateNodes);
-        }}
-        
-        function resetHighlight() {{
-            const updateNodes = nodes.map(node => {{
-                return {{ ...node, color: {{ background: node.color.background, border: getDeviceColor(node.group).border }} }};
-            }});
+        }
+        
+        function resetHighlight() {
+            const updateNodes = [];
+            for (const id of highlightedNodes) {
+                const node = nodes.get(id);
+                if (node) {
+                    updateNodes.push({ id: id, color: { background: node.color.background, border: getDeviceColor(node.group).border } });
+                }
+            }
+            
+            highlightedNodes.clear();
             nodes.update(updateNodes);
-        }}
+        }
         
-        function focusDevice(deviceId) {{
-            network.focus(deviceId, {{
+        function focusDevice(deviceId) {
+            network.focus(deviceId, {
                 scale: 1.5,
-                animation: {{
+                animation: {
                     duration: 1000,
                     easingFunction: 'easeInOutQuad'
-                }}
-            }});
+                }
+            });
             
             // Highlight the device
             highlightConnectedNodes(deviceId);
             setTimeout(() => resetHighlight(), 3000);
-        }}
+        }
         
-        function fitNetwork() {{
+        function fitNetwork() {
             network.fit();
-        }}
+        }
         
-        function resetZoom() {{
-            network.moveTo({{ scale: 1.0 }});
-        }}
+        function resetZoom() {
+            network.moveTo({ scale: 1.0 });
+        }
         
-        function exportImage() {{
+        function exportImage() {
             const canvas = network.canvas.frame.canvas;
             const link = document.createElement('a');
             link.download = 'network_topology.png';
             link.href = canvas.toDataURL();
             link.click();
-        }}
-        
-        function getDeviceColor(deviceType) {{
-            const colors = {{
-                'router': {{ background: '#ff9800', border: '#f57c00' }},
-                'switch': {{ background: '#4caf50', border: '#388e3c' }},
-                'pc': {{ background: '#2196f3', border: '#1976d2' }},
-                'firewall': {{ background: '#f44336', border: '#d32f2f' }}
-            }};
-            return colors[deviceType] || {{ background: '#9e9e9e', border: '#757575' }};
-        }}
+        }
+        
+        function edgeTooltip(edge) {
+            return `Connection: ${escapeHtml(edge.from)} ↔ ${escapeHtml(edge.to)}<br>` +
+                   `Type: ${escapeHtml(deviceTypeLabel(edge.from))} to ${escapeHtml(deviceTypeLabel(edge.to))}`;
+        }
+        
+        function deviceTypeLabel(nodeId) {
+            const node = nodes.get(nodeId);
+            const deviceType = node ? node.group : 'unknown';
+            return deviceType.charAt(0).toUpperCase() + deviceType.slice(1);
+        }
+        
+        function escapeHtml(text) {
+            const entities = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;' };
+            return String(text).replace(/[&<>"']/g, ch => entities[ch]);
+        }
+        
+        function getDeviceColor(deviceType) {
+            const colors = {
+                'router': { background: '#ff9800', border: '#f57c00' },
+                'switch': { background: '#4caf50', border: '#388e3c' },
+                'pc': { background: '#2196f3', border: '#1976d2' },
+                'firewall': { background: '#f44336', border: '#d32f2f' }
+            };
+            return colors[deviceType] || { background: '#9e9e9e', border: '#757575' };
+        }
         
         // Initialize with fit view
-        setTimeout(() => {{
+        setTimeout(() => {
             network.fit();
-        }}, 1000);
+        }, 1000);
     </script>
 </body>
 </html>
+"""
+
+
+def _pick_fields(item: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Copy only the given keys of a JSON object."""
+    return {key: item[key] for key in fields if key in item}
+
+
+def _summarize_device(device: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Collect the interface and VLAN facts shown in the tooltip and the device list.
+    
+    Args:
+        device: Device dictionary from the topology file
+        
+    Returns:
+        Dictionary with interface/VLAN counts, IP addresses and VLAN keys
+    """
+    interfaces = device.get('interfaces', [])
+    vlans = device.get('vlans', {})
+    return {
+        'n_ifaces': len(interfaces),
+        'n_vlans': len(vlans),
+        'ip_list': [i['ip_address'] for i in interfaces if i.get('ip_address')],
+        'vlan_keys': list(vlans.keys())
+    }
+
+
+def _escape(value: Any) -> str:
+    """Escape a topology value for embedding in HTML markup."""
+    return str(value).translate(_HTML_ESCAPE)
+
+
+def _to_json(data: Any) -> str:
+    """Serialize data compactly for embedding in the page script."""
+    if orjson is not None:
+        text = orjson.dumps(data).decode('utf-8')
+    else:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return text.translate(_SCRIPT_JSON_ESCAPE)
+
+
+class TopologyVisualizer:
+    """Generate interactive HTML network topology visualization."""
+    
+    def __init__(self):
+        """Initialize the visualizer."""
+        self.devices = []
+        self.links = []
+        self.subnets = {}
+        self.statistics = {}
+        self._type_by_name = {}  # device name -> device type
+        self._cache = {}  # artifact name -> page data derived from the loaded topology
+        self._cache_key = None
+        
+    def load_topology(self, topology_file: str) -> bool:
+        """
+        Load topology data from JSON file.
+        
+        Args:
+            topology_file: Path to topology JSON file
+            
+        Returns:
+            bool: True if loaded successfully
+        """
+        try:
+            if ijson is not None:
+                devices, links, subnets, statistics = self._stream_topology(topology_file)
+            else:
+                with open(topology_file, 'r') as f:
+                    topology_data = json.load(f)
+                devices = [_pick_fields(d, _DEVICE_FIELDS) for d in topology_data.get('devices', [])]
+                links = [_pick_fields(l, _LINK_FIELDS) for l in topology_data.get('links', [])]
+                subnets = topology_data.get('subnets', {})
+                statistics = topology_data.get('statistics', {})
+            
+            self.devices = devices
+            self.links = links
+            self.subnets = subnets
+            self.statistics = statistics
+            
+            for device in self.devices:
+                device['_summary'] = _summarize_device(device)
+            
+            # Reversed so the first device with a given name wins, as a linear scan would
+            self._type_by_name = {d['name']: d.get('device_type', 'unknown') for d in reversed(self.devices)}
+            self._cache.clear()
+            
+            logger.info(f"Loaded topology with {len(self.devices)} devices and {len(self.links)} links")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error loading topology file: {e}")
+            return False
+    
+    def _stream_topology(self, topology_file: str) -> Tuple[List, List, Dict, Dict]:
+        """
+        Read the topology sections with ijson in a single pass over the file.
+        
+        Each device and link object is built on its own and trimmed to the fields
+        the visualization reads as soon as it is complete; other top-level keys are skipped.
+        
+        Args:
+            topology_file: Path to topology JSON file
+            
+        Returns:
+            Tuple of (devices, links, subnets, statistics)
+        """
+        devices, links = [], []
+        sections = {'subnets': {}, 'statistics': {}}
+        builder = None
+        
+        with open(topology_file, 'rb') as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is None:
+                    if prefix not in _STREAM_PREFIXES or event in ('map_key', 'end_map', 'end_array'):
+                        continue
+                    builder, target, depth = ijson.ObjectBuilder(), prefix, 0
+                
+                builder.event(event, value)
+                if event in ('start_map', 'start_array'):
+                    depth += 1
+                elif event in ('end_map', 'end_array'):
+                    depth -= 1
+                if depth:
+                    continue
+                
+                if target == 'devices.item':
+                    devices.append(_pick_fields(builder.value, _DEVICE_FIELDS))
+                elif target == 'links.item':
+                    links.append(_pick_fields(builder.value, _LINK_FIELDS))
+                else:
+                    sections[target] = builder.value
+                builder = None
+        
+        return devices, links, sections['subnets'], sections['statistics']
+    
+    def generate_html_visualization(self, output_file: str = "network_topology.html"):
+        """
+        Generate interactive HTML visualization.
+        
+        Args:
+            output_file: Output HTML file path; a .gz suffix writes it gzip-compressed
+        """
+        # Build the whole page first so a failure leaves any previous output untouched
+        parts = self._build_html_parts()
+        
+        if output_file.endswith('.gz'):
+            f = gzip.open(output_file, 'wt', encoding='utf-8', compresslevel=_GZIP_LEVEL)
+        else:
+            f = open(output_file, 'w', encoding='utf-8')
+        
+        with f:
+            f.writelines(parts)
+        
+        logger.info(f"Network topology visualization saved to: {output_file}")
+    
+    def _cached(self, name: str, build: Callable[[], Any]) -> Any:
+        """
+        Return a page artifact, building it only once per loaded topology.
+        
+        Args:
+            name: Artifact name
+            build: Function that builds the artifact
+            
+        Returns:
+            Cached or newly built artifact
+        """
+        # Catch devices, links or subnets replaced after load_topology
+        key = (id(self.devices), len(self.devices), id(self.links), len(self.links),
+               id(self.subnets), len(self.subnets))
+        if key != self._cache_key:
+            self._cache.clear()
+            self._cache_key = key
+        
+        if name not in self._cache:
+            self._cache[name] = build()
+        return self._cache[name]
+    
+    def _build_html_parts(self) -> List[str]:
         """
+        Build the complete HTML page with embedded data.
         
-        return html_template
+        Returns:
+            List[str]: Page fragments in output order
+        """
+        
+        # Prepare data for visualization
+        nodes_data = self._cached('nodes_data', self._prepare_nodes_data)
+        edges_data = self._cached('edges_data', self._prepare_edges_data)
+        device_details = self._cached('device_details', lambda: _to_json(self._prepare_device_details()))
+        
+        # Header and statistics values
+        n_devices = len(self.devices)
+        n_links = len(self.links)
+        n_types = len({d['device_type'] for d in self.devices})
+        total_devices = self.statistics.get('total_devices', 0)
+        total_links = self.statistics.get('total_links', 0)
+        total_subnets = self.statistics.get('total_subnets', 0)
+        
+        return [
+            _HTML_HEAD,
+            _HTML_SUMMARY.format(
+                n_devices=n_devices, n_links=n_links, n_types=n_types,
+                total_devices=total_devices, total_links=total_links, total_subnets=total_subnets
+            ),
+            self._cached('device_list_html', self._generate_device_list_html),
+            _HTML_SUBNETS_OPEN,
+            self._cached('subnet_list_html', self._generate_subnet_list_html),
+            _HTML_LEGEND,
+            nodes_data,
+            ");\n        const edges = new vis.DataSet(",
+            edges_data,
+            ");\n        const deviceDetails = ",
+            device_details,
+            _HTML_TAIL_JS,
+        ]
     
     def _prepare_nodes_data(self) -> str:
         """Prepare nodes data for vis.js network with hierarchical levels."""
@@ -599,31 +853,7 @@ class TopologyVisualizer:
             device_type = device.get('device_type', 'router')
             
             # Determine node color and shape based on device type
-            if device_type == 'router':
-                color = {'background': '#ff9800', 'border': '#f57c00'}
-                shape = 'box'
-                size = 40
-                level = 0  # Top level
-            elif device_type == 'switch':
-                color = {'background': '#4caf50', 'border': '#388e3c'}
-                shape = 'ellipse'
-                size = 35
-                level = 1  # Middle level
-            elif device_type == 'pc':
-                color = {'background': '#2196f3', 'border': '#1976d2'}
-                shape = 'dot'
-                size = 25
-                level = 2  # Bottom level
-            elif device_type == 'firewall':
-                color = {'background': '#f44336', 'border': '#d32f2f'}
-                shape = 'diamond'
-                size = 35
-                level = 0  # Top level
-            else:
-                color = {'background': '#9e9e9e', 'border': '#757575'}
-                shape = 'dot'
-                size = 30
-                level = 1
+            color, shape, size, level = _NODE_STYLES.get(device_type, _DEFAULT_NODE_STYLE)
             
             node = {
                 'id': device['name'],
@@ -634,83 +864,65 @@ class TopologyVisualizer:
                 'size': size,
                 'level': level,
                 'title': self._generate_node_tooltip(device),
-                'font': {'size': 14, 'color': '#333333', 'face': 'Arial Bold'}
+                'font': _NODE_FONT
             }
             
             nodes.append(node)
         
-        return json.dumps(nodes, indent=2)
+        return _to_json(nodes)
     
     def _prepare_edges_data(self) -> str:
         """Prepare edges data for vis.js network - simplified for clarity."""
         edges = []
         
-        # Group links by connection type for cleaner visualization
-        processed_connections = set()
+        # Unique connection identifier per link, independent of link direction
+        connection_keys = [
+            (link['source_device'], link['target_device'])
+            if link['source_device'] < link['target_device']
+            else (link['target_device'], link['source_device'])
+            for link in self.links
+        ]
         
-        for link in self.links:
-            # Create unique connection identifier
-            connection_key = tuple(sorted([link['source_device'], link['target_device']]))
-            
-            # Skip if we've already processed this connection
-            if connection_key in processed_connections:
-                continue
-            
-            processed_connections.add(connection_key)
+        # Only the first link of each connection is drawn; building the dict from the
+        # reversed lists leaves that first link as the value for every key
+        first_links = dict(zip(reversed(connection_keys), reversed(self.links)))
+        
+        # Styling depends only on the endpoint types, so each type pair is resolved once
+        pair_styles = {}
+        
+        for connection_key in dict.fromkeys(connection_keys):
+            link = first_links[connection_key]
             
             # Determine connection type and styling
             source_type = self._get_device_type(link['source_device'])
             target_type = self._get_device_type(link['target_device'])
             
             # Simplified color scheme based on connection hierarchy
-            if source_type == 'router' and target_type == 'router':
-                # Router-to-router (core links)
-                color = '#ff6b35'  # Orange-red
-                width = 4
-                dashes = False
-            elif (source_type == 'router' and target_type == 'switch') or (source_type == 'switch' and target_type == 'router'):
-                # Router-to-switch (distribution links)
-                color = '#4ecdc4'  # Teal
-                width = 3
-                dashes = False
-            elif source_type == 'switch' and target_type == 'pc':
-                # Switch-to-PC (access links)
-                color = '#45b7d1'  # Blue
-                width = 2
-                dashes = False
-            elif source_type == 'pc' and target_type == 'switch':
-                # PC-to-switch (access links)
-                color = '#45b7d1'  # Blue
-                width = 2
-                dashes = False
-            else:
-                # Other connections
-                color = '#96ceb4'  # Light green
-                width = 2
-                dashes = [5, 5]
+            type_pair = (source_type, target_type)
+            style = pair_styles.get(type_pair)
+            if style is None:
+                color, width, dashes = _EDGE_STYLES.get(frozenset(type_pair), _DEFAULT_EDGE_STYLE)
+                style = pair_styles[type_pair] = ({'color': color}, width, dashes)
+            color, width, dashes = style
             
             edge = {
                 'from': link['source_device'],
                 'to': link['target_device'],
                 'width': width,
-                'color': {'color': color},
-                'title': f"Connection: {link['source_device']} ↔ {link['target_device']}<br>Type: {source_type.title()} to {target_type.title()}",
-                'smooth': {'type': 'straightCross', 'roundness': 0.1}
+                'color': color,
+                'smooth': _EDGE_SMOOTH
             }
             
-            if 'dashes' in locals() and dashes:
+            if dashes:
                 edge['dashes'] = dashes
             
             edges.append(edge)
         
-        return json.dumps(edges, indent=2)
+        return _to_json(edges)
     
     def _get_device_type(self, device_name: str) -> str:
         """Get device type by name."""
-        for device in self.devices:
-            if device['name'] == device_name:
-                return device.get('device_type', 'unknown')
-        return 'unknown'
+        return self._type_by_name.get(device_name, 'unknown')
     
     def _prepare_device_details(self) -> Dict[str, Any]:
         """Prepare detailed device information."""
@@ -728,27 +940,29 @@ class TopologyVisualizer:
         
         return details
     
+    def _device_summary(self, device: Dict[str, Any]) -> Dict[str, Any]:
+        """Get a device's summary, building it for devices not set up by load_topology."""
+        summary = device.get('_summary')
+        if summary is None:
+            summary = device['_summary'] = _summarize_device(device)
+        return summary
+    
     def _generate_node_tooltip(self, device: Dict[str, Any]) -> str:
         """Generate tooltip text for a device node."""
-        interfaces = device.get('interfaces', [])
-        vlans = device.get('vlans', {})
+        summary = self._device_summary(device)
         
-        tooltip = f"<b>{device['name']}</b><br>"
-        tooltip += f"Type: {device.get('device_type', 'Unknown')}<br>"
-        tooltip += f"Hostname: {device.get('hostname', 'N/A')}<br>"
-        tooltip += f"Interfaces: {len(interfaces)}<br>"
+        tooltip = f"<b>{_escape(device['name'])}</b><br>"
+        tooltip += f"Type: {_escape(device.get('device_type', 'Unknown'))}<br>"
+        tooltip += f"Hostname: {_escape(device.get('hostname', 'N/A'))}<br>"
+        tooltip += f"Interfaces: {summary['n_ifaces']}<br>"
         
-        if vlans:
-            tooltip += f"VLANs: {', '.join(map(str, vlans.keys()))}<br>"
+        if summary['n_vlans']:
+            tooltip += f"VLANs: {_escape(', '.join(map(str, summary['vlan_keys'])))}<br>"
         
         # Add IP addresses
-        ip_addresses = []
-        for interface in interfaces:
-            if interface.get('ip_address'):
-                ip_addresses.append(interface['ip_address'])
-        
+        ip_addresses = summary['ip_list']
         if ip_addresses:
-            tooltip += f"IPs: {', '.join(ip_addresses[:3])}"
+            tooltip += f"IPs: {_escape(', '.join(ip_addresses[:3]))}"
             if len(ip_addresses) > 3:
                 tooltip += f" (+{len(ip_addresses) - 3} more)"
         
@@ -756,47 +970,43 @@ class TopologyVisualizer:
     
     def _generate_device_list_html(self) -> str:
         """Generate HTML for device list in info panel."""
-        html = ""
-        
-        # Group devices by type
-        device_groups = {}
+        # List devices of one type together, types in order of first appearance
+        type_rank = {}
         for device in self.devices:
-            device_type = device.get('device_type', 'unknown')
-            if device_type not in device_groups:
-                device_groups[device_type] = []
-            device_groups[device_type].append(device)
-        
-        for device_type, devices in device_groups.items():
-            for device in devices:
-                interfaces = device.get('interfaces', [])
-                vlans = device.get('vlans', {})
-                
-                html += f"""
-                <div class="device-item" onclick="focusDevice('{device['name']}')">
-                    <div class="device-name">{device['name']}</div>
+            type_rank.setdefault(device.get('device_type', 'unknown'), len(type_rank))
+        
+        # The sort is stable, so devices keep their file order within a type
+        ordered = sorted(self.devices, key=lambda d: type_rank[d.get('device_type', 'unknown')])
+        return "".join(map(self._generate_device_item_html, ordered))
+    
+    def _generate_device_item_html(self, device: Dict[str, Any]) -> str:
+        """Generate the info panel entry for one device."""
+        name = _escape(device['name'])
+        # The name is a JS string literal inside an HTML attribute: JSON-quote it, then HTML-escape
+        name_arg = _escape(json.dumps(device['name']))
+        device_type = _escape(device.get('device_type', 'unknown'))
+        summary = self._device_summary(device)
+        n_vlans = summary['n_vlans']
+        
+        return f"""
+                <div class="device-item" onclick="focusDevice({name_arg})">
+                    <div class="device-name">{name}</div>
                     <span class="device-type {device_type}">{device_type}</span>
                     <div class="device-interfaces">
-                        <span class="interface-count">{len(interfaces)} interfaces</span>
-                        {f'• {len(vlans)} VLANs' if vlans else ''}
+                        <span class="interface-count">{summary['n_ifaces']} interfaces</span>
+                        {f'• {n_vlans} VLANs' if n_vlans else ''}
                     </div>
                 </div>
                 """
-        
-        return html
     
     def _generate_subnet_list_html(self) -> str:
         """Generate HTML for subnet list in info panel."""
-        html = ""
-        
-        for subnet, devices in self.subnets.items():
-            html += f"""
+        return "".join(f"""
             <div class="subnet-item">
-                <div class="subnet-name">{subnet}</div>
-                <div class="subnet-devices">Devices: {', '.join(devices)}</div>
+                <div class="subnet-name">{_escape(subnet)}</div>
+                <div class="subnet-devices">Devices: {_escape(', '.join(devices))}</div>
             </div>
-            """
-        
-        return html
+            """ for subnet, devices in self.subnets.items())
 
 
 def main():
@@ -806,7 +1016,7 @@ def main():
     parser = argparse.ArgumentParser(description='Generate network topology visualization')
     parser.add_argument('topology_file', help='Path to topology JSON file')
     parser.add_argument('--output', '-o', default='network_topology.html', 
-                       help='Output HTML file (default: network_topology.html)')
+                       help='Output HTML file, gzip-compressed if it ends in .gz (default: network_topology.html)')
     
     args = parser.parse_args()
     